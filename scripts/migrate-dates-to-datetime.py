@@ -11,10 +11,145 @@ Usage:
 """
 
 import argparse
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
+# The date field line within a frontmatter block (matched on raw bytes)
+DATE_RE = re.compile(rb"^date:\s*(.+)$", re.MULTILINE)
+
+
+def _is_plain_date(d: str) -> bool:
+    """True if *d* is a well-formed ``YYYY-MM-DD`` date.
+
+    Slices and compares the string directly instead of round-tripping
+    through ``strptime``/``strftime`` — the value is re-emitted as-is with
+    a fixed time suffix, so no datetime object is needed.
+    """
+    return (
+        len(d) == 10
+        and d[4] == d[7] == "-"
+        and d[:4].isdigit()
+        and d[5:7].isdigit()
+        and d[8:].isdigit()
+        and "01" <= d[5:7] <= "12"
+        and "01" <= d[8:] <= "31"
+    )
+
+
+def _date_line_state(raw: bytes) -> str:
+    """Classify a file from its raw bytes without decoding it.
+
+    Returns ``"none"`` if the frontmatter has no ``date:`` line,
+    ``"datetime"`` if that line already carries a time, and ``"date"``
+    otherwise.  Most of a migrated vault falls into the first two, so
+    those files never reach the UTF-8 decode and regex passes.
+    """
+    fm_end = raw.find(b"\n---", 3)
+    pos = raw.find(b"\ndate:", 0, fm_end)
+    if pos == -1:
+        return "none"
+    eol = raw.find(b"\n", pos + 1)
+    if b"T" in raw[pos + 6 : eol if eol != -1 else len(raw)]:
+        return "datetime"
+    return "date"
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Replace *path* with *data* via a temp file so a crash mid-write
+    never leaves a truncated note behind."""
+    tmp = path.with_name(f".{path.name}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.chmod(tmp, path.stat().st_mode)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def process_file(md_file: Path, vault_root: Path, dry_run: bool) -> tuple[bool, str]:
+    """Migrate the date field of a single note.
+
+    Returns ``(updated, message)`` where *message* is the log line for
+    this file.  Runs in a worker process, so it must not touch shared
+    state — the parent aggregates the counters.
+    """
+    relative_path = md_file.relative_to(vault_root)
+
+    try:
+        raw = md_file.read_bytes()
+    except Exception as e:
+        return False, f"⚠️  Skipped {relative_path}: {e}"
+
+    # Check if file has YAML frontmatter with a date field
+    if not raw.startswith(b"---"):
+        return False, f"⊘ Skipped {relative_path}: No frontmatter"
+
+    # Cheap byte-level checks before decoding the whole file
+    state = _date_line_state(raw)
+    if state == "none":
+        return False, f"⊘ Skipped {relative_path}: No date field"
+    if state == "datetime":
+        return False, f"✓ Already datetime: {relative_path}"
+
+    # Frontmatter must open with its own line and have a closing delimiter
+    fm_end = raw.find(b"\n---", 3)
+    if not raw.startswith(b"---\n") or fm_end == -1:
+        return False, f"⊘ Skipped {relative_path}: Malformed frontmatter"
+
+    # Look for date field — only the short value is ever decoded
+    date_match = DATE_RE.search(raw, 3, fm_end)
+    if not date_match:
+        return False, f"⊘ Skipped {relative_path}: No date field"
+
+    try:
+        old_date_str = date_match.group(1).decode("utf-8").strip()
+    except UnicodeDecodeError as e:
+        return False, f"⚠️  Skipped {relative_path}: {e}"
+
+    # Check if already in ISO 8601 datetime format (contains T)
+    if "T" in old_date_str:
+        return False, f"✓ Already datetime: {relative_path}"
+
+    # Try to parse as YYYY-MM-DD format
+    try:
+        # Handle various date formats
+        if _is_plain_date(old_date_str):
+            # YYYY-MM-DD format — use 09:00:00 as default time
+            new_date_str = f"{old_date_str}T09:00:00"
+        else:
+            # Try ISO format with time
+            try:
+                parsed_date = datetime.fromisoformat(old_date_str)
+                new_date_str = parsed_date.strftime("%Y-%m-%dT%H:%M:%S")
+            except ValueError:
+                return False, (
+                    f"⚠️  Skipped {relative_path}: Unrecognized date"
+                    f" format '{old_date_str}'"
+                )
+
+        # Splice the new date line into the original bytes
+        new_raw = (
+            raw[: date_match.start()]
+            + f"date: {new_date_str}".encode()
+            + raw[date_match.end() :]
+        )
+
+        if dry_run:
+            return True, (
+                f"→ DRY RUN: {relative_path}\n  {old_date_str} → {new_date_str}"
+            )
+
+        _write_atomic(md_file, new_raw)
+        return True, f"✓ Updated {relative_path}: {old_date_str} → {new_date_str}"
+
+    except Exception as e:
+        return False, f"⚠️  Error processing {relative_path}: {e}"
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -40,92 +175,16 @@ def main():
     updated_count = 0
     skipped_count = 0
 
-    for md_file in sorted(md_files):
-        relative_path = md_file.relative_to(vault_root)
-
-        try:
-            content = md_file.read_text(encoding="utf-8")
-        except Exception as e:
-            print(f"⚠️  Skipped {relative_path}: {e}")
-            skipped_count += 1
-            continue
-
-        # Check if file has YAML frontmatter with a date field
-        if not content.startswith("---"):
-            print(f"⊘ Skipped {relative_path}: No frontmatter")
-            skipped_count += 1
-            continue
-
-        # Match frontmatter block
-        fm_match = re.match(r"^(---\n)(.*?)(\n---)", content, re.DOTALL)
-        if not fm_match:
-            print(f"⊘ Skipped {relative_path}: Malformed frontmatter")
-            skipped_count += 1
-            continue
-
-        before, fm_body, after = fm_match.group(1), fm_match.group(2), fm_match.group(3)
-        rest = content[fm_match.end() :]
-
-        # Look for date field
-        date_match = re.search(r"^date:\s*(.+)$", fm_body, re.MULTILINE)
-        if not date_match:
-            print(f"⊘ Skipped {relative_path}: No date field")
-            skipped_count += 1
-            continue
-
-        old_date_str = date_match.group(1).strip()
-
-        # Check if already in ISO 8601 datetime format (contains T)
-        if "T" in old_date_str:
-            print(f"✓ Already datetime: {relative_path}")
-            skipped_count += 1
-            continue
-
-        # Try to parse as YYYY-MM-DD format
-        try:
-            # Handle various date formats
-            if len(old_date_str) == 10 and old_date_str.count("-") == 2:
-                # YYYY-MM-DD format
-                parsed_date = datetime.strptime(old_date_str, "%Y-%m-%d")
-                # Use 09:00:00 as default time for date-only fields
-                new_date_str = parsed_date.strftime("%Y-%m-%dT09:00:00")
+    # Each file is independent, so spread the read/parse/write work across
+    # cores; map() keeps results (and the printed log) in path order.
+    worker = partial(process_file, vault_root=vault_root, dry_run=args.dry_run)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        for updated, message in pool.map(worker, sorted(md_files), chunksize=64):
+            print(message)
+            if updated:
+                updated_count += 1
             else:
-                # Try ISO format with time
-                try:
-                    parsed_date = datetime.fromisoformat(old_date_str)
-                    new_date_str = parsed_date.strftime("%Y-%m-%dT%H:%M:%S")
-                except ValueError:
-                    print(
-                        f"⚠️  Skipped {relative_path}: Unrecognized date"
-                        f" format '{old_date_str}'"
-                    )
-                    skipped_count += 1
-                    continue
-
-            # Replace the date line in frontmatter
-            new_fm = re.sub(
-                r"^date:\s*.+$",
-                f"date: {new_date_str}",
-                fm_body,
-                count=1,
-                flags=re.MULTILINE,
-            )
-
-            new_content = f"{before}{new_fm}{after}{rest}"
-
-            if args.dry_run:
-                print(f"→ DRY RUN: {relative_path}")
-                print(f"  {old_date_str} → {new_date_str}")
-            else:
-                md_file.write_text(new_content, encoding="utf-8")
-                print(f"✓ Updated {relative_path}: {old_date_str} → {new_date_str}")
-
-            updated_count += 1
-
-        except Exception as e:
-            print(f"⚠️  Error processing {relative_path}: {e}")
-            skipped_count += 1
-            continue
+                skipped_count += 1
 
     print("\n" + "=" * 60)
     print("Summary:")
@@ -12,6 +12,8 @@ Usage:
 """
 
 import argparse
+import asyncio
+import atexit
 import json
 import logging
 import os
@@ -19,6 +21,10 @@ import re
 import shutil
 import sys
 import time
+from collections import Counter
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
@@ -51,6 +57,27 @@ BINARY_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".pdf", ".heic"}
 
 MODEL = "gemini-2.5-flash"
 
+# Notes buffered between pipeline stages (read → classify → write)
+PIPELINE_QUEUE_SIZE = 32
+
+# Batch API mode: inline requests per job, and how often to poll a job
+BATCH_API_MAX_REQUESTS = 500
+BATCH_POLL_SECONDS = 30
+BATCH_DONE_STATES = {
+    types.JobState.JOB_STATE_SUCCEEDED,
+    types.JobState.JOB_STATE_FAILED,
+    types.JobState.JOB_STATE_CANCELLED,
+    types.JobState.JOB_STATE_EXPIRED,
+}
+
+# Parallel attachment copies (I/O-bound, independent files)
+COPY_WORKERS = 8
+
+# Concurrent Gemini requests in flight, and the requests-per-minute budget
+# they share (Gemini free tier: 15 RPM for flash — stay just under it)
+DEFAULT_CONCURRENCY = 8
+DEFAULT_RPM = 14
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s %(levelname)s %(message)s",
@@ -62,121 +89,189 @@ logging.basicConfig(
 log = logging.getLogger(__name__)
 
 
+# Patterns used per note, compiled once
+_FENCE_RE = re.compile(r"```json\s*\n(.*?)```", re.DOTALL)
+# Frontmatter up to its first date line (group 1), plus that line
+_FM_DATE_RE = re.compile(
+    r"\A(---\n(?:(?!---).*\n)*?)date:.*(?=\n(?:(?!---).*\n)*?---)", re.MULTILINE
+)
+# Frontmatter body, up to (not including) the closing delimiter
+_FM_BODY_RE = re.compile(r"\A---\n.*?(?=\n---)", re.DOTALL)
+_UNSAFE_RE = re.compile(r'[:/\\?*"<>|]')
+_WS_RE = re.compile(r"\s+")
+_JSON_DECODER = json.JSONDecoder()
+
+# Bounds on the bare-object fallback: only this much of a reply is scanned,
+# and only this many "{" positions are tried before giving up
+JSON_SCAN_MAX_CHARS = 256 * 1024
+JSON_MAX_CANDIDATES = 8
+
+# Structured-output schema for classification replies
+CLASSIFICATION_SCHEMA = types.Schema(
+    type=types.Type.OBJECT,
+    properties={
+        "folder": types.Schema(type=types.Type.STRING, enum=sorted(VALID_CATEGORIES)),
+        "slug": types.Schema(type=types.Type.STRING),
+        "content": types.Schema(type=types.Type.STRING),
+    },
+    required=["folder", "slug", "content"],
+    property_ordering=["folder", "slug", "content"],
+)
+
 MIGRATE_PROMPT_FILE = Path(__file__).parent / "migrate_prompt.md"
 SYSTEM_PROMPT = MIGRATE_PROMPT_FILE.read_text(encoding="utf-8")
 
 
 def _extract_json(text: str) -> dict | None:
-    """Extract JSON from a Gemini response using fenced blocks or brace balancing."""
+    """Extract JSON from a Gemini response using fenced blocks or raw_decode."""
     # Strategy 1: fenced code block
-    fence_match = re.search(r"```json\s*\n(.*?)```", text, re.DOTALL)
+    fence_match = _FENCE_RE.search(text)
     if fence_match:
         try:
             return json.loads(fence_match.group(1).strip())
         except json.JSONDecodeError:
             pass
 
-    # Strategy 2: balanced brace matching
-    start = text.find("{")
-    if start == -1:
-        return None
-
-    depth = 0
-    in_string = False
-    escape = False
+    # Strategy 2: decode from each "{" in turn (C parser, not a Python scan)
+    if len(text) > JSON_SCAN_MAX_CHARS:
+        log.warning(
+            "Gemini reply is %d chars, scanning only the first %d for JSON",
+            len(text),
+            JSON_SCAN_MAX_CHARS,
+        )
+        text = text[:JSON_SCAN_MAX_CHARS]
 
-    for i, ch in enumerate(text[start:], start):
-        if escape:
-            escape = False
-            continue
-        if ch == "\\":
-            escape = True
-            continue
-        if ch == '"':
-            in_string = not in_string
-            continue
-        if in_string:
-            continue
-        if ch == "{":
-            depth += 1
-        elif ch == "}":
-            depth -= 1
-            if depth == 0:
-                try:
-                    return json.loads(text[start : i + 1])
-                except json.JSONDecodeError:
-                    return None
+    start = text.find("{")
+    for _ in range(JSON_MAX_CANDIDATES):
+        if start == -1:
+            break
+        try:
+            data, _end = _JSON_DECODER.raw_decode(text, start)
+            return data
+        except json.JSONDecodeError:
+            start = text.find("{", start + 1)
     return None
 
 
-def get_md_files(vault: Path) -> list[Path]:
-    """Collect all markdown files to migrate, skipping excluded paths."""
-    files = []
-    for f in sorted(vault.rglob("*.md")):
-        rel = f.relative_to(vault)
-        parts = rel.parts
+def scan_vault(vault: Path) -> tuple[list[Path], list[Path]]:
+    """Collect markdown files to migrate and binary attachments to copy.
 
+    One ``os.walk`` pass classifies every file by suffix, and excluded
+    directories are pruned so their subtrees are never descended.
+    """
+    md_files = []
+    bin_files = []
+    for root, dirs, files in os.walk(vault):
         # Skip excluded directories
-        if any(skip in parts for skip in SKIP_PATTERNS):
-            continue
+        dirs[:] = [d for d in dirs if d not in SKIP_PATTERNS]
 
-        # Skip excalidraw files
-        if f.name.endswith(".excalidraw.md"):
-            continue
+        for name in files:
+            ext = os.path.splitext(name)[1]
+            if ext == ".md":
+                # Skip excalidraw files and _Readme files
+                if name.endswith(".excalidraw.md") or name == "_Readme.md":
+                    continue
+                md_files.append(Path(root, name))
+            elif ext in BINARY_EXTENSIONS:
+                bin_files.append(Path(root, name))
 
-        # Skip _Readme files
-        if f.name == "_Readme.md":
-            continue
+    md_files.sort()
+    return md_files, bin_files
 
-        files.append(f)
-    return files
 
+# Progress is checkpointed every this many updates, and at exit
+PROGRESS_FLUSH_EVERY = 10
+_unsaved_updates = 0
 
-def get_binary_files(vault: Path) -> list[Path]:
-    """Collect all binary attachment files to copy."""
-    files = []
-    for ext in BINARY_EXTENSIONS:
-        for f in vault.rglob(f"*{ext}"):
-            rel = f.relative_to(vault)
-            parts = rel.parts
-            if any(skip in parts for skip in SKIP_PATTERNS):
-                continue
-            files.append(f)
-    return files
+
+@dataclass
+class Progress:
+    """Migration checkpoint: which old-vault paths have been handled."""
+
+    completed: set[str] = field(default_factory=set)
+    failed: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
 
 
-def load_progress() -> dict:
+def load_progress() -> Progress:
     """Load migration progress from disk."""
     if PROGRESS_FILE.exists():
-        return json.loads(PROGRESS_FILE.read_text())
-    return {"completed": [], "failed": [], "skipped": []}
+        data = json.loads(PROGRESS_FILE.read_text())
+        return Progress(
+            completed=set(data["completed"]),
+            failed=data["failed"],
+            skipped=data["skipped"],
+        )
+    return Progress()
+
+
+def save_progress(progress: Progress):
+    """Save migration progress to disk (atomically, via a temp file)."""
+    global _unsaved_updates
+    data = {
+        "completed": sorted(progress.completed),
+        "failed": progress.failed,
+        "skipped": progress.skipped,
+    }
+    tmp = PROGRESS_FILE.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data, indent=2))
+    os.replace(tmp, PROGRESS_FILE)
+    _unsaved_updates = 0
+
+
+def checkpoint_progress(progress: Progress):
+    """Record one progress update, saving every PROGRESS_FLUSH_EVERY updates.
+
+    Rewriting the whole file after every note is O(N²) bytes over a run.
+    Pending updates are flushed at exit (including Ctrl-C), so only a hard
+    kill can lose them — and those few notes are re-migrated on --resume.
+    """
+    global _unsaved_updates
+    _unsaved_updates += 1
+    if _unsaved_updates >= PROGRESS_FLUSH_EVERY:
+        save_progress(progress)
 
 
-def save_progress(progress: dict):
-    """Save migration progress to disk."""
-    PROGRESS_FILE.write_text(json.dumps(progress, indent=2))
+def flush_progress(progress: Progress):
+    """Save any updates not yet written (registered to run at exit)."""
+    if _unsaved_updates:
+        save_progress(progress)
 
 
 def make_safe_filename(slug: str) -> str:
     """Make a filesystem-safe filename from a slug."""
     # Remove unsafe characters
-    safe = re.sub(r'[:/\\?*"<>|]', "", slug)
+    safe = _UNSAFE_RE.sub("", slug)
     # Collapse multiple spaces
-    safe = re.sub(r"\s+", " ", safe).strip()
+    safe = _WS_RE.sub(" ", safe).strip()
     # Truncate if too long
     if len(safe) > 100:
         safe = safe[:100].strip()
     return safe
 
 
-def classify_with_gemini(
-    client: genai.Client,
-    content: str,
-    original_path: str,
-    file_date: str,
-) -> dict | None:
-    """Send content to Gemini for classification and get structured output."""
+class RateLimiter:
+    """Spaces request starts evenly to stay under a requests-per-minute cap."""
+
+    def __init__(self, rpm: int):
+        self.interval = 60.0 / rpm if rpm > 0 else 0.0
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self):
+        """Sleep until this caller's slot in the request schedule."""
+        async with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        if start > now:
+            await asyncio.sleep(start - now)
 
+
+def _classify_request(
+    content: str, original_path: str, file_date: str
+) -> tuple[list[types.Content], types.GenerateContentConfig]:
+    """Build the contents and config for one classification request."""
     user_prompt = f"""Classify and convert this note from an old Obsidian vault.
 
 **Original path in vault:** {original_path}
@@ -185,81 +280,154 @@ def classify_with_gemini(
 **Content:**
 {content}
 """
+    contents = [
+        types.Content(
+            role="user",
+            parts=[types.Part.from_text(text=user_prompt)],
+        )
+    ]
+    config = types.GenerateContentConfig(
+        system_instruction=SYSTEM_PROMPT,
+        temperature=0.2,
+        response_mime_type="application/json",
+        response_schema=CLASSIFICATION_SCHEMA,
+    )
+    return contents, config
+
+
+def _parse_classification(text: str, original_path: str) -> dict | None:
+    """Validate a classification reply; None if it lacks the required keys.
+
+    Replies are constrained to CLASSIFICATION_SCHEMA, so a plain
+    ``json.loads`` normally succeeds; ``_extract_json`` remains as the
+    fallback for anything unexpected.
+    """
+    try:
+        result = json.loads(text)
+    except json.JSONDecodeError:
+        result = _extract_json(text)
+    if not isinstance(result, dict):
+        return None
+    if not (result and "folder" in result and "slug" in result and "content" in result):
+        return None
+
+    # Validate category
+    if result["folder"] not in VALID_CATEGORIES:
+        log.warning(
+            "Invalid category %r for %s, using Inbox",
+            result["folder"],
+            original_path,
+        )
+        result["folder"] = "Inbox"
+    return result
+
+
+async def classify_with_gemini(
+    client: genai.Client,
+    content: str,
+    original_path: str,
+    file_date: str,
+    limiter: RateLimiter,
+) -> dict | None:
+    """Send content to Gemini for classification and get structured output."""
+    # Built once: retries resend the same request
+    contents, config = _classify_request(content, original_path, file_date)
+    generate = client.aio.models.generate_content
 
     for attempt in range(3):
+        await limiter.wait()
         try:
-            response = client.models.generate_content(
+            response = await generate(
                 model=MODEL,
-                contents=[
-                    types.Content(
-                        role="user",
-                        parts=[types.Part.from_text(text=user_prompt)],
-                    )
-                ],
-                config=types.GenerateContentConfig(
-                    system_instruction=SYSTEM_PROMPT,
-                    temperature=0.2,
-                ),
+                contents=contents,
+                config=config,
             )
 
             if not response.text:
                 log.warning("Empty response from Gemini for %s", original_path)
                 return None
 
-            result = _extract_json(response.text)
-            if (
-                result
-                and "folder" in result
-                and "slug" in result
-                and "content" in result
-            ):
-                # Validate category
-                if result["folder"] not in VALID_CATEGORIES:
-                    log.warning(
-                        "Invalid category %r for %s, using Inbox",
-                        result["folder"],
-                        original_path,
-                    )
-                    result["folder"] = "Inbox"
-                return result
-
-            log.warning(
-                "Failed to parse JSON from Gemini response for %s (attempt %d)",
-                original_path,
-                attempt + 1,
-            )
-            if attempt < 2:
-                time.sleep(2)
+            # Schema-constrained output: a bad reply is not worth retrying
+            result = _parse_classification(response.text, original_path)
+            if result is None:
+                log.warning("Unusable JSON from Gemini for %s", original_path)
+            return result
 
         except Exception as e:
             log.error("Gemini API error for %s: %s", original_path, e)
             if attempt < 2:
                 wait = 5 * (attempt + 1)
                 log.info("Retrying in %ds...", wait)
-                time.sleep(wait)
+                await asyncio.sleep(wait)
 
     return None
 
 
+def classify_with_batch_api(
+    client: genai.Client,
+    pending: list[tuple[str, str, str]],
+) -> Iterator[tuple[str, str, dict | None]]:
+    """Classify notes through the Gemini Batch API.
+
+    Requests are submitted inline in jobs of BATCH_API_MAX_REQUESTS, each
+    polled until it finishes.  Yields ``(rel_path, file_date, result)``
+    in input order; *result* is None for any request that failed.
+    Batch jobs are billed at a discount and are not subject to the
+    interactive RPM limit, at the cost of minutes-to-hours of latency.
+    """
+    for first in range(0, len(pending), BATCH_API_MAX_REQUESTS):
+        chunk = pending[first : first + BATCH_API_MAX_REQUESTS]
+        requests = []
+        for rel_path, content, file_date in chunk:
+            contents, config = _classify_request(content, rel_path, file_date)
+            requests.append(
+                types.InlinedRequest(
+                    contents=contents, config=config, metadata={"path": rel_path}
+                )
+            )
+
+        job = client.batches.create(
+            model=MODEL,
+            src=requests,
+            config=types.CreateBatchJobConfig(
+                display_name=f"migrate-vault-{first // BATCH_API_MAX_REQUESTS}"
+            ),
+        )
+        log.info("Submitted batch job %s (%d notes)", job.name, len(chunk))
+
+        while job.state not in BATCH_DONE_STATES:
+            time.sleep(BATCH_POLL_SECONDS)
+            job = client.batches.get(name=job.name or "")
+            log.info("Batch job %s: %s", job.name, job.state)
+
+        responses = []
+        if job.state == types.JobState.JOB_STATE_SUCCEEDED and job.dest:
+            responses = job.dest.inlined_responses or []
+        else:
+            log.error("Batch job %s ended as %s: %s", job.name, job.state, job.error)
+
+        for i, (rel_path, _content, file_date) in enumerate(chunk):
+            reply = responses[i] if i < len(responses) else None
+            text = reply.response.text if reply and reply.response else None
+            if reply and reply.error:
+                log.error("Batch request failed for %s: %s", rel_path, reply.error)
+            yield rel_path, file_date, _parse_classification(text or "", rel_path)
+
+
 def _force_frontmatter_date(content: str, file_date: str) -> str:
     """Override the date field in YAML frontmatter with the original file's
     mtime in ISO 8601 datetime format."""
-    # Match the frontmatter block
-    fm_match = re.match(r"^(---\n)(.*?)(\n---)", content, re.DOTALL)
-    if not fm_match:
-        return content
-    before, fm_body, after = fm_match.group(1), fm_match.group(2), fm_match.group(3)
-    rest = content[fm_match.end() :]
-
-    # Replace existing date line, or append one
-    if re.search(r"^date:\s*.*$", fm_body, re.MULTILINE):
-        fm_body = re.sub(
-            r"^date:\s*.*$", f"date: {file_date}", fm_body, count=1, flags=re.MULTILINE
-        )
-    else:
-        fm_body += f"\ndate: {file_date}"
+    # Replace an existing date line within the frontmatter in one pass
+    new_content, n = _FM_DATE_RE.subn(
+        lambda m: f"{m.group(1)}date: {file_date}", content, count=1
+    )
+    if n:
+        return new_content
 
-    return f"{before}{fm_body}{after}{rest}"
+    # No date line: append one at the end of the frontmatter (if any)
+    return _FM_BODY_RE.sub(
+        lambda m: f"{m.group(0)}\ndate: {file_date}", content, count=1
+    )
 
 
 def write_note(
@@ -270,106 +438,109 @@ def write_note(
     dest_dir = NEW_VAULT / folder
     dest_file = dest_dir / f"{safe_name}.md"
 
-    # Handle duplicates by appending a number
-    counter = 1
-    while dest_file.exists():
-        dest_file = dest_dir / f"{safe_name} ({counter}).md"
-        counter += 1
-
     if dry_run:
+        # Handle duplicates by appending a number
+        counter = 1
+        while dest_file.exists():
+            dest_file = dest_dir / f"{safe_name} ({counter}).md"
+            counter += 1
         log.info("[DRY RUN] Would write: %s", dest_file)
         return dest_file
 
     dest_dir.mkdir(parents=True, exist_ok=True)
-    dest_file.write_text(content, encoding="utf-8")
+
+    # Exclusive create: one open per candidate name instead of a stat
+    # probe plus a write, and never clobbers a note written meanwhile
+    counter = 0
+    while True:
+        try:
+            with open(dest_file, "x", encoding="utf-8") as f:
+                f.write(content)
+            break
+        except FileExistsError:
+            counter += 1
+            dest_file = dest_dir / f"{safe_name} ({counter}).md"
+
     log.info("Wrote: %s", dest_file)
     return dest_file
 
 
-def copy_binary_files(vault: Path, dry_run: bool = False) -> int:
-    """Copy binary attachment files to the new vault's Attachments folder."""
-    binaries = get_binary_files(vault)
-    copied = 0
+def _copy_attachment(src: Path, dest: Path, src_stat: os.stat_result) -> None:
+    """Copy one attachment, carrying over its timestamps."""
+    # copyfile takes the kernel sendfile fast path; only the timestamps
+    # are worth carrying over, from the stat taken while planning
+    shutil.copyfile(src, dest)
+    os.utime(dest, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+    log.info("Copied attachment: %s -> %s", src.name, dest.name)
+
+
+def copy_binary_files(binaries: list[Path], dry_run: bool = False) -> int:
+    """Copy binary attachment files to the new vault's Attachments folder.
+
+    Destination names are chosen serially (duplicate detection and
+    renaming), then the copies run on a thread pool so reads and writes
+    of independent files overlap.
+    """
+    plan: list[tuple[Path, Path, os.stat_result]] = []
+    # destinations planned in this run -> size of the file headed there,
+    # standing in for the copies that have not been made yet
+    claimed: dict[Path, int] = {}
 
     for src in binaries:
+        src_stat = src.stat()
         dest = ATTACHMENTS_DIR / src.name
 
         # Handle duplicates
-        if dest.exists():
+        dest_size = claimed.get(dest)
+        if dest_size is None:
+            try:
+                dest_size = dest.stat().st_size
+            except FileNotFoundError:
+                pass
+        if dest_size is not None:
             # Skip if identical size
-            if dest.stat().st_size == src.stat().st_size:
+            if dest_size == src_stat.st_size:
                 log.debug("Skipping duplicate: %s", src.name)
                 continue
             # Rename with number
             stem = dest.stem
             ext = dest.suffix
             counter = 1
-            while dest.exists():
+            while dest in claimed or dest.exists():
                 dest = ATTACHMENTS_DIR / f"{stem} ({counter}){ext}"
                 counter += 1
 
-        if dry_run:
-            log.info("[DRY RUN] Would copy: %s -> %s", src, dest)
-        else:
-            ATTACHMENTS_DIR.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(src, dest)
-            log.info("Copied attachment: %s -> %s", src.name, dest.name)
-        copied += 1
-
-    return copied
-
-
-def main():
-    parser = argparse.ArgumentParser(description="Migrate old vault to 2ndBrain")
-    parser.add_argument(
-        "--dry-run", action="store_true", help="Show what would be done without writing"
-    )
-    parser.add_argument(
-        "--resume", action="store_true", help="Resume from last progress checkpoint"
-    )
-    parser.add_argument(
-        "--batch-size",
-        type=int,
-        default=0,
-        help="Process only N files then stop (0=all)",
-    )
-    args = parser.parse_args()
-
-    api_key = os.environ.get("GEMINI_API_KEY")
-    if not api_key:
-        log.error("GEMINI_API_KEY not set")
-        sys.exit(1)
+        claimed[dest] = src_stat.st_size
+        plan.append((src, dest, src_stat))
 
-    client = genai.Client(api_key=api_key)
+    if dry_run:
+        for src, dest, _ in plan:
+            log.info("[DRY RUN] Would copy: %s -> %s", src, dest)
+        return len(plan)
 
-    # Get files to process
-    md_files = get_md_files(OLD_VAULT)
-    log.info("Found %d markdown files to process", len(md_files))
+    if plan:
+        ATTACHMENTS_DIR.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=COPY_WORKERS) as pool:
+            list(pool.map(lambda job: _copy_attachment(*job), plan))
 
-    # Load progress
-    progress = (
-        load_progress()
-        if args.resume
-        else {"completed": [], "failed": [], "skipped": []}
-    )
-    completed_set = set(progress["completed"])
+    return len(plan)
 
-    # Copy binary attachments first
-    log.info("=== Copying binary attachments ===")
-    n_copied = copy_binary_files(OLD_VAULT, dry_run=args.dry_run)
-    log.info("Copied %d binary attachments", n_copied)
 
-    # Process markdown files
-    log.info("=== Processing markdown files ===")
-    processed = 0
-    succeeded = 0
-    failed = 0
+def _admit_notes(
+    md_files: list[Path], progress: Progress, batch_size: int, counts: Counter
+) -> Iterator[tuple[str, str, str]]:
+    """Read and filter notes, yielding ``(rel_path, content, file_date)``.
 
-    for i, md_file in enumerate(md_files):
+    Already-completed, unreadable and near-empty files are recorded in
+    *progress* and not yielded; read failures are counted in
+    ``counts["failed"]``.  Stops after *batch_size* notes (0 = all).
+    """
+    admitted = 0
+    for md_file in md_files:
         rel_path = str(md_file.relative_to(OLD_VAULT))
 
         # Skip already done
-        if rel_path in completed_set:
+        if rel_path in progress.completed:
             log.debug("Skipping (already done): %s", rel_path)
             continue
 
@@ -378,17 +549,17 @@ def main():
             content = md_file.read_text(encoding="utf-8")
         except Exception as e:
             log.error("Failed to read %s: %s", rel_path, e)
-            progress["failed"].append(rel_path)
-            save_progress(progress)
-            failed += 1
+            progress.failed.append(rel_path)
+            checkpoint_progress(progress)
+            counts["failed"] += 1
             continue
 
         # Skip very short / empty files
         stripped = content.strip()
         if len(stripped) < 10:
             log.info("Skipping near-empty file: %s", rel_path)
-            progress["skipped"].append(rel_path)
-            save_progress(progress)
+            progress.skipped.append(rel_path)
+            checkpoint_progress(progress)
             continue
 
         # Get file modification date in ISO 8601 datetime format
@@ -398,63 +569,213 @@ def main():
         except Exception:
             file_date = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
 
-        log.info("[%d/%d] Processing: %s", i + 1, len(md_files), rel_path)
+        yield rel_path, content, file_date
 
-        # Classify with Gemini
-        result = classify_with_gemini(client, content, rel_path, file_date)
+        admitted += 1
+        if batch_size and admitted >= batch_size:
+            log.info("Batch limit reached (%d files)", batch_size)
+            return
 
-        if result is None:
-            log.error("Classification failed for: %s", rel_path)
-            progress["failed"].append(rel_path)
-            save_progress(progress)
-            failed += 1
-            continue
 
-        # Force the date in frontmatter to the original file's mtime
-        result["content"] = _force_frontmatter_date(result["content"], file_date)
+async def _run_pipeline(
+    client: genai.Client,
+    md_files: list[Path],
+    progress: Progress,
+    args: argparse.Namespace,
+    counts: Counter,
+) -> None:
+    """Stream notes through read → classify → write stages.
+
+    A reader feeds ``read_q``, ``args.concurrency`` classifier tasks call
+    Gemini (sharing the RPM limiter) and a single writer drains
+    ``write_q``, writing notes and checkpointing progress.  The bounded
+    queues keep reading just ahead of classification, so disk work
+    overlaps the Gemini calls.  Notes are small local files, so reads and
+    writes stay on the event loop thread — which also means progress is
+    only ever touched from one thread.
+    """
+    read_q: asyncio.Queue[tuple[str, str, str] | None] = asyncio.Queue(
+        PIPELINE_QUEUE_SIZE
+    )
+    write_q: asyncio.Queue[tuple[str, str, dict | None] | None] = asyncio.Queue(
+        PIPELINE_QUEUE_SIZE
+    )
+    limiter = RateLimiter(args.rpm)
+
+    async def reader():
+        for item in _admit_notes(md_files, progress, args.batch_size, counts):
+            await read_q.put(item)
+        for _ in range(args.concurrency):
+            await read_q.put(None)
+
+    async def classifier():
+        while (item := await read_q.get()) is not None:
+            rel_path, content, file_date = item
+            counts["started"] += 1
+            log.info("[%d] Processing: %s", counts["started"], rel_path)
+            result = await classify_with_gemini(
+                client, content, rel_path, file_date, limiter
+            )
+            await write_q.put((rel_path, file_date, result))
+
+    async def writer():
+        while (item := await write_q.get()) is not None:
+            rel_path, file_date, result = item
+            # Never raises, so the queue keeps draining and the
+            # classifiers do not block on write_q
+            ok = _record_or_fail(rel_path, file_date, result, progress, args.dry_run)
+            counts["processed"] += result is not None
+            counts["succeeded"] += ok
+            counts["failed"] += not ok
+
+    writer_task = asyncio.create_task(writer())
+    await asyncio.gather(reader(), *(classifier() for _ in range(args.concurrency)))
+    await write_q.put(None)
+    await writer_task
+
+
+def _record_result(
+    rel_path: str,
+    file_date: str,
+    result: dict | None,
+    progress: Progress,
+    dry_run: bool,
+) -> bool:
+    """Write one classified note and checkpoint it; True on success."""
+    if result is None:
+        log.error("Classification failed for: %s", rel_path)
+        progress.failed.append(rel_path)
+        checkpoint_progress(progress)
+        return False
+
+    # Force the date in frontmatter to the original file's mtime
+    result["content"] = _force_frontmatter_date(result["content"], file_date)
+
+    # Write the note
+    dest = write_note(
+        result["folder"],
+        result["slug"],
+        result["content"],
+        dry_run=dry_run,
+    )
 
-        # Write the note
-        dest = write_note(
-            result["folder"],
-            result["slug"],
-            result["content"],
-            dry_run=args.dry_run,
-        )
+    if dest:
+        progress.completed.add(rel_path)
+    else:
+        progress.failed.append(rel_path)
+    checkpoint_progress(progress)
+    return dest is not None
 
-        if dest:
-            progress["completed"].append(rel_path)
-            succeeded += 1
-        else:
-            progress["failed"].append(rel_path)
-            failed += 1
 
-        save_progress(progress)
-        processed += 1
+def _record_or_fail(
+    rel_path: str,
+    file_date: str,
+    result: dict | None,
+    progress: Progress,
+    dry_run: bool,
+) -> bool:
+    """``_record_result``, recording a write error as a failed note."""
+    try:
+        return _record_result(rel_path, file_date, result, progress, dry_run)
+    except OSError as e:
+        log.error("Failed to write note for %s: %s", rel_path, e)
+        progress.failed.append(rel_path)
+        checkpoint_progress(progress)
+        return False
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
-        # Rate limiting — Gemini free tier: 15 RPM for flash
-        # Be conservative: ~2 seconds between requests
-        time.sleep(2)
 
-        if args.batch_size and processed >= args.batch_size:
-            log.info("Batch limit reached (%d files)", args.batch_size)
-            break
+def main():
+    parser = argparse.ArgumentParser(description="Migrate old vault to 2ndBrain")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Show what would be done without writing"
+    )
+    parser.add_argument(
+        "--resume", action="store_true", help="Resume from last progress checkpoint"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=0,
+        help="Process only N files then stop (0=all)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=DEFAULT_CONCURRENCY,
+        help="Gemini requests in flight at once",
+    )
+    parser.add_argument(
+        "--rpm",
+        type=int,
+        default=DEFAULT_RPM,
+        help="Gemini requests per minute across all workers (0=unlimited)",
+    )
+    parser.add_argument(
+        "--batch-api",
+        action="store_true",
+        help="Classify via the Gemini Batch API (cheaper, but slow to return)",
+    )
+    args = parser.parse_args()
+
+    api_key = os.environ.get("GEMINI_API_KEY")
+    if not api_key:
+        log.error("GEMINI_API_KEY not set")
+        sys.exit(1)
+
+    client = genai.Client(api_key=api_key)
+
+    # Get files to process
+    md_files, bin_files = scan_vault(OLD_VAULT)
+    log.info("Found %d markdown files to process", len(md_files))
+
+    # Load progress
+    progress = load_progress() if args.resume else Progress()
+    # Runs on normal exit and on Ctrl-C (KeyboardInterrupt) alike
+    atexit.register(flush_progress, progress)
+
+    # Copy binary attachments first
+    log.info("=== Copying binary attachments ===")
+    n_copied = copy_binary_files(bin_files, dry_run=args.dry_run)
+    log.info("Copied %d binary attachments", n_copied)
+
+    log.info("=== Processing markdown files ===")
+    counts: Counter = Counter()
+
+    if args.batch_api:
+        # Batch jobs need every request up front
+        pending = list(_admit_notes(md_files, progress, args.batch_size, counts))
+        for rel_path, file_date, result in classify_with_batch_api(client, pending):
+            ok = _record_or_fail(rel_path, file_date, result, progress, args.dry_run)
+            counts["processed"] += result is not None
+            counts["succeeded"] += ok
+            counts["failed"] += not ok
+    else:
+        asyncio.run(_run_pipeline(client, md_files, progress, args, counts))
 
     # Summary
     log.info("=" * 60)
     log.info("Migration complete!")
-    log.info("  Processed: %d", processed)
-    log.info("  Succeeded: %d", succeeded)
-    log.info("  Failed:    %d", failed)
-    log.info("  Skipped:   %d", len(progress["skipped"]))
+    log.info("  Processed: %d", counts["processed"])
+    log.info("  Succeeded: %d", counts["succeeded"])
+    log.info("  Failed:    %d", counts["failed"])
+    log.info("  Skipped:   %d", len(progress.skipped))
     log.info(
         "  Total completed (all runs): %d / %d",
-        len(progress["completed"]),
+        len(progress.completed),
         len(md_files),
     )
 
-    if progress["failed"]:
+    if progress.failed:
         log.warning("Failed files:")
-        for f in progress["failed"]:
+        for f in progress.failed:
             log.warning("  - %s", f)
 
 
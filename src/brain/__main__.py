@@ -5,7 +5,6 @@ from collections.abc import Sequence
 from pathlib import Path
 
 from . import __version__
-from .app import main as run_app
 
 __all__ = ["main"]
 
@@ -60,6 +59,12 @@ def main(args: Sequence[str] | None = None) -> None:
         action="store_true",
         help="Use Gemini AI to re-evaluate categories and tags",
     )
+    mig.add_argument(
+        "--rpm",
+        type=int,
+        default=None,
+        help="Gemini requests per minute for --reclassify (0=unlimited)",
+    )
     mig.add_argument(
         "--all",
         action="store_true",
@@ -71,7 +76,11 @@ def main(args: Sequence[str] | None = None) -> None:
     if parsed.command == "migrate":
         _run_migrate(parsed)
     else:
-        # Default: start the Slack listener (both "run" and no subcommand)
+        # Default: start the Slack listener (both "run" and no subcommand).
+        # Imported here so --version, --help and migrate don't pay for
+        # loading the Slack and Gemini SDKs.
+        from .app import main as run_app
+
         run_app()
 
 
@@ -81,7 +90,8 @@ def _run_migrate(parsed) -> None:
 
     from dotenv import load_dotenv
 
-    from .migrate import run_migration
+    from .migrate import RECLASSIFY_RPM, run_migration
+    from .vault import DEFAULT_VAULT_PATH
 
     logging.basicConfig(
         level=logging.INFO,
@@ -90,9 +100,7 @@ def _run_migrate(parsed) -> None:
 
     load_dotenv()
 
-    vault_path = parsed.vault or (
-        Path.home() / "Documents" / "2ndBrain" / "2ndBrainVault"
-    )
+    vault_path = parsed.vault or DEFAULT_VAULT_PATH
 
     if not vault_path.exists():
         logging.critical("Vault not found at %s", vault_path)
@@ -106,6 +114,7 @@ def _run_migrate(parsed) -> None:
         update_links=do_all or parsed.update_links,
         reclassify=parsed.reclassify,
         dry_run=parsed.dry_run,
+        rpm=RECLASSIFY_RPM if parsed.rpm is None else parsed.rpm,
     )
 
 
@@ -7,11 +7,15 @@ passes MessageContext to each agent's handle() method.
 
 from __future__ import annotations
 
+import functools
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from google import genai
+
 if TYPE_CHECKING:
     from ..vault import Vault
 
@@ -28,6 +32,15 @@ class MessageContext:
     """Prior messages in this Slack thread (oldest first).
     Each dict has keys: role ('user' | 'assistant'), text (str)."""
 
+    @functools.cached_property
+    def formatted_thread(self) -> str:
+        """``thread_history`` as a prompt section (see format_thread_history).
+
+        Computed once per message; the router and the handling agent
+        both include it in their prompts.
+        """
+        return format_thread_history(self.thread_history)
+
 
 @dataclass
 class AgentResult:
@@ -91,3 +104,28 @@ def format_thread_history(thread_history: list[dict]) -> str:
         lines.append(f"**{label}:** {msg['text']}")
     lines.append("")  # trailing newline
     return "\n".join(lines)
+
+
+@functools.lru_cache(maxsize=1)
+def gemini_client() -> genai.Client:
+    """The Gemini client shared by the router and all agents.
+
+    The client is thread-safe, so one instance (and its connection pool)
+    serves every listener thread.  Created on first use, reading
+    ``GEMINI_API_KEY`` from the environment.
+    """
+    return genai.Client()
+
+
+@functools.lru_cache(maxsize=1)
+def _format_minute(minute: int) -> str:
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(minute * 60))
+
+
+def current_minute() -> str:
+    """Local time as ``YYYY-MM-DD HH:MM`` for prompt headers.
+
+    Formatted once per wall-clock minute; messages arriving within the
+    same minute reuse the string.
+    """
+    return _format_minute(int(time.time() // 60))
@@ -6,17 +6,38 @@ filed into the correct Obsidian vault category with full YAML frontmatter.
 """
 
 import logging
-from datetime import datetime
+import re
+import time
 from pathlib import Path
 
-from google import genai
-
-from ..processor import _extract_json, _inject_tokens
-from .base import AgentResult, BaseAgent, MessageContext, format_thread_history
+from ..filing_cache import FilingCache, fingerprint
+from ..processor import (
+    _extract_json,
+    _inject_tokens,
+    _response_text,
+    load_prompt,
+)
+from ..prompt_cache import PromptCache
+from .base import AgentResult, BaseAgent, MessageContext, gemini_client
 from .router import Router
 
 FILING_PROMPT_FILE = Path(__file__).parent.parent / "prompt.md"
 
+# The capture-time line of a note's frontmatter
+_DATE_LINE = re.compile(r"^date:.*$", re.MULTILINE)
+
+
+def _refresh_date(content: str) -> str:
+    """Set the frontmatter ``date`` of a reused classification to now."""
+    if not content.startswith("---"):
+        return content
+    end = content.find("\n---", 3)
+    if end == -1:
+        return content
+    now = time.strftime("%Y-%m-%dT%H:%M:%S")
+    block = _DATE_LINE.sub(f"date: {now}", content[:end], count=1)
+    return block + content[end:]
+
 
 class FilingAgent(BaseAgent):
     """Archives incoming content into the appropriate vault category."""
@@ -27,10 +48,16 @@ class FilingAgent(BaseAgent):
         "tasks, bookmarks, reference material, or any content to save."
     )
 
-    def __init__(self, existing_projects: list[str] | None = None):
-        self.client = genai.Client()
+    def __init__(
+        self,
+        existing_projects: list[str] | None = None,
+        filing_cache: FilingCache | None = None,
+    ):
+        self.client = gemini_client()
         self.model_name = "gemini-2.5-flash"
         self.existing_projects = existing_projects or []
+        self.prompt_cache = PromptCache(self.client, self.model_name)
+        self.filing_cache = filing_cache
 
     # ------------------------------------------------------------------
     # Public
@@ -39,48 +66,63 @@ class FilingAgent(BaseAgent):
     def handle(self, context: MessageContext) -> AgentResult:
         """Classify the content and file it into the vault."""
 
-        parts = self._build_prompt(context)
-
-        try:
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=parts,
-            )
-        except Exception as e:
-            logging.error("Filing agent Gemini error: %s", e)
-            raise
-
-        tokens = (
-            (response.usage_metadata.total_token_count or 0)
-            if response.usage_metadata
-            else 0
-        )
-        text = response.text or ""
-        data = _extract_json(text)
+        # A repeat of an earlier capture reuses its classification, so no
+        # Gemini call is needed; it is still filed as a new note, since
+        # sending the same thing twice is usually deliberate.  Thread
+        # follow-ups are excluded: their meaning depends on the thread.
+        cache_key = None
+        data = None
+        tokens = 0
+        if self.filing_cache and not context.thread_history:
+            cache_key = fingerprint(context.raw_text, context.attachment_context)
+            data = self.filing_cache.get(cache_key)
+            if data:
+                logging.info("Filing: repeat capture, reusing classification")
+                data["content"] = _refresh_date(data["content"])
 
         if data is None:
-            # Gemini returned plain text — treat as a direct answer
-            return AgentResult(response_text=text, tokens_used=tokens)
-
-        # Validate required fields
-        if "folder" not in data or "content" not in data:
-            logging.warning("Filing: incomplete JSON keys: %s", list(data.keys()))
-            return AgentResult(response_text=text, tokens_used=tokens)
-
-        # Ensure slug
-        if "slug" not in data:
-            data["slug"] = datetime.now().strftime("capture-%Y%m%d-%H%M")
-
-        # Inject token count into frontmatter
-        data["content"] = _inject_tokens(data["content"], tokens)
-
-        # Save to vault
+            parts = self._build_prompt(context)
+
+            try:
+                response = self.prompt_cache.generate(parts)
+            except Exception as e:
+                logging.error("Filing agent Gemini error: %s", e)
+                raise
+
+            usage = response.usage_metadata
+            tokens = (usage.total_token_count or 0) if usage else 0
+            cached = (usage.cached_content_token_count or 0) if usage else 0
+            logging.info("Filing: %d tokens (%d from prompt cache)", tokens, cached)
+            text = _response_text(response)
+            data = _extract_json(text)
+
+            if data is None:
+                # Gemini returned plain text — treat as a direct answer
+                return AgentResult(response_text=text, tokens_used=tokens)
+
+            # Validate required fields
+            if "folder" not in data or "content" not in data:
+                logging.warning("Filing: incomplete JSON keys: %s", list(data.keys()))
+                return AgentResult(response_text=text, tokens_used=tokens)
+
+            # Ensure slug
+            if "slug" not in data:
+                data["slug"] = time.strftime("capture-%Y%m%d-%H%M")
+
+            if self.filing_cache and cache_key:
+                self.filing_cache.put(cache_key, data)
+
+        # Save to vault, with this capture's token count in the frontmatter
         file_path = context.vault.save_note(
             folder=data["folder"],
             slug=data["slug"],
-            content=data["content"],
+            content=_inject_tokens(data["content"], tokens),
         )
 
+        # A new project note changes the list offered in future prompts
+        if file_path.parent.name == "Projects":
+            self.refresh_projects(context.vault)
+
         folder = data["folder"]
         filename = file_path.name
         return AgentResult(
@@ -102,8 +144,19 @@ class FilingAgent(BaseAgent):
     def _build_prompt(self, context: MessageContext) -> list:
         """Build the full filing prompt with project context."""
 
-        system_prompt = FILING_PROMPT_FILE.read_text(encoding="utf-8")
-        current_time = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+        system_prompt = load_prompt(FILING_PROMPT_FILE)
+        current_time = time.strftime("%Y-%m-%dT%H:%M:%S")
+
+        # Stable content first, per-message content last: Gemini's prompt
+        # caches only match on a common prefix.  DO NOT interleave dynamic
+        # content into the prefix.
+        directives_text = Router.format_directives(context.vault)
+        parts: list = [f"{system_prompt}\n## Directives\n{directives_text}"]
+
+        # Include conversation history for threaded follow-ups
+        thread_section = context.formatted_thread
+        if thread_section:
+            parts.append(thread_section)
 
         context_parts = [f"Current time: {current_time}"]
 
@@ -115,23 +168,9 @@ class FilingAgent(BaseAgent):
             )
 
         context_text = "\n".join(context_parts)
-
-        parts: list = [
-            system_prompt,
-            f"\n## Context\n{context_text}",
-        ]
-
-        # Inject persistent directives
-        directives_text = Router.format_directives(context.vault)
-        parts.append(f"\n## Directives\n{directives_text}")
-
+        parts.append(f"\n## Context\n{context_text}")
         parts.append(f"\n## Input\n{context.raw_text}")
 
-        # Include conversation history for threaded follow-ups
-        thread_section = format_thread_history(context.thread_history)
-        if thread_section:
-            parts.insert(2, thread_section)
-
         if context.attachment_context:
             parts.extend(context.attachment_context)
 
@@ -7,17 +7,36 @@ dynamically from agent descriptions so new agents are picked up
 automatically.
 """
 
+import functools
 import logging
-from datetime import datetime
+import string
 from pathlib import Path
 
-from google import genai
+from google.genai import types
 
-from ..processor import _extract_json
-from .base import AgentResult, BaseAgent, MessageContext, format_thread_history
+from ..processor import _extract_json, _response_text, load_prompt
+from .base import (
+    AgentResult,
+    BaseAgent,
+    MessageContext,
+    current_minute,
+    gemini_client,
+)
 
 ROUTER_PROMPT_FILE = Path(__file__).parent / "router_prompt.md"
 
+# ``{{name}}`` placeholders filled in on each routing call
+_PLACEHOLDERS = ("agent_descriptions", "current_time", "directives")
+
+
+@functools.lru_cache(maxsize=4)
+def _router_template(source: str) -> string.Template:
+    """Compile the router prompt into a Template (once per prompt edit)."""
+    text = source.replace("$", "$$")
+    for name in _PLACEHOLDERS:
+        text = text.replace(f"{{{{{name}}}}}", f"${{{name}}}")
+    return string.Template(text)
+
 
 class Router:
     """Classifies incoming messages and dispatches to the appropriate agent."""
@@ -27,11 +46,16 @@ class Router:
         agents: dict[str, BaseAgent],
         default_agent: str = "file",
     ):
-        self.client = genai.Client()
+        self.client = gemini_client()
         self.model_name = "gemini-2.5-flash"
         self.agents = agents
         self.default_agent = default_agent
 
+        # The agent set is fixed, so describe it once for the prompt
+        self.agent_descriptions = "\n".join(
+            f'- **"{name}"**: {agent.description}' for name, agent in agents.items()
+        )
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
@@ -42,7 +66,7 @@ class Router:
         directives = vault.get_directives() if vault else []
         if not directives:
             return "_No directives set._"
-        return "\n".join(f"- {d}" for d in directives)
+        return "\n".join([f"- {d}" for d in directives])
 
     # ------------------------------------------------------------------
     # Public API
@@ -84,24 +108,16 @@ class Router:
     def _classify(self, context: MessageContext) -> dict:
         """Call Gemini to classify the message intent."""
 
-        prompt_template = ROUTER_PROMPT_FILE.read_text(encoding="utf-8")
-
-        # Build agent descriptions dynamically
-        agent_lines = []
-        for name, agent in self.agents.items():
-            agent_lines.append(f'- **"{name}"**: {agent.description}')
-        agent_descriptions = "\n".join(agent_lines)
-
-        prompt = (
-            prompt_template.replace("{{agent_descriptions}}", agent_descriptions)
-            .replace("{{current_time}}", datetime.now().strftime("%Y-%m-%d %H:%M"))
-            .replace("{{directives}}", self.format_directives(context.vault))
+        prompt = _router_template(load_prompt(ROUTER_PROMPT_FILE)).substitute(
+            agent_descriptions=self.agent_descriptions,
+            current_time=current_minute(),
+            directives=self.format_directives(context.vault),
         )
 
         parts: list = [prompt, f"\n## User Message\n{context.raw_text}"]
 
         # Include conversation history for follow-up context
-        thread_section = format_thread_history(context.thread_history)
+        thread_section = context.formatted_thread
         if thread_section:
             parts.insert(1, thread_section)
 
@@ -116,6 +132,10 @@ class Router:
             response = self.client.models.generate_content(
                 model=self.model_name,
                 contents=parts,
+                # JSON mode: no fences or prose around the intent object
+                config=types.GenerateContentConfig(
+                    response_mime_type="application/json"
+                ),
             )
         except Exception as e:
             logging.error("Router Gemini error: %s", e)
@@ -127,7 +147,7 @@ class Router:
             else 0
         )
 
-        data = _extract_json(response.text or "")
+        data = _extract_json(_response_text(response))
         if data is None:
             logging.warning(
                 "Router returned unparseable response, defaulting to '%s'",
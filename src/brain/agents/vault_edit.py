@@ -9,13 +9,17 @@ Gemini to interpret the user's edit request and map it to concrete
 """
 
 import logging
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from google import genai
-
-from ..processor import _extract_json
-from .base import AgentResult, BaseAgent, MessageContext, format_thread_history
+from ..processor import _extract_json, _response_text, load_prompt
+from .base import (
+    AgentResult,
+    BaseAgent,
+    MessageContext,
+    current_minute,
+    gemini_client,
+)
 from .router import Router
 
 #: System prompt sent to Gemini when planning edits.
@@ -26,6 +30,9 @@ _EDIT_PLANNER_PROMPT_FILE = Path(__file__).parent / "vault_edit_prompt.md"
 #: Prevents accidental bulk damage from vague requests.
 MAX_BULK_EDITS = 10
 
+#: Worker threads used to apply a bulk edit.
+EDIT_WORKERS = 8
+
 
 class VaultEditAgent(BaseAgent):
     """Modifies existing vault notes (frontmatter fields, bulk updates)."""
@@ -39,7 +46,7 @@ class VaultEditAgent(BaseAgent):
     )
 
     def __init__(self) -> None:
-        self.client = genai.Client()
+        self.client = gemini_client()
         self.model_name = "gemini-2.5-flash"
 
     # ------------------------------------------------------------------
@@ -111,22 +118,13 @@ class VaultEditAgent(BaseAgent):
             for name in target_files:
                 path = context.vault.find_note(name)
                 if path:
-                    # Use search_notes with the exact stem as keyword
-                    matches = context.vault.search_notes(
-                        keywords=[path.stem],
-                        folders=[path.parent.name],
-                        max_results=1,
+                    candidates.append(
+                        {
+                            "filename": path.name,
+                            "folder": path.parent.name,
+                            "frontmatter": context.vault.get_note_metadata(path),
+                        }
                     )
-                    if matches:
-                        candidates.append(matches[0])
-                    else:
-                        candidates.append(
-                            {
-                                "filename": path.name,
-                                "folder": path.parent.name,
-                                "frontmatter": {},
-                            }
-                        )
             if candidates:
                 return candidates
 
@@ -146,33 +144,31 @@ class VaultEditAgent(BaseAgent):
     ) -> tuple[dict | None, int]:
         """Ask Gemini what edits to apply to the candidate files."""
 
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M")
-        prompt_template = _EDIT_PLANNER_PROMPT_FILE.read_text(encoding="utf-8")
-        system = prompt_template.replace("{current_time}", current_time)
-
         # Build candidate summary
         cand_lines: list[str] = []
         for c in candidates:
-            fm_str = ", ".join(f"{k}={v}" for k, v in c.get("frontmatter", {}).items())
+            fm_str = ", ".join(
+                [f"{k}={v}" for k, v in c.get("frontmatter", {}).items()]
+            )
             cand_lines.append(f"- {c['filename']} (in {c['folder']}/) [{fm_str}]")
         candidates_text = "\n".join(cand_lines)
 
-        parts: list[str] = [
-            system,
-            f"\n## Candidate Notes\n{candidates_text}",
-        ]
-
-        # Inject directives
+        # System prompt + directives form the static, cacheable prefix
+        system = load_prompt(_EDIT_PLANNER_PROMPT_FILE)
         directives_text = Router.format_directives(context.vault)
-        parts.append(f"\n## Directives\n{directives_text}")
-
-        # Thread history (critical for "set all those to …" follow-ups)
-        thread_section = format_thread_history(context.thread_history)
-        if thread_section:
-            parts.append(thread_section)
 
+        # Stable content first, per-message content last (see
+        # VaultQueryAgent._build_prompt).  DO NOT interleave dynamic content
+        # into the prefix — it defeats Gemini's prefix caching.  Thread
+        # history is critical for "set all those to …" follow-ups.
         edit_desc = context.router_data.get("edit_description", context.raw_text)
-        parts.append(f"\n## Edit Request\n{edit_desc}")
+        parts: list[str] = [
+            f"{system}\n## Directives\n{directives_text}",
+            f"{context.formatted_thread}"
+            f"\n## Context\nCurrent time: {current_minute()}\n"
+            f"\n## Candidate Notes\n{candidates_text}"
+            f"\n\n## Edit Request\n{edit_desc}",
+        ]
 
         try:
             response = self.client.models.generate_content(
@@ -183,21 +179,20 @@ class VaultEditAgent(BaseAgent):
             logging.error("VaultEdit planner Gemini error: %s", e)
             raise
 
-        tokens = (
-            (response.usage_metadata.total_token_count or 0)
-            if response.usage_metadata
-            else 0
-        )
+        usage = response.usage_metadata
+        tokens = (usage.total_token_count or 0) if usage else 0
+        cached = (usage.cached_content_token_count or 0) if usage else 0
 
-        data = _extract_json(response.text or "")
+        data = _extract_json(_response_text(response))
         if data is None:
             logging.warning("VaultEdit: unparseable Gemini response")
             return None, tokens
 
         logging.info(
-            "VaultEdit: planned %d edits (%d tokens)",
+            "VaultEdit: planned %d edits (%d tokens, %d cached)",
             len(data.get("edits", [])),
             tokens,
+            cached,
         )
         return data, tokens
 
@@ -206,9 +201,17 @@ class VaultEditAgent(BaseAgent):
     # ------------------------------------------------------------------
 
     def _apply_edits(self, vault, edits: list[dict]) -> list[dict]:
-        """Apply planned edits and collect results per file."""
+        """Apply planned edits and collect results per file.
 
-        results: list[dict] = []
+        Targets are resolved up front, then the read-modify-write of each
+        file runs on a small thread pool — the files are independent and
+        the vault sits on a network mount.  Edits aimed at the same file
+        stay together on one worker so they never race.  Results keep the
+        order of *edits*.
+        """
+
+        results: list[dict | None] = []
+        by_path: dict[Path, list[tuple[int, dict]]] = {}
 
         for edit in edits:
             filename = edit.get("filename", "")
@@ -223,23 +226,38 @@ class VaultEditAgent(BaseAgent):
                 results.append({"filename": filename, "status": "not_found"})
                 continue
 
-            try:
-                changed = vault.update_frontmatter(path, updates)
-                results.append(
-                    {
-                        "filename": filename,
-                        "folder": folder or path.parent.name,
-                        "status": "ok",
-                        "changed": changed,
-                    }
-                )
-            except Exception as e:
-                logging.error("VaultEdit: failed to edit %s: %s", filename, e)
-                results.append(
-                    {"filename": filename, "status": "error", "error": str(e)}
-                )
+            by_path.setdefault(path, []).append((len(results), edit))
+            results.append(None)  # filled in by the workers below
+
+        def apply_group(path: Path, group: list[tuple[int, dict]]) -> None:
+            for index, edit in group:
+                results[index] = self._apply_one(vault, edit, path)
+
+        if by_path:
+            workers = min(len(by_path), EDIT_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(apply_group, p, g) for p, g in by_path.items()]
+                for future in futures:
+                    future.result()
 
-        return results
+        return [r for r in results if r is not None]
+
+    @staticmethod
+    def _apply_one(vault, edit: dict, path: Path) -> dict:
+        """Apply one planned edit to the resolved note at *path*."""
+        filename = edit["filename"]
+        folder = edit.get("folder")
+        try:
+            changed = vault.update_frontmatter(path, edit["frontmatter_updates"])
+            return {
+                "filename": filename,
+                "folder": folder or path.parent.name,
+                "status": "ok",
+                "changed": changed,
+            }
+        except Exception as e:
+            logging.error("VaultEdit: failed to edit %s: %s", filename, e)
+            return {"filename": filename, "status": "error", "error": str(e)}
 
     # ------------------------------------------------------------------
     # Internal — response formatting
@@ -260,7 +278,9 @@ class VaultEditAgent(BaseAgent):
         if ok:
             lines.append(f"\n*Updated {len(ok)} file(s):*")
             for r in ok:
-                changes = ", ".join(f"{k}→{v}" for k, v in r.get("changed", {}).items())
+                changes = ", ".join(
+                    [f"{k}→{v}" for k, v in r.get("changed", {}).items()]
+                )
                 lines.append(f"  • `{r['filename']}` ({changes})")
 
         if failed:
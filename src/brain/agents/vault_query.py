@@ -8,16 +8,31 @@ Supports three query modes:
 """
 
 import logging
-from datetime import datetime
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
 from pathlib import Path
 
-from google import genai
-
-from .base import AgentResult, BaseAgent, MessageContext, format_thread_history
+from ..processor import _response_text, load_prompt
+from .base import (
+    AgentResult,
+    BaseAgent,
+    MessageContext,
+    current_minute,
+    gemini_client,
+)
 from .router import Router
 
 _VAULT_QUERY_PROMPT_FILE = Path(__file__).parent / "vault_query_prompt.md"
 
+#: Repeat searches (typically follow-ups in one thread) reuse the formatted
+#: results for this many seconds.  Entries are keyed on the vault's
+#: content_version(), so notes added or edited through the bot invalidate
+#: them at once; the TTL bounds staleness from edits made in Obsidian.
+SUMMARY_CACHE_TTL = 120
+SUMMARY_CACHE_SIZE = 32
+
 
 class VaultQueryAgent(BaseAgent):
     """Searches the Obsidian vault and uses Gemini to answer questions."""
@@ -30,8 +45,11 @@ class VaultQueryAgent(BaseAgent):
     )
 
     def __init__(self):
-        self.client = genai.Client()
+        self.client = gemini_client()
         self.model_name = "gemini-2.5-flash"
+        # search key -> (expiry, note summaries, match count)
+        self._summaries: OrderedDict[tuple, tuple[float, str, int]] = OrderedDict()
+        self._summaries_lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # Public
@@ -60,22 +78,28 @@ class VaultQueryAgent(BaseAgent):
         folders = context.router_data.get("folders")
         question = context.router_data.get("question", context.raw_text)
 
-        matches = context.vault.search_notes(
-            keywords=search_terms,
-            folders=folders,
-        )
-
-        if not matches and search_terms:
-            logging.info(
-                "VaultQuery: no matches for %s, retrying without keywords",
-                search_terms,
-            )
+        def search() -> tuple[str, int]:
             matches = context.vault.search_notes(
-                keywords=None,
+                keywords=search_terms,
                 folders=folders,
             )
 
-        if not matches:
+            if not matches and search_terms:
+                logging.info(
+                    "VaultQuery: no matches for %s, retrying without keywords",
+                    search_terms,
+                )
+                matches = context.vault.search_notes(
+                    keywords=None,
+                    folders=folders,
+                )
+            return self._format_matches(matches), len(matches)
+
+        note_summaries, match_count = self._cached_summaries(
+            context, ("default", tuple(search_terms or ())), folders, search
+        )
+
+        if not match_count:
             return AgentResult(
                 response_text=(
                     "I searched the vault but didn't find any matching "
@@ -85,10 +109,9 @@ class VaultQueryAgent(BaseAgent):
                 tokens_used=0,
             )
 
-        note_summaries = self._format_matches(matches)
         prompt = self._build_prompt(question, note_summaries, context)
 
-        return self._ask_gemini(prompt, len(matches), "default")
+        return self._ask_gemini(prompt, match_count, "default")
 
     # ------------------------------------------------------------------
     # Strategy: metadata (full-vault index, no file contents)
@@ -100,19 +123,23 @@ class VaultQueryAgent(BaseAgent):
         folders = context.router_data.get("folders")
         question = context.router_data.get("question", context.raw_text)
 
-        index = context.vault.index_all_notes(
-            folders=folders,
-            max_results=500,
+        def index() -> tuple[str, int]:
+            notes = context.vault.index_all_notes(
+                folders=folders,
+                max_results=500,
+            )
+            return self._format_matches(notes), len(notes)
+
+        note_summaries, note_count = self._cached_summaries(
+            context, ("metadata",), folders, index
         )
 
-        if not index:
+        if not note_count:
             return AgentResult(
                 response_text="The vault appears to be empty.",
                 tokens_used=0,
             )
 
-        note_summaries = self._format_matches(index)
-
         prompt = self._build_prompt(
             question,
             note_summaries,
@@ -121,13 +148,13 @@ class VaultQueryAgent(BaseAgent):
                 "Below is a complete metadata index of ALL notes in the "
                 "vault (no file body text, just filenames, folders, "
                 "sizes, dates, and frontmatter properties). "
-                f"Total files: {len(index)}.\n\n"
+                f"Total files: {note_count}.\n\n"
                 "Use this to answer the user's question about "
                 "statistics, rankings, listings, or file properties."
             ),
         )
 
-        return self._ask_gemini(prompt, len(index), "metadata")
+        return self._ask_gemini(prompt, note_count, "metadata")
 
     # ------------------------------------------------------------------
     # Strategy: grep (local text search, no full contents to Gemini)
@@ -149,21 +176,12 @@ class VaultQueryAgent(BaseAgent):
                 tokens_used=0,
             )
 
-        # Search for each term and merge results
-        all_results: list[dict] = []
-        seen: set[str] = set()
-
-        for term in search_terms:
-            hits = context.vault.grep_notes(
-                pattern=term,
-                folders=folders,
-                max_results=100,
-            )
-            for hit in hits:
-                key = f"{hit['folder']}/{hit['filename']}"
-                if key not in seen:
-                    seen.add(key)
-                    all_results.append(hit)
+        # One pass over the vault for all terms; each file appears once
+        all_results = context.vault.grep_notes_multi(
+            patterns=search_terms,
+            folders=folders,
+            max_results=100,
+        )
 
         if not all_results:
             terms_str = ", ".join(f'"{t}"' for t in search_terms)
@@ -205,20 +223,19 @@ class VaultQueryAgent(BaseAgent):
             logging.error("VaultQuery agent Gemini error: %s", e)
             raise
 
-        tokens = (
-            (response.usage_metadata.total_token_count or 0)
-            if response.usage_metadata
-            else 0
-        )
+        usage = response.usage_metadata
+        tokens = (usage.total_token_count or 0) if usage else 0
+        cached = (usage.cached_content_token_count or 0) if usage else 0
         logging.info(
-            "VaultQuery [%s]: %d matches, %d tokens",
+            "VaultQuery [%s]: %d matches, %d tokens (%d cached)",
             mode,
             match_count,
             tokens,
+            cached,
         )
 
         return AgentResult(
-            response_text=response.text or "",
+            response_text=_response_text(response),
             tokens_used=tokens,
         )
 
@@ -226,12 +243,46 @@ class VaultQueryAgent(BaseAgent):
     # Internal
     # ------------------------------------------------------------------
 
+    def _cached_summaries(
+        self,
+        context: MessageContext,
+        key: tuple,
+        folders: list[str] | None,
+        build: Callable[[], tuple[str, int]],
+    ) -> tuple[str, int]:
+        """Return ``(note_summaries, count)`` for a search, memoised.
+
+        *build* runs the vault scan and formatting on a miss.  Empty
+        results are not cached, so a miss is retried on the next message.
+        """
+        key = (*key, tuple(folders or ()), context.vault.content_version(folders))
+        now = time.monotonic()
+        with self._summaries_lock:
+            entry = self._summaries.get(key)
+            if entry and entry[0] > now:
+                self._summaries.move_to_end(key)
+                logging.info("VaultQuery: reusing results for %s", key[0])
+                return entry[1], entry[2]
+
+        summaries, count = build()
+        if count:
+            with self._summaries_lock:
+                self._summaries[key] = (now + SUMMARY_CACHE_TTL, summaries, count)
+                self._summaries.move_to_end(key)
+                while len(self._summaries) > SUMMARY_CACHE_SIZE:
+                    self._summaries.popitem(last=False)
+        return summaries, count
+
     @staticmethod
     def _format_matches(matches: list[dict]) -> str:
         """Format matched notes into a concise text block."""
-        lines = []
+        return "\n".join(VaultQueryAgent._iter_match_lines(matches))
+
+    @staticmethod
+    def _iter_match_lines(matches: list[dict]) -> Iterator[str]:
+        """Yield the lines of :meth:`_format_matches`, one at a time."""
         for m in matches:
-            parts = [f"- **{m['filename']}** (in {m['folder']}/)"]
+            yield f"- **{m['filename']}** (in {m['folder']}/)"
 
             # File-system metadata
             fs_items = []
@@ -242,32 +293,31 @@ class VaultQueryAgent(BaseAgent):
             if "modified" in m:
                 fs_items.append(f"modified {m['modified']}")
             if fs_items:
-                parts.append("  " + " | ".join(fs_items))
+                yield "  " + " | ".join(fs_items)
 
             # YAML frontmatter fields
-            meta_items = []
-            for key, value in m.get("frontmatter", {}).items():
-                meta_items.append(f"{key}: {value}")
-            if meta_items:
-                parts.append("  " + " | ".join(meta_items))
-
-            lines.append("\n".join(parts))
-
-        return "\n".join(lines)
+            frontmatter = m.get("frontmatter")
+            if frontmatter:
+                yield "  " + " | ".join([f"{k}: {v}" for k, v in frontmatter.items()])
 
     @staticmethod
     def _format_grep_results(results: list[dict]) -> str:
         """Format grep search results into a concise text block."""
-        lines = []
+        return "\n".join(VaultQueryAgent._iter_grep_lines(results))
+
+    @staticmethod
+    def _iter_grep_lines(results: list[dict]) -> Iterator[str]:
+        """Yield the lines of :meth:`_format_grep_results`, one at a time."""
         for r in results:
             header = (
                 f"- **{r['filename']}** (in {r['folder']}/) "
                 f"— {r['match_count']} match(es)"
             )
-            lines.append(header)
+            if len(r.get("matched_terms", [])) > 1:
+                header += f" for {', '.join(r['matched_terms'])}"
+            yield header
             for snippet in r.get("snippets", []):
-                lines.append(f"  > {snippet}")
-        return "\n".join(lines)
+                yield f"  > {snippet}"
 
     def _build_prompt(
         self,
@@ -276,9 +326,12 @@ class VaultQueryAgent(BaseAgent):
         context: MessageContext,
         preamble: str | None = None,
     ) -> list[str]:
-        """Build the vault-query prompt."""
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M")
+        """Build the vault-query prompt.
 
+        ``parts[0]`` is the static prefix — system prompt plus directives —
+        which Gemini's implicit prefix cache can reuse; everything that
+        varies per message follows it.
+        """
         data_description = preamble or (
             "Below is a list of matching vault notes with their "
             "filenames, file-system metadata (size in bytes, word "
@@ -288,25 +341,26 @@ class VaultQueryAgent(BaseAgent):
             "say so."
         )
 
-        prompt_template = _VAULT_QUERY_PROMPT_FILE.read_text(encoding="utf-8")
-        system = prompt_template.replace("{current_time}", current_time).replace(
-            "{data_description}", data_description
-        )
-
-        parts = [
-            system,
-            f"\n## Matching Notes\n{note_summaries}",
-        ]
+        system = load_prompt(_VAULT_QUERY_PROMPT_FILE)
 
         # Inject persistent directives
         directives_text = Router.format_directives(context.vault)
-        parts.append(f"\n## Directives\n{directives_text}")
-
-        # Include conversation history for threaded follow-ups
-        thread_section = format_thread_history(context.thread_history)
-        if thread_section:
-            parts.append(thread_section)
 
-        parts.append(f"\n## Question\n{question}")
+        # Stable content first, per-message content last: Gemini's
+        # implicit cache only matches on a common prefix.
+        # DO NOT interleave dynamic content into the prefix.
+        #
+        # The prompt is two parts: the cacheable prefix and one pre-joined
+        # tail.  Thread history leads the tail — it only grows by appending,
+        # so follow-ups in the same thread share everything up to the new
+        # turn.  The data description varies per mode and match count, so
+        # it travels with the notes.
+        parts = [
+            f"{system}\n## Directives\n{directives_text}",
+            f"{context.formatted_thread}"
+            f"\n## Context\nCurrent time: {current_minute()}\n"
+            f"\n## Matching Notes\n{data_description}\n\n{note_summaries}"
+            f"\n\n## Question\n{question}",
+        ]
 
         return parts
@@ -21,22 +21,13 @@ from .agents.memory import MemoryAgent
 from .agents.vault_edit import VaultEditAgent
 from .agents.vault_query import VaultQueryAgent
 from .briefing import start_scheduler
+from .filing_cache import FilingCache
 from .listener import register_listeners
 from .vault import Vault
 
-# ---------------------------------------------------------------------------
-# Logging
-# ---------------------------------------------------------------------------
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
-)
-
 # ---------------------------------------------------------------------------
 # Environment
 # ---------------------------------------------------------------------------
-load_dotenv()
-
 REQUIRED_ENV = ["SLACK_BOT_TOKEN", "SLACK_APP_TOKEN", "GEMINI_API_KEY"]
 
 
@@ -52,13 +43,23 @@ def _validate_env():
 # Main
 # ---------------------------------------------------------------------------
 def main():
+    # Process-wide setup happens here rather than at import time, so that
+    # importing this module (e.g. from the CLI) has no side effects.
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+    load_dotenv()
     _validate_env()
 
     # Initialise Vault (creates folders + .base files on first run)
     vault = Vault()
 
     # Initialise pluggable agents
-    filing_agent = FilingAgent(existing_projects=vault.list_projects())
+    filing_agent = FilingAgent(
+        existing_projects=vault.list_projects(),
+        filing_cache=FilingCache(),
+    )
     vault_query_agent = VaultQueryAgent()
     vault_edit_agent = VaultEditAgent()
     memory_agent = MemoryAgent()
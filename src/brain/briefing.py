@@ -13,8 +13,29 @@ from datetime import date, datetime
 
 import schedule
 
+ALL_CLEAR = "☀️ All clear — nothing urgent today!"
 
-def _build_briefing(vault) -> str:
+# Text of the last briefing posted, so an unchanged all-clear isn't repeated
+_last_posted: str | None = None
+
+
+def _parse_due(due: str) -> date | None:
+    """Parse a ``due_date`` value, or return None if it isn't a date.
+
+    Canonical ``YYYY-MM-DD`` values take the C ``fromisoformat`` path;
+    only hand-edited variants (e.g. ``2025-3-7``) fall back to strptime.
+    """
+    try:
+        return date.fromisoformat(due)
+    except (ValueError, TypeError):
+        pass
+    try:
+        return datetime.strptime(due, "%Y-%m-%d").date()
+    except (ValueError, TypeError):
+        return None
+
+
+def _build_briefing(vault, today: date | None = None) -> str:
     """
     Build a concise daily briefing message.
 
@@ -25,11 +46,10 @@ def _build_briefing(vault) -> str:
     4. Yesterday's captures
     5. One random media suggestion
     """
-    today = date.today()
-    sections = []
+    today = today or date.today()
 
     # ---- Actions ----
-    actions = vault.scan_actions()
+    actions, recent, backlog = vault.scan_all(hours=24)
     overdue = []
     due_today = []
     upcoming = []
@@ -42,9 +62,8 @@ def _build_briefing(vault) -> str:
         if not due:
             continue
 
-        try:
-            due_date = datetime.strptime(due, "%Y-%m-%d").date()
-        except (ValueError, TypeError):
+        due_date = _parse_due(due)
+        if due_date is None:
             continue
 
         diff = (due_date - today).days
@@ -56,70 +75,96 @@ def _build_briefing(vault) -> str:
         elif diff <= 3:
             upcoming.append((a, diff))
 
+    # Every line of the message goes into one flat list, joined once at the
+    # end; sections are separated by a blank line.
+    out: list[str] = []
+
+    def section(heading: str) -> None:
+        if out:
+            out.append("")
+        out.append(heading)
+
     if overdue:
         overdue.sort(key=lambda x: x[1])
-        lines = []
+        section("*🔴 Overdue*")
         for a, diff in overdue:
             project = f" ({a['project']})" if a.get("project") else ""
-            lines.append(f"  • ‼️ {a['title']}{project} — {abs(diff)}d overdue")
-        sections.append("*🔴 Overdue*\n" + "\n".join(lines))
+            out.append(f"  • ‼️ {a['title']}{project} — {abs(diff)}d overdue")
 
     if due_today:
-        lines = []
+        section("*📌 Due Today*")
         for a in due_today:
             project = f" ({a['project']})" if a.get("project") else ""
             priority = f" [{a['priority']}]" if a.get("priority") else ""
-            lines.append(f"  • {a['title']}{project}{priority}")
-        sections.append("*📌 Due Today*\n" + "\n".join(lines))
+            out.append(f"  • {a['title']}{project}{priority}")
 
     if upcoming:
         upcoming.sort(key=lambda x: x[1])
-        lines = []
+        section("*📅 Upcoming*")
         for a, diff in upcoming:
             project = f" ({a['project']})" if a.get("project") else ""
-            lines.append(f"  • {a['title']}{project} — in {diff}d")
-        sections.append("*📅 Upcoming*\n" + "\n".join(lines))
+            out.append(f"  • {a['title']}{project} — in {diff}d")
 
     # ---- Recent captures ----
-    recent = vault.scan_recent(hours=24)
     if recent:
-        lines = [f"  • {r['title']} → `{r['folder']}/`" for r in recent[:5]]
+        section("*📥 Yesterday's Captures*")
+        out.extend(f"  • {r['title']} → `{r['folder']}/`" for r in recent[:5])
         if len(recent) > 5:
-            lines.append(f"  _...and {len(recent) - 5} more_")
-        sections.append("*📥 Yesterday's Captures*\n" + "\n".join(lines))
+            out.append(f"  _...and {len(recent) - 5} more_")
 
     # ---- Media suggestion ----
-    backlog = vault.scan_media_backlog()
     if backlog:
         pick = random.choice(backlog)
-        sections.append(
-            f"*🎬 Maybe today?*\n  • _{pick['title']}_ ({pick['media_type']})"
-        )
+        section("*🎬 Maybe today?*")
+        out.append(f"  • _{pick['title']}_ ({pick['media_type']})")
 
-    if not sections:
-        return "☀️ All clear — nothing urgent today!"
+    if not out:
+        return ALL_CLEAR
 
-    header = f"*☀️ Morning Briefing — {today.strftime('%A %d %B')}*\n"
-    return header + "\n\n".join(sections)
+    header = f"*☀️ Morning Briefing — {today.strftime('%A %d %B')}*"
+    return "\n".join([header, *out])
 
 
 def _run_briefing(client, vault, channel: str):
-    """Post the daily briefing to Slack."""
+    """Post the daily briefing to Slack.
+
+    An all-clear identical to the previous post is skipped: a run of
+    quiet days then costs no Slack call, and the channel isn't filled
+    with the same line every morning.
+    """
+    global _last_posted
     try:
         message = _build_briefing(vault)
+        if message == ALL_CLEAR and message == _last_posted:
+            logging.info("📭 Still all clear — briefing not reposted")
+            return
         client.chat_postMessage(channel=channel, text=message)
+        _last_posted = message
         logging.info("📬 Daily briefing posted")
     except Exception as e:
         logging.exception(f"Failed to post daily briefing: {e}")
 
 
+# Longest single sleep in the scheduler loop.  time.sleep() runs on the
+# monotonic clock, which stops during suspend and ignores wall-clock
+# changes, so the next-run delay is recomputed at least this often.
+SCHEDULER_MAX_SLEEP = 3600
+
+
 def _scheduler_loop():
-    """Run the schedule loop forever (designed for a daemon thread)."""
+    """Run the schedule loop forever (designed for a daemon thread).
+
+    Sleeps until the next job is due rather than polling, so the
+    briefing fires on time and the thread is otherwise idle.
+    """
     import time
 
     while True:
+        idle = schedule.idle_seconds()
+        if idle is None:
+            idle = SCHEDULER_MAX_SLEEP
+        time.sleep(min(max(idle, 0), SCHEDULER_MAX_SLEEP))
         schedule.run_pending()
-        time.sleep(30)
 
 
 def start_scheduler(client, vault):
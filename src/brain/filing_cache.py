@@ -0,0 +1,98 @@
+"""
+filing_cache.py — Local cache of recent filing classifications.
+
+People often send the same link, task or snippet more than once, and a
+repeat is usually deliberate.  Each capture is fingerprinted (message text
+plus attachment bytes) and Gemini's classification of it — folder, slug
+and note content — is remembered, so a repeat is filed again as a new
+note without paying for another Gemini call.
+
+The database lives under the user's cache directory rather than in the
+vault: SQLite locking does not work reliably over the rclone mount, and
+the cache is disposable.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from google.genai import types
+
+#: Entries older than this are ignored and pruned on startup.
+CACHE_MAX_AGE_SECONDS = 7 * 24 * 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS classified (
+    hash BLOB PRIMARY KEY,
+    data TEXT NOT NULL,
+    ts INTEGER NOT NULL
+)
+"""
+
+
+def default_cache_path() -> Path:
+    """Return ``$XDG_CACHE_HOME/2ndbrain/filing.db`` (``~/.cache`` by default)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "2ndbrain" / "filing.db"
+
+
+def fingerprint(text: str, attachments: list) -> bytes:
+    """Hash a capture's text and attachment payloads into a cache key."""
+    h = hashlib.blake2b(text.encode("utf-8"), digest_size=16)
+    for item in attachments:
+        h.update(b"\0")
+        if isinstance(item, types.Part) and item.inline_data:
+            h.update(item.inline_data.data or b"")
+        else:
+            h.update(str(item).encode("utf-8"))
+    return h.digest()
+
+
+class FilingCache:
+    """SQLite-backed map from capture fingerprint to its filing classification."""
+
+    def __init__(self, db_path: Path | None = None):
+        self.db_path = db_path or default_cache_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Listener threads share one connection; the lock serialises access.
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            # Superseded layout that mapped captures to note paths
+            self._conn.execute("DROP TABLE IF EXISTS filed")
+            self._conn.execute(_SCHEMA)
+            self._conn.execute(
+                "DELETE FROM classified WHERE ts < ?",
+                (int(time.time()) - CACHE_MAX_AGE_SECONDS,),
+            )
+
+    def get(self, key: bytes) -> dict | None:
+        """Return the classification previously made for *key*, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, ts FROM classified WHERE hash = ?", (key,)
+            ).fetchone()
+        if not row or row[1] < time.time() - CACHE_MAX_AGE_SECONDS:
+            return None
+        try:
+            return json.loads(row[0])
+        except ValueError:
+            return None
+
+    def put(self, key: bytes, data: dict) -> None:
+        """Remember Gemini's classification *data* for the capture *key*."""
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO classified (hash, data, ts) "
+                    "VALUES (?, ?, ?)",
+                    (key, json.dumps(data), int(time.time())),
+                )
+        except sqlite3.Error as e:
+            logging.warning("Filing cache write failed: %s", e)
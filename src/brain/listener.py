@@ -8,9 +8,17 @@ delegates to the agent router, and replies in Slack.
 import logging
 import os
 import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from urllib.parse import urlsplit
 
 import requests
 from google.genai import types
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .agents import MessageContext, Router
 from .processor import GEMINI_BINARY_MIMES, TEXT_INLINE_MAX_BYTES, _normalize_mime
@@ -19,41 +27,196 @@ from .vault import Vault
 # Maximum number of prior thread messages to include for context
 MAX_THREAD_MESSAGES = 10
 
+# Maximum number of attachments downloaded concurrently per message
+MAX_DOWNLOAD_WORKERS = 8
+
+# Maximum number of oEmbed lookups run concurrently per message
+MAX_OEMBED_WORKERS = 4
+
 # Regex to find URLs in message text (Slack wraps them in < >)
 _URL_PATTERN = re.compile(r"<(https?://[^>|]+)(?:\|[^>]*)?>")
 
-# oEmbed endpoints keyed by domain fragments.
+# oEmbed endpoints keyed by hostname (any leading "www." is dropped first).
 # Each value is the provider's oEmbed URL; the video URL is appended as ?url=…
 _OEMBED_ENDPOINTS: dict[str, str] = {
     "youtube.com": "https://www.youtube.com/oembed",
-    "youtu.be": "https://www.youtube.com/oembed",
+    "m.youtube.com": "https://www.youtube.com/oembed",
     "music.youtube.com": "https://www.youtube.com/oembed",
+    "youtu.be": "https://www.youtube.com/oembed",
     "vimeo.com": "https://vimeo.com/api/oembed.json",
+    "player.vimeo.com": "https://vimeo.com/api/oembed.json",
 }
 
+# oEmbed results are remembered per URL so a link shared again (or quoted in
+# a follow-up) needs no round-trip.  Failures are cached briefly so a dead
+# link does not stall every message that mentions it.
+OEMBED_CACHE_MAX = 1024
+OEMBED_CACHE_TTL = 24 * 3600
+OEMBED_FAILURE_TTL = 300
+# video URL -> (expiry, (title, author) or None on failure)
+_oembed_cache: OrderedDict[str, tuple[float, tuple[str, str] | None]] = OrderedDict()
+_oembed_cache_lock = threading.Lock()
+
+# (connect, read) timeouts for Slack file downloads, in seconds
+SLACK_DOWNLOAD_TIMEOUT = (3.05, 30)
+
+# MIME families that are never worth trying to decode as UTF-8 text
+_BINARY_MIME_PREFIXES = ("image/", "audio/", "video/", "font/")
+
+# Chunk size used when streaming large downloads to disk
+STREAM_CHUNK_BYTES = 1024 * 1024
+
+
+def _make_session() -> requests.Session:
+    """Build a pooled session so repeat requests reuse TCP+TLS connections."""
+    session = requests.Session()
+    retry = Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+    )
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retry),
+    )
+    return session
+
 
-def download_slack_file(url: str) -> bytes:
+# Shared by all download threads; the connection pool keeps sockets to
+# files.slack.com alive between attachments and messages.
+_SLACK_SESSION = _make_session()
+
+# oEmbed lookups get their own pool: youtube.com and vimeo.com are hit on
+# most link captures, and keeping them apart from _SLACK_SESSION means a
+# Slack credential can never be attached to a third-party request.
+_OEMBED_SESSION = _make_session()
+
+# Authorization header for Slack downloads, built once by register_listeners.
+# Deliberately passed per request rather than set on the session, so the
+# token can never ride along to a non-Slack URL.
+_slack_auth_headers: dict[str, str] = {}
+
+
+def _set_slack_token(token: str) -> None:
+    """Build the download Authorization header from the bot token.
+
+    Raises:
+        ValueError: If the token is empty.
+    """
+    token = token.strip()
+    if not token:
+        raise ValueError("SLACK_BOT_TOKEN is not set")
+    _slack_auth_headers["Authorization"] = f"Bearer {token}"
+
+
+# Slack redelivers events it thinks were not acked; remember recently seen
+# (channel, ts) pairs so a retry never reaches Gemini a second time.
+SEEN_EVENTS_MAX = 512
+_seen_events: OrderedDict[tuple[str, str], None] = OrderedDict()
+_seen_events_lock = threading.Lock()
+
+# Thread follow-ups reuse the history assembled for the previous message
+# rather than re-reading the thread from Slack.  Every human message passes
+# through handle_message and every reply is sent from it, so the cache is
+# extended in step; edits and deletions drop the entry, and the TTL bounds
+# drift from anything that bypasses the handler (e.g. other bots).
+THREAD_CACHE_MAX = 256
+THREAD_CACHE_TTL = 600
+# (channel, thread_ts) -> (expiry, history oldest-first)
+_thread_cache: OrderedDict[tuple[str, str], tuple[float, list[dict]]] = OrderedDict()
+_thread_cache_lock = threading.Lock()
+
+# Top-level messages shorter than this (with no files) carry nothing worth
+# filing; thread replies are exempt
+MIN_TEXT_CHARS = 3
+
+# URL-title and thread-history lookups run here while the handler thread
+# downloads attachments, so a message waits for the slowest of the three
+# rather than their sum.
+_PREFETCH_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="brain-prefetch")
+
+
+def _is_duplicate_event(channel: str, ts: str) -> bool:
+    """Record the event and return True if it was already seen."""
+    key = (channel, ts)
+    with _seen_events_lock:
+        if key in _seen_events:
+            _seen_events.move_to_end(key)
+            return True
+        _seen_events[key] = None
+        if len(_seen_events) > SEEN_EVENTS_MAX:
+            _seen_events.popitem(last=False)
+        return False
+
+
+def _cached_thread(channel: str, thread_ts: str) -> list[dict] | None:
+    """Return a copy of the cached history for a thread, or None."""
+    key = (channel, thread_ts)
+    with _thread_cache_lock:
+        entry = _thread_cache.get(key)
+        if not entry:
+            return None
+        if entry[0] <= time.monotonic():
+            del _thread_cache[key]
+            return None
+        _thread_cache.move_to_end(key)
+        return list(entry[1])
+
+
+def _extend_thread(
+    channel: str, thread_ts: str, messages: list[dict], create: bool = False
+) -> None:
+    """Append *messages* to a cached thread history.
+
+    A thread that is not cached is left alone unless *create* is set —
+    appending to nothing would make a partial history look complete.
+    """
+    key = (channel, thread_ts)
+    with _thread_cache_lock:
+        entry = _thread_cache.get(key)
+        if entry:
+            expiry, history = entry
+        elif create:
+            expiry, history = time.monotonic() + THREAD_CACHE_TTL, []
+        else:
+            return
+        history = (history + messages)[-MAX_THREAD_MESSAGES:]
+        _thread_cache[key] = (expiry, history)
+        _thread_cache.move_to_end(key)
+        if len(_thread_cache) > THREAD_CACHE_MAX:
+            _thread_cache.popitem(last=False)
+
+
+def _forget_thread(channel: str, thread_ts: str) -> None:
+    """Drop a thread's cached history so the next message re-fetches it."""
+    with _thread_cache_lock:
+        _thread_cache.pop((channel, thread_ts), None)
+
+
+def _open_slack_download(url: str, stream: bool = False) -> requests.Response:
     """
-    Download a file from Slack using the bot token.
+    Request a file from Slack using the bot token.
 
     Uses allow_redirects=False to catch auth failures (302 → login page).
 
     Raises:
         ValueError: If token is missing or Slack rejects the request.
     """
-    token = os.environ.get("SLACK_BOT_TOKEN", "").strip()
-    if not token:
+    if not _slack_auth_headers:
         raise ValueError("SLACK_BOT_TOKEN is not set")
 
-    resp = requests.get(
+    resp = _SLACK_SESSION.get(
         url,
-        headers={"Authorization": f"Bearer {token}"},
+        headers=_slack_auth_headers,
         allow_redirects=False,
+        timeout=SLACK_DOWNLOAD_TIMEOUT,
+        stream=stream,
     )
 
     if resp.status_code in (301, 302):
         location = resp.headers.get("Location", "")
         logging.error(f"Slack auth redirect → {location}")
+        resp.close()
         raise ValueError(
             "Slack rejected the token. Ensure 'files:read' scope is active "
             "and the app has been reinstalled."
@@ -62,9 +225,66 @@ def download_slack_file(url: str) -> bytes:
     resp.raise_for_status()
 
     if "text/html" in resp.headers.get("Content-Type", ""):
+        resp.close()
         raise ValueError("Slack returned HTML. Token likely lacks 'files:read'.")
 
-    return resp.content
+    return resp
+
+
+def download_slack_file(url: str) -> bytes:
+    """Download a file from Slack into memory."""
+    return _open_slack_download(url).content
+
+
+def stream_slack_file(url: str, dest: Path) -> None:
+    """Stream a file from Slack straight to *dest* without buffering it."""
+    with _open_slack_download(url, stream=True) as resp:
+        try:
+            with dest.open("wb") as f:
+                for chunk in resp.iter_content(chunk_size=STREAM_CHUNK_BYTES):
+                    f.write(chunk)
+        except Exception:
+            # Don't leave a truncated attachment behind in the vault
+            dest.unlink(missing_ok=True)
+            raise
+
+
+def _oembed_lookup(url: str, endpoint: str) -> tuple[str, str] | None:
+    """Return ``(title, author)`` for a video URL, or None if unavailable.
+
+    Served from the oEmbed cache when the URL was looked up recently.
+    """
+    now = time.monotonic()
+    with _oembed_cache_lock:
+        entry = _oembed_cache.get(url)
+        if entry and entry[0] > now:
+            _oembed_cache.move_to_end(url)
+            return entry[1]
+
+    result: tuple[str, str] | None = None
+    try:
+        resp = _OEMBED_SESSION.get(
+            endpoint,
+            params={"url": url, "format": "json"},
+            timeout=10,
+        )
+        resp.raise_for_status()
+        data = resp.json()
+        title = data.get("title", "").strip()
+        author = data.get("author_name", "").strip()
+        if title:
+            result = (title, author)
+            logging.info("oEmbed title for %s: %s (by %s)", url, title, author)
+    except Exception as e:
+        logging.warning("Failed to fetch oEmbed for %s: %s", url, e)
+
+    ttl = OEMBED_CACHE_TTL if result else OEMBED_FAILURE_TTL
+    with _oembed_cache_lock:
+        _oembed_cache[url] = (now + ttl, result)
+        _oembed_cache.move_to_end(url)
+        if len(_oembed_cache) > OEMBED_CACHE_MAX:
+            _oembed_cache.popitem(last=False)
+    return result
 
 
 def _fetch_url_titles(text: str) -> str:
@@ -81,40 +301,122 @@ def _fetch_url_titles(text: str) -> str:
     if not urls:
         return ""
 
-    enrichments: list[str] = []
+    # Pair each URL with the oEmbed endpoint for its domain
+    lookups: list[tuple[str, str]] = []
     for url in urls:
-        # Find the matching oEmbed endpoint for this URL's domain
-        oembed_url: str | None = None
-        for domain, endpoint in _OEMBED_ENDPOINTS.items():
-            if domain in url:
-                oembed_url = endpoint
-                break
-        if oembed_url is None:
-            continue
+        host = (urlsplit(url).hostname or "").removeprefix("www.")
+        endpoint = _OEMBED_ENDPOINTS.get(host)
+        if endpoint:
+            lookups.append((url, endpoint))
+    if not lookups:
+        return ""
 
-        try:
-            resp = requests.get(
-                oembed_url,
-                params={"url": url, "format": "json"},
-                timeout=10,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            title = data.get("title", "").strip()
-            author = data.get("author_name", "").strip()
-            if title:
-                parts = [f'Page title for {url} is: "{title}".']
-                if author:
-                    parts.append(f'Author/channel: "{author}".')
-                parts.append("Use this as the note title and filename.")
-                enrichments.append(f"[System: {' '.join(parts)}]")
-                logging.info("oEmbed title for %s: %s (by %s)", url, title, author)
-        except Exception as e:
-            logging.warning("Failed to fetch oEmbed for %s: %s", url, e)
+    # Several links are looked up concurrently; results keep message order
+    if len(lookups) == 1:
+        results = [_oembed_lookup(*lookups[0])]
+    else:
+        workers = min(len(lookups), MAX_OEMBED_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(lambda lookup: _oembed_lookup(*lookup), lookups))
+
+    enrichments: list[str] = []
+    for (url, _), found in zip(lookups, results, strict=True):
+        if found:
+            title, author = found
+            parts = [f'Page title for {url} is: "{title}".']
+            if author:
+                parts.append(f'Author/channel: "{author}".')
+            parts.append("Use this as the note title and filename.")
+            enrichments.append(f"[System: {' '.join(parts)}]")
 
     return "\n".join(enrichments)
 
 
+def _looks_binary(mime: str, content: bytes) -> bool:
+    """Cheap check for content that can't be inlined as text.
+
+    Media MIME types (other than XML-based ones), or a NUL byte in the
+    first 4 KB, mark a file as binary without decoding the whole buffer.
+    Anything else still goes through the UTF-8 decode, which remains the
+    final arbiter (Slack labels many text formats ``application/*``).
+    """
+    # XML-based media types (image/svg+xml, …) are text; let the probe and
+    # the decode decide for those
+    media = mime.startswith(_BINARY_MIME_PREFIXES) and not mime.endswith("+xml")
+    return media or b"\0" in content[:4096]
+
+
+def _attachment_parts(
+    name: str, mime: str, content: bytes, vault: Vault
+) -> list[str | types.Part]:
+    """Save or inline one downloaded attachment and return its prompt parts."""
+    if mime in GEMINI_BINARY_MIMES:
+        # Save binary to Attachments/
+        saved_name = vault.save_attachment(name, content)
+        logging.info(f"Saved binary attachment: {saved_name} ({mime})")
+
+        # Instruct Gemini to link the saved file
+        link_syntax = (
+            f"![[{saved_name}]]" if mime.startswith("image/") else f"[[{saved_name}]]"
+        )
+        return [
+            # Add binary data for Gemini to analyse
+            types.Part.from_bytes(data=content, mime_type=mime),
+            f"\n[System: Attachment '{name}' saved as '{saved_name}'. "
+            f"Include {link_syntax} in your output to link it.]",
+        ]
+
+    # Try to read as text and inline; obvious binaries skip the decode
+    if not _looks_binary(mime, content):
+        if len(content) > TEXT_INLINE_MAX_BYTES:
+            # Too large to inline — save as attachment
+            saved_name = vault.save_attachment(name, content)
+            return [
+                f"\n[System: Large file '{name}' saved as '{saved_name}'. "
+                f"Include [[{saved_name}]] in your output.]"
+            ]
+        try:
+            text_content = content.decode("utf-8")
+            return [f"\n### File: {name}\n```\n{text_content}\n```"]
+        except UnicodeDecodeError:
+            pass
+
+    # Binary file with unrecognised MIME — save it
+    saved_name = vault.save_attachment(name, content)
+    logging.info(f"Saved unknown binary: {saved_name}")
+    return [
+        f"\n[System: Binary file '{name}' saved as '{saved_name}'. "
+        f"Include [[{saved_name}]] in your output.]"
+    ]
+
+
+def _fetch_attachment(file_info: dict, vault: Vault) -> list[str | types.Part]:
+    """Download one Slack attachment and return its prompt parts."""
+    name = file_info.get("name", "unknown")
+    url = file_info.get("url_private")
+    if not url:
+        logging.warning(f"No url_private for file {name}")
+        return []
+
+    mime = _normalize_mime(file_info.get("mimetype", ""))
+
+    if mime not in GEMINI_BINARY_MIMES and (
+        file_info.get("size", 0) > TEXT_INLINE_MAX_BYTES
+    ):
+        # Too large to inline and not sent to Gemini — stream it
+        # straight into Attachments/ instead of holding it in memory
+        dest = vault.new_attachment_path(name)
+        stream_slack_file(url, dest)
+        logging.info(f"Streamed attachment: Attachments/{dest.name}")
+        return [
+            f"\n[System: Large file '{name}' saved as '{dest.name}'. "
+            f"Include [[{dest.name}]] in your output.]"
+        ]
+
+    content = download_slack_file(url)
+    return _attachment_parts(name, mime, content, vault)
+
+
 def _process_attachments(files: list[dict], vault: Vault) -> list:
     """
     Download Slack attachments and prepare prompt context.
@@ -125,6 +427,9 @@ def _process_attachments(files: list[dict], vault: Vault) -> list:
     Small text files are inlined into the prompt as code blocks
     (not saved separately).
 
+    All downloads run concurrently; results are then collected in the
+    original file order so the prompt layout is deterministic.
+
     Returns:
         List of prompt parts (strings and/or binary data dicts).
     """
@@ -133,61 +438,16 @@ def _process_attachments(files: list[dict], vault: Vault) -> list:
 
     parts: list[str | types.Part] = ["\n## Attachments"]
 
-    for file_info in files:
-        name = file_info.get("name", "unknown")
-        try:
-            url = file_info.get("url_private")
-            if not url:
-                logging.warning(f"No url_private for file {name}")
-                continue
-
-            content = download_slack_file(url)
-            mime = _normalize_mime(file_info.get("mimetype", ""))
-
-            if mime in GEMINI_BINARY_MIMES:
-                # Save binary to Attachments/
-                saved_name = vault.save_attachment(name, content)
-                logging.info(f"Saved binary attachment: {saved_name} ({mime})")
-
-                # Add binary data for Gemini to analyse
-                parts.append(types.Part.from_bytes(data=content, mime_type=mime))
-
-                # Instruct Gemini to link the saved file
-                link_syntax = (
-                    f"![[{saved_name}]]"
-                    if mime.startswith("image/")
-                    else f"[[{saved_name}]]"
-                )
-                parts.append(
-                    f"\n[System: Attachment '{name}' saved as '{saved_name}'. "
-                    f"Include {link_syntax} in your output to link it.]"
-                )
-
-            else:
-                # Try to read as text and inline
-                try:
-                    if len(content) > TEXT_INLINE_MAX_BYTES:
-                        # Too large to inline — save as attachment
-                        saved_name = vault.save_attachment(name, content)
-                        parts.append(
-                            f"\n[System: Large file '{name}' saved as '{saved_name}'. "
-                            f"Include [[{saved_name}]] in your output.]"
-                        )
-                    else:
-                        text_content = content.decode("utf-8")
-                        parts.append(f"\n### File: {name}\n```\n{text_content}\n```")
-
-                except UnicodeDecodeError:
-                    # Binary file with unrecognised MIME — save it
-                    saved_name = vault.save_attachment(name, content)
-                    logging.info(f"Saved unknown binary: {saved_name}")
-                    parts.append(
-                        f"\n[System: Binary file '{name}' saved as '{saved_name}'. "
-                        f"Include [[{saved_name}]] in your output.]"
-                    )
+    workers = min(len(files), MAX_DOWNLOAD_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        fetches = [pool.submit(_fetch_attachment, f, vault) for f in files]
 
-        except Exception as e:
-            logging.warning(f"Failed to process attachment '{name}': {e}")
+        for file_info, fetch in zip(files, fetches, strict=True):
+            try:
+                parts.extend(fetch.result())
+            except Exception as e:
+                name = file_info.get("name", "unknown")
+                logging.warning(f"Failed to process attachment '{name}': {e}")
 
     return parts
 
@@ -201,7 +461,14 @@ def _fetch_thread_history(
     Returns a list of dicts with keys: role ('user' | 'assistant'), text.
     Oldest messages first, capped at MAX_THREAD_MESSAGES.
     The current message (current_ts) is excluded.
+
+    Served from the thread cache when the previous message in the thread
+    was handled by this process.
     """
+    cached = _cached_thread(channel, thread_ts)
+    if cached is not None:
+        return cached
+
     try:
         resp = client.conversations_replies(
             channel=channel,
@@ -212,19 +479,18 @@ def _fetch_thread_history(
         logging.warning("Failed to fetch thread history: %s", e)
         return []
 
-    history = []
-    for msg in resp.get("messages", []):
-        # Skip the current message
-        if msg.get("ts") == current_ts:
-            continue
-        # Determine role
-        role = "assistant" if msg.get("bot_id") else "user"
-        text = msg.get("text", "").strip()
-        if text:
-            history.append({"role": role, "text": text})
+    # Bot messages are the assistant's turns; skip the current message
+    # and anything without text (e.g. bare file shares)
+    history = [
+        {"role": "assistant" if msg.get("bot_id") else "user", "text": text}
+        for msg in resp.get("messages", ())
+        if msg.get("ts") != current_ts and (text := (msg.get("text") or "").strip())
+    ]
 
     # Cap and return oldest-first
-    return history[-MAX_THREAD_MESSAGES:]
+    history = history[-MAX_THREAD_MESSAGES:]
+    _extend_thread(channel, thread_ts, history, create=True)
+    return history
 
 
 def register_listeners(app, vault: Vault, router: Router):
@@ -235,12 +501,22 @@ def register_listeners(app, vault: Vault, router: Router):
         app: The slack_bolt App instance.
         vault: Vault instance for file I/O.
         router: Router instance for dispatching messages to agents.
+
+    Raises:
+        ValueError: If SLACK_BOT_TOKEN is not set (needed for downloads).
     """
+    _set_slack_token(os.environ.get("SLACK_BOT_TOKEN", ""))
 
     @app.event("message")
     def handle_message(event, say, client):
         # Allow file_share subtype, ignore all other subtypes and bots
         subtype = event.get("subtype")
+        if subtype in ("message_changed", "message_deleted"):
+            # The cached copy of the thread no longer matches Slack's
+            msg = event.get("message") or event.get("previous_message") or {}
+            if msg.get("thread_ts"):
+                _forget_thread(event.get("channel", ""), msg["thread_ts"])
+            return
         if (subtype and subtype != "file_share") or event.get("bot_id"):
             return
 
@@ -249,22 +525,43 @@ def register_listeners(app, vault: Vault, router: Router):
         channel = event.get("channel", "")
         thread_ts = event.get("thread_ts")
         message_ts = event.get("ts", "")
+
+        # Cheap checks first — both paths skip the Gemini call entirely
+        if message_ts and _is_duplicate_event(channel, message_ts):
+            logging.info("Ignoring redelivered event %s/%s", channel, message_ts)
+            return
+        # Only top-level messages: in a thread, "ok" or "2" can be a
+        # complete answer to the bot's question
+        if not thread_ts and len(text.strip()) < MIN_TEXT_CHARS and not files:
+            _forget_thread(channel, message_ts)
+            say(
+                "🤔 Not enough to go on — send a bit more detail.",
+                thread_ts=message_ts,
+            )
+            return
+
         logging.info(f"📥 Incoming: {text[:60]}... ({len(files)} files)")
 
         try:
-            # Process attachments
+            # Start the network lookups, then download attachments meanwhile
+            url_future = _PREFETCH_POOL.submit(_fetch_url_titles, text)
+            thread_future = (
+                _PREFETCH_POOL.submit(
+                    _fetch_thread_history, client, channel, thread_ts, message_ts
+                )
+                if thread_ts
+                else None
+            )
             attachment_context = _process_attachments(files, vault)
 
             # Enrich message with URL metadata (video titles, etc.)
-            url_context = _fetch_url_titles(text)
+            url_context = url_future.result()
             enriched_text = f"{text}\n{url_context}" if url_context else text
 
-            # Fetch thread history if this message is in a thread
+            # Thread history if this message is in a thread
             thread_history = []
-            if thread_ts:
-                thread_history = _fetch_thread_history(
-                    client, channel, thread_ts, message_ts
-                )
+            if thread_future:
+                thread_history = thread_future.result()
                 logging.info("Thread context: %d prior messages", len(thread_history))
 
             # Build context and route to the appropriate agent
@@ -276,13 +573,22 @@ def register_listeners(app, vault: Vault, router: Router):
             )
             result = router.route(context)
 
+            exchange = [{"role": "user", "text": text.strip()}] if text.strip() else []
             if result.response_text:
                 # Reply in-thread if the message was in a thread
                 say(
                     result.response_text,
                     thread_ts=thread_ts or message_ts,
                 )
+                exchange.append({"role": "assistant", "text": result.response_text})
+
+            # A top-level message starts a thread whose whole history is
+            # known right here, so its first follow-up needs no fetch either
+            _extend_thread(
+                channel, thread_ts or message_ts, exchange, create=not thread_ts
+            )
 
         except Exception as e:
+            _forget_thread(channel, thread_ts or message_ts)
             logging.exception("Error processing message")
             say(f"⚠️ Brain Error: {e}")
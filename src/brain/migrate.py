@@ -9,10 +9,15 @@ updating wiki-links.
 import logging
 import os
 import re
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from ruamel.yaml import YAML
 
+from .processor import _response_text
 from .vault import VALID_FOLDERS
 
 # Folders to skip during migration (not user content)
@@ -24,15 +29,25 @@ UNSAFE_CHARS = re.compile(r'[:/\\?*"<>|]')
 yaml = YAML()
 yaml.preserve_quotes = True
 
+# Plain-dict loader for passes that only read frontmatter; several times
+# faster than the round-trip loader, but what it returns cannot be written
+# back without losing quoting and comments
+_safe_yaml = YAML(typ="safe")
+
 
 # ------------------------------------------------------------------
 # YAML frontmatter round-trip helpers
 # ------------------------------------------------------------------
 
 
-def _read_frontmatter(file_path: Path) -> tuple[dict | None, str, str]:
+def _read_frontmatter(
+    file_path: Path, *, round_trip: bool = True
+) -> tuple[dict | None, str, str]:
     """Read a markdown file and parse its YAML frontmatter.
 
+    Pass ``round_trip=False`` when the result will not be written back
+    with :func:`_write_frontmatter`.
+
     Returns:
         (frontmatter_dict, raw_yaml_text, body_text)
         frontmatter_dict is None if no valid frontmatter block is found.
@@ -51,13 +66,50 @@ def _read_frontmatter(file_path: Path) -> tuple[dict | None, str, str]:
     try:
         from io import StringIO
 
-        data = yaml.load(StringIO(raw_yaml))
+        data = (yaml if round_trip else _safe_yaml).load(StringIO(raw_yaml))
     except Exception:
         return None, raw_yaml, body
 
     return (dict(data) if data else {}), raw_yaml, body
 
 
+class FrontmatterCache:
+    """Parsed frontmatter shared between the passes of one migration run.
+
+    Each pass walks the same notes; parsing their YAML once and reusing it
+    saves a ruamel round-trip parse per note per pass.  Entries are keyed
+    on the file's mtime and size, so anything rewritten since is parsed
+    afresh, and callers :meth:`forget` paths they write or rename.
+    """
+
+    def __init__(self) -> None:
+        # path -> ((mtime_ns, size), round_trip, (frontmatter, raw_yaml, body))
+        self._entries: dict[Path, tuple[tuple[int, int], bool, tuple]] = {}
+
+    def get(
+        self, file_path: Path, *, round_trip: bool = True
+    ) -> tuple[dict | None, str, str]:
+        """Return ``_read_frontmatter(file_path)``, parsing only on a miss.
+
+        A round-trip entry also satisfies a read-only request, but not the
+        reverse.  The frontmatter dict is a fresh copy, so callers may
+        modify it.
+        """
+        st = file_path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        entry = self._entries.get(file_path)
+        if entry is None or entry[0] != stamp or (round_trip and not entry[1]):
+            parsed = _read_frontmatter(file_path, round_trip=round_trip)
+            entry = (stamp, round_trip, parsed)
+            self._entries[file_path] = entry
+        fm, raw_yaml, body = entry[2]
+        return (dict(fm) if fm is not None else None), raw_yaml, body
+
+    def forget(self, file_path: Path) -> None:
+        """Drop the entry for a file that was rewritten or moved."""
+        self._entries.pop(file_path, None)
+
+
 def _write_frontmatter(file_path: Path, fm: dict, body: str) -> None:
     """Write frontmatter dict and body back to a markdown file."""
     from io import StringIO
@@ -98,12 +150,85 @@ def _is_hyphenated_slug(stem: str) -> bool:
     return stem == stem.lower() and "-" in stem and not stem.startswith("_")
 
 
+# ------------------------------------------------------------------
+# Vault walking helpers
+# ------------------------------------------------------------------
+
+
+def _folder_notes(folder_path: Path) -> list[Path]:
+    """Return the ``.md`` files directly inside *folder_path*, sorted by name.
+
+    Names come straight from ``os.scandir``, so listing and sorting a folder
+    costs no per-file ``stat``.  A missing folder yields no notes.
+    """
+    try:
+        with os.scandir(folder_path) as entries:
+            names = [e.name for e in entries if e.name.endswith(".md") and e.is_file()]
+    except FileNotFoundError:
+        return []
+    return [folder_path / name for name in sorted(names)]
+
+
+def _iter_markdown(root: Path, skip: set[str]) -> Iterator[Path]:
+    """Yield every ``.md`` file under *root*, pruning directories in *skip*."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in skip]
+        for name in filenames:
+            if name.endswith(".md"):
+                yield Path(dirpath, name)
+
+
 # ------------------------------------------------------------------
 # rename_to_title_case
 # ------------------------------------------------------------------
 
 
-def rename_to_title_case(vault_path: Path, dry_run: bool = False) -> dict[str, str]:
+def _rename_target(md_file: Path, fm: dict | None) -> Path | None:
+    """Return the Title Case path for an old-style note, or None to keep it.
+
+    Uses the frontmatter ``title`` when there is one, otherwise converts
+    the slug; a number is appended if the name is already taken.
+    """
+    old_stem = md_file.stem
+    if not _is_hyphenated_slug(old_stem):
+        return None
+
+    if fm and fm.get("title"):
+        new_stem = _title_to_filename(str(fm["title"]))
+    else:
+        new_stem = _slug_to_title(old_stem)
+
+    if new_stem == old_stem:
+        return None
+
+    new_path = md_file.with_stem(new_stem)
+
+    # Deduplicate
+    counter = 1
+    while new_path.exists() and new_path != md_file:
+        new_path = md_file.parent / f"{new_stem} {counter}.md"
+        counter += 1
+
+    return new_path
+
+
+def _rename_note(
+    md_file: Path, new_path: Path, dry_run: bool, cache: FrontmatterCache
+) -> None:
+    """Move a note to *new_path* (or just log it when *dry_run*)."""
+    if dry_run:
+        logging.info("[DRY RUN] Rename: %s -> %s", md_file.name, new_path.name)
+    else:
+        md_file.rename(new_path)
+        cache.forget(md_file)
+        logging.info("Renamed: %s -> %s", md_file.name, new_path.name)
+
+
+def rename_to_title_case(
+    vault_path: Path,
+    dry_run: bool = False,
+    cache: FrontmatterCache | None = None,
+) -> dict[str, str]:
     """Rename old-style hyphenated files to Title Case.
 
     Reads the ``title`` from each note's frontmatter to derive the new
@@ -112,50 +237,26 @@ def rename_to_title_case(vault_path: Path, dry_run: bool = False) -> dict[str, s
     Args:
         vault_path: Root path of the Obsidian vault.
         dry_run: If True, log proposed changes but don't modify files.
+        cache: Frontmatter parsed by earlier passes of the same run.
 
     Returns:
         A rename map ``{old_stem: new_stem}`` for use by
         :func:`update_wiki_links`.
     """
+    cache = cache or FrontmatterCache()
     rename_map: dict[str, str] = {}
 
     for folder in VALID_FOLDERS - SKIP_FOLDERS:
-        folder_path = vault_path / folder
-        if not folder_path.exists():
-            continue
-
-        for md_file in sorted(folder_path.glob("*.md")):
-            old_stem = md_file.stem
-
+        for md_file in _folder_notes(vault_path / folder):
             # Only rename old-style slugs
-            if not _is_hyphenated_slug(old_stem):
-                continue
-
-            # Try to get a title from frontmatter
-            fm, _, _ = _read_frontmatter(md_file)
-            if fm and fm.get("title"):
-                new_stem = _title_to_filename(str(fm["title"]))
-            else:
-                new_stem = _slug_to_title(old_stem)
-
-            if new_stem == old_stem:
+            if not _is_hyphenated_slug(md_file.stem):
                 continue
 
-            new_path = md_file.with_stem(new_stem)
-
-            # Deduplicate
-            counter = 1
-            while new_path.exists() and new_path != md_file:
-                new_path = md_file.parent / f"{new_stem} {counter}.md"
-                counter += 1
-
-            rename_map[old_stem] = new_path.stem
-
-            if dry_run:
-                logging.info("[DRY RUN] Rename: %s -> %s", md_file.name, new_path.name)
-            else:
-                md_file.rename(new_path)
-                logging.info("Renamed: %s -> %s", md_file.name, new_path.name)
+            fm, _, _ = cache.get(md_file, round_trip=False)
+            new_path = _rename_target(md_file, fm)
+            if new_path:
+                rename_map[md_file.stem] = new_path.stem
+                _rename_note(md_file, new_path, dry_run, cache)
 
     return rename_map
 
@@ -165,6 +266,13 @@ def rename_to_title_case(vault_path: Path, dry_run: bool = False) -> dict[str, s
 # ------------------------------------------------------------------
 
 
+# [[target]] and ![[target]], with optional |display text.  Every link is
+# matched and its target looked up in the rename map, so the cost of a scan
+# does not grow with the number of renamed notes.  The target may not span
+# "[" or a newline, so a stray "[[" cannot swallow the next real link.
+_WIKI_LINK = re.compile(r"(!?\[\[)([^\[\]|\n]+)((?:\|[^\]]*)?)\]\]")
+
+
 def update_wiki_links(
     vault_path: Path,
     rename_map: dict[str, str],
@@ -187,23 +295,23 @@ def update_wiki_links(
     if not rename_map:
         return 0
 
-    # Build a single regex matching any old stem inside [[ ]]
-    escaped = [re.escape(old) for old in rename_map]
-    # Match [[old-stem]] and ![[old-stem]] (with optional display text)
-    pattern = re.compile(r"(!?\[\[)(" + "|".join(escaped) + r")((?:\|[^\]]*)?)\]\]")
+    lookup = rename_map.get
+
+    def relink(m: re.Match) -> str:
+        opener, target, display = m.groups()
+        new = lookup(target)
+        return f"{opener}{new}{display}]]" if new else m.group(0)
 
     modified_count = 0
 
-    for md_file in vault_path.rglob("*.md"):
-        # Skip system files
-        if md_file.parent.name == "_brain":
+    for md_file in _iter_markdown(vault_path, skip={"_brain"}):
+        # Most notes have no links at all; a byte probe spares them the
+        # decode and the regex pass
+        data = md_file.read_bytes()
+        if b"[[" not in data:
             continue
-
-        text = md_file.read_text(encoding="utf-8")
-        new_text = pattern.sub(
-            lambda m: f"{m.group(1)}{rename_map[m.group(2)]}{m.group(3)}]]",
-            text,
-        )
+        text = data.decode("utf-8")
+        new_text = _WIKI_LINK.sub(relink, text)
 
         if new_text != text:
             if dry_run:
@@ -252,7 +360,78 @@ _CATEGORY_DEFAULTS: dict[str, dict[str, str]] = {
 }
 
 
-def fix_frontmatter(vault_path: Path, dry_run: bool = False) -> int:
+def _fix_note(fm: dict, folder: str, name: str) -> bool:
+    """Apply the frontmatter fixes to *fm* in place; True if it changed."""
+    defaults = _CATEGORY_DEFAULTS.get(folder, {})
+    changed = False
+
+    # Sync category with folder
+    if fm.get("category") != folder:
+        logging.info(
+            "  Fix category: %s -> %s (%s)",
+            fm.get("category"),
+            folder,
+            name,
+        )
+        fm["category"] = folder
+        changed = True
+
+    # Ensure source
+    if fm.get("source") != "slack":
+        fm["source"] = "slack"
+        changed = True
+
+    # Add missing category-specific fields
+    for key, default in defaults.items():
+        if key not in fm:
+            fm[key] = default
+            changed = True
+            logging.info("  Add field %s=%r to %s", key, default, name)
+
+    # Migrate bare-word priority values to prefixed enum
+    raw_priority = str(fm.get("priority", "")).strip().lower()
+    if raw_priority in _PRIORITY_MIGRATE:
+        new_val = _PRIORITY_MIGRATE[raw_priority]
+        logging.info(
+            "  Migrate priority: %s -> %s (%s)",
+            fm["priority"],
+            new_val,
+            name,
+        )
+        fm["priority"] = new_val
+        changed = True
+
+    # Convert tags with spaces to kebab-case
+    tags = fm.get("tags")
+    if isinstance(tags, list):
+        new_tags = [
+            t.strip().replace(" ", "-") if isinstance(t, str) else t for t in tags
+        ]
+        if new_tags != tags:
+            logging.info("  Kebab-case tags: %s (%s)", new_tags, name)
+            fm["tags"] = new_tags
+            changed = True
+
+    return changed
+
+
+def _save_fixed(
+    md_file: Path, fm: dict, body: str, dry_run: bool, cache: FrontmatterCache
+) -> None:
+    """Write fixed frontmatter back (or just log it when *dry_run*)."""
+    if dry_run:
+        logging.info("[DRY RUN] Fix frontmatter: %s", md_file.name)
+    else:
+        _write_frontmatter(md_file, fm, body)
+        cache.forget(md_file)
+        logging.info("Fixed frontmatter: %s", md_file.name)
+
+
+def fix_frontmatter(
+    vault_path: Path,
+    dry_run: bool = False,
+    cache: FrontmatterCache | None = None,
+) -> int:
     """Sync frontmatter ``category`` with actual folder and add missing fields.
 
     For each note:
@@ -263,93 +442,96 @@ def fix_frontmatter(vault_path: Path, dry_run: bool = False) -> int:
     Args:
         vault_path: Root path of the Obsidian vault.
         dry_run: If True, log changes without writing.
+        cache: Frontmatter parsed by earlier passes of the same run.
 
     Returns:
         Number of files modified.
     """
+    cache = cache or FrontmatterCache()
     modified = 0
 
     for folder in VALID_FOLDERS - SKIP_FOLDERS:
-        folder_path = vault_path / folder
-        if not folder_path.exists():
-            continue
-
-        defaults = _CATEGORY_DEFAULTS.get(folder, {})
-
-        for md_file in sorted(folder_path.glob("*.md")):
-            fm, raw_yaml, body = _read_frontmatter(md_file)
+        for md_file in _folder_notes(vault_path / folder):
+            fm, _, body = cache.get(md_file)
             if fm is None:
                 continue
 
-            changed = False
-
-            # Sync category with folder
-            if fm.get("category") != folder:
-                logging.info(
-                    "  Fix category: %s -> %s (%s)",
-                    fm.get("category"),
-                    folder,
-                    md_file.name,
-                )
-                fm["category"] = folder
-                changed = True
-
-            # Ensure source
-            if fm.get("source") != "slack":
-                fm["source"] = "slack"
-                changed = True
-
-            # Add missing category-specific fields
-            for key, default in defaults.items():
-                if key not in fm:
-                    fm[key] = default
-                    changed = True
-                    logging.info("  Add field %s=%r to %s", key, default, md_file.name)
-
-            # Migrate bare-word priority values to prefixed enum
-            raw_priority = str(fm.get("priority", "")).strip().lower()
-            if raw_priority in _PRIORITY_MIGRATE:
-                new_val = _PRIORITY_MIGRATE[raw_priority]
-                logging.info(
-                    "  Migrate priority: %s -> %s (%s)",
-                    fm["priority"],
-                    new_val,
-                    md_file.name,
-                )
-                fm["priority"] = new_val
-                changed = True
-
-            # Convert tags with spaces to kebab-case
-            tags = fm.get("tags")
-            if isinstance(tags, list):
-                new_tags = [
-                    t.strip().replace(" ", "-") if isinstance(t, str) else t
-                    for t in tags
-                ]
-                if new_tags != tags:
-                    logging.info("  Kebab-case tags: %s (%s)", new_tags, md_file.name)
-                    fm["tags"] = new_tags
-                    changed = True
-
-            if changed:
+            if _fix_note(fm, folder, md_file.name):
                 modified += 1
-                if dry_run:
-                    logging.info("[DRY RUN] Fix frontmatter: %s", md_file.name)
-                else:
-                    _write_frontmatter(md_file, fm, body)
-                    logging.info("Fixed frontmatter: %s", md_file.name)
+                _save_fixed(md_file, fm, body, dry_run, cache)
 
     return modified
 
 
+def fix_and_rename(
+    vault_path: Path,
+    dry_run: bool = False,
+    cache: FrontmatterCache | None = None,
+) -> tuple[int, dict[str, str]]:
+    """Run :func:`fix_frontmatter` and :func:`rename_to_title_case` together.
+
+    Each note is read once, fixed, written back if needed and then renamed,
+    instead of walking the vault once per operation.
+
+    Returns:
+        ``(files_fixed, rename_map)`` as the two separate passes would.
+    """
+    cache = cache or FrontmatterCache()
+    modified = 0
+    rename_map: dict[str, str] = {}
+
+    for folder in VALID_FOLDERS - SKIP_FOLDERS:
+        for md_file in _folder_notes(vault_path / folder):
+            fm, _, body = cache.get(md_file)
+            if fm is not None and _fix_note(fm, folder, md_file.name):
+                modified += 1
+                _save_fixed(md_file, fm, body, dry_run, cache)
+
+            new_path = _rename_target(md_file, fm)
+            if new_path:
+                rename_map[md_file.stem] = new_path.stem
+                _rename_note(md_file, new_path, dry_run, cache)
+
+    return modified, rename_map
+
+
 # ------------------------------------------------------------------
 # reclassify_notes (AI-assisted)
 # ------------------------------------------------------------------
 
 _RECLASSIFY_PROMPT_FILE = Path(__file__).parent / "reclassify_prompt.md"
 
+# Gemini calls kept in flight at once while reclassifying, and the
+# requests-per-minute budget they share (Gemini free tier: 15 RPM for
+# flash — stay just under it; 0 disables the limit)
+RECLASSIFY_WORKERS = 8
+RECLASSIFY_RPM = 14
+
+
+class RateLimiter:
+    """Spaces request starts evenly to stay under a requests-per-minute cap."""
+
+    def __init__(self, rpm: int):
+        self.interval = 60.0 / rpm if rpm > 0 else 0.0
+        self._next_start = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Sleep until this caller's slot in the request schedule."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.interval
+        if start > now:
+            time.sleep(start - now)
 
-def reclassify_notes(vault_path: Path, dry_run: bool = False) -> int:
+
+def reclassify_notes(
+    vault_path: Path,
+    dry_run: bool = False,
+    cache: FrontmatterCache | None = None,
+    rpm: int = RECLASSIFY_RPM,
+) -> int:
     """Use Gemini to re-evaluate and improve note metadata.
 
     Requires ``GEMINI_API_KEY`` in the environment (loaded from ``.env``).
@@ -357,6 +539,8 @@ def reclassify_notes(vault_path: Path, dry_run: bool = False) -> int:
     Args:
         vault_path: Root path of the Obsidian vault.
         dry_run: If True, log proposed changes without writing.
+        cache: Frontmatter shared with later passes of the same run.
+        rpm: Gemini requests per minute across all workers (0=unlimited).
 
     Returns:
         Number of files modified.
@@ -365,30 +549,38 @@ def reclassify_notes(vault_path: Path, dry_run: bool = False) -> int:
 
     from .processor import _extract_json
 
+    cache = cache or FrontmatterCache()
     client = genai.Client()
+    template = _RECLASSIFY_PROMPT_FILE.read_text(encoding="utf-8")
     modified = 0
     total_tokens = 0
+    limiter = RateLimiter(rpm)
 
-    for folder in VALID_FOLDERS - SKIP_FOLDERS:
-        folder_path = vault_path / folder
-        if not folder_path.exists():
-            continue
-
-        for md_file in sorted(folder_path.glob("*.md")):
-            fm, _, body = _read_frontmatter(md_file)
-            if fm is None:
-                continue
+    def classify(prompt: str):
+        limiter.wait()
+        return client.models.generate_content(
+            model="gemini-2.5-flash",
+            contents=[prompt],
+        )
 
-            prompt = _RECLASSIFY_PROMPT_FILE.read_text(encoding="utf-8").format(
-                frontmatter=str(fm),
-                body=body[:500],
-            )
+    with ThreadPoolExecutor(max_workers=RECLASSIFY_WORKERS) as pool:
+        # Queue every note up front so several Gemini calls are in flight;
+        # results are applied one at a time, in vault order
+        pending = []
+        for folder in sorted(VALID_FOLDERS - SKIP_FOLDERS):
+            for md_file in _folder_notes(vault_path / folder):
+                fm, _, body = cache.get(md_file)
+                if fm is None:
+                    continue
+
+                prompt = template.format(frontmatter=str(fm), body=body[:500])
+                pending.append(
+                    (folder, md_file, fm, body, pool.submit(classify, prompt))
+                )
 
+        for folder, md_file, fm, body, future in pending:
             try:
-                response = client.models.generate_content(
-                    model="gemini-2.5-flash",
-                    contents=[prompt],
-                )
+                response = future.result()
             except Exception as e:
                 logging.error("Reclassify error for %s: %s", md_file.name, e)
                 continue
@@ -400,7 +592,7 @@ def reclassify_notes(vault_path: Path, dry_run: bool = False) -> int:
             )
             total_tokens += tokens
 
-            text = response.text or ""
+            text = _response_text(response)
             changes = _extract_json(text)
 
             if not changes:
@@ -426,6 +618,7 @@ def reclassify_notes(vault_path: Path, dry_run: bool = False) -> int:
                         )
                     else:
                         _write_frontmatter(md_file, fm, body)
+                        cache.forget(md_file)
                         dest.parent.mkdir(parents=True, exist_ok=True)
                         md_file.rename(dest)
                         logging.info(
@@ -443,6 +636,7 @@ def reclassify_notes(vault_path: Path, dry_run: bool = False) -> int:
                         )
                     else:
                         _write_frontmatter(md_file, fm, body)
+                        cache.forget(md_file)
                         logging.info(
                             "Updated metadata: %s -> %s", md_file.name, changes
                         )
@@ -464,6 +658,7 @@ def run_migration(
     update_links: bool = False,
     reclassify: bool = False,
     dry_run: bool = False,
+    rpm: int = RECLASSIFY_RPM,
 ) -> dict[str, int | dict]:
     """Run selected migration operations in the correct order.
 
@@ -476,6 +671,7 @@ def run_migration(
         update_links: Update wiki-links after renames.
         reclassify: Use Gemini to re-evaluate notes (requires API key).
         dry_run: Preview changes without writing.
+        rpm: Gemini requests-per-minute cap for reclassify (0=unlimited).
 
     Returns:
         Summary dict with counts for each operation performed.
@@ -488,22 +684,30 @@ def run_migration(
         reclassify = False
 
     summary: dict[str, int | dict] = {}
+    # Each pass walks the same notes; parse each one's YAML only once
+    cache = FrontmatterCache()
 
     if dry_run:
         logging.info("=== DRY RUN — no files will be modified ===")
 
     if reclassify:
         logging.info("--- Step 1: Reclassify notes (Gemini) ---")
-        summary["reclassified"] = reclassify_notes(vault_path, dry_run)
-
-    if fix_fm:
-        logging.info("--- Step 2: Fix frontmatter ---")
-        summary["frontmatter_fixed"] = fix_frontmatter(vault_path, dry_run)
+        summary["reclassified"] = reclassify_notes(vault_path, dry_run, cache, rpm)
 
     rename_map: dict[str, str] = {}
-    if rename:
+    if fix_fm and rename:
+        # Both steps visit every note: do them in a single walk
+        logging.info("--- Steps 2+3: Fix frontmatter and rename to Title Case ---")
+        fixed, rename_map = fix_and_rename(vault_path, dry_run, cache)
+        summary["frontmatter_fixed"] = fixed
+        summary["renamed"] = len(rename_map)
+        summary["rename_map"] = rename_map
+    elif fix_fm:
+        logging.info("--- Step 2: Fix frontmatter ---")
+        summary["frontmatter_fixed"] = fix_frontmatter(vault_path, dry_run, cache)
+    elif rename:
         logging.info("--- Step 3: Rename to Title Case ---")
-        rename_map = rename_to_title_case(vault_path, dry_run)
+        rename_map = rename_to_title_case(vault_path, dry_run, cache)
         summary["renamed"] = len(rename_map)
         summary["rename_map"] = rename_map
 
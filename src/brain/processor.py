@@ -3,21 +3,40 @@ processor.py — Gemini AI processing.
 
 Builds prompts, calls Gemini, parses structured JSON responses,
 and injects token usage into frontmatter.
+
+The google-genai SDK is only imported where a client is created, so
+the parsing helpers stay cheap to import (e.g. for ``brain migrate``).
 """
 
+import functools
 import json
 import logging
 import re
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from google import genai
+if TYPE_CHECKING:
+    from google.genai import types
 
 PROMPT_FILE = Path(__file__).parent / "prompt.md"
 
 # Size threshold: text files smaller than this are inlined in the prompt
 TEXT_INLINE_MAX_BYTES = 50 * 1024  # 50 KB
 
+# A ```json fenced block in a Gemini response
+_JSON_FENCE = re.compile(r"```json\s*\n(.*?)```", re.DOTALL)
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Bounds on the bare-object fallback: only this much of a reply is scanned,
+# and only this many "{" positions are tried before giving up
+JSON_SCAN_MAX_CHARS = 256 * 1024
+JSON_MAX_CANDIDATES = 8
+
+# An existing tokens_used line (with its newline) inside a frontmatter block
+_TOKENS_LINE = re.compile(r"^tokens_used:.*\n?", re.MULTILINE)
+
 # MIME types that Gemini can process as binary data parts
 GEMINI_BINARY_MIMES = frozenset(
     [
@@ -30,12 +49,28 @@ GEMINI_BINARY_MIMES = frozenset(
     ]
 )
 
+# Non-standard MIME spellings some clients send, mapped to the canonical form
+_MIME_ALIASES = {"image/jpg": "image/jpeg"}
+
+
+@functools.lru_cache(maxsize=16)
+def _read_prompt(path: Path, mtime_ns: int) -> str:
+    return path.read_text(encoding="utf-8")
+
+
+def load_prompt(path: Path) -> str:
+    """Read a prompt file, caching its contents until the file changes.
+
+    Only a ``stat()`` is paid per call; edits to the prompt are picked
+    up without restarting the service because the cache is keyed on
+    the file's modification time.
+    """
+    return _read_prompt(path, path.stat().st_mtime_ns)
+
 
 def _normalize_mime(mime: str) -> str:
     """Normalize common MIME type variants."""
-    if mime == "image/jpg":
-        return "image/jpeg"
-    return mime
+    return _MIME_ALIASES.get(mime, mime)
 
 
 def _extract_json(text: str) -> dict | None:
@@ -44,65 +79,79 @@ def _extract_json(text: str) -> dict | None:
 
     Strategy:
     1. Look for a ```json fenced block first.
-    2. Fall back to finding the outermost { ... } pair with brace balancing.
+    2. Fall back to decoding from each ``{`` in turn with the C-accelerated
+       ``raw_decode``, returning the first complete object (trailing prose
+       after it is ignored).  The scan is capped in both reply length and
+       number of candidates so a pathological reply cannot stall it.
     """
     # Strategy 1: fenced code block
-    fence_match = re.search(r"```json\s*\n(.*?)```", text, re.DOTALL)
+    fence_match = _JSON_FENCE.search(text)
     if fence_match:
         try:
             return json.loads(fence_match.group(1).strip())
         except json.JSONDecodeError:
             pass
 
-    # Strategy 2: balanced brace matching
+    # Strategy 2: first decodable object
+    if len(text) > JSON_SCAN_MAX_CHARS:
+        logging.warning(
+            "Gemini reply is %d chars, scanning only the first %d for JSON",
+            len(text),
+            JSON_SCAN_MAX_CHARS,
+        )
+        text = text[:JSON_SCAN_MAX_CHARS]
+
     start = text.find("{")
-    if start == -1:
-        return None
-
-    depth = 0
-    in_string = False
-    escape = False
-
-    for i, ch in enumerate(text[start:], start):
-        if escape:
-            escape = False
-            continue
-        if ch == "\\":
-            escape = True
-            continue
-        if ch == '"':
-            in_string = not in_string
-            continue
-        if in_string:
-            continue
-        if ch == "{":
-            depth += 1
-        elif ch == "}":
-            depth -= 1
-            if depth == 0:
-                try:
-                    return json.loads(text[start : i + 1])
-                except json.JSONDecodeError:
-                    return None
+    for _ in range(JSON_MAX_CANDIDATES):
+        if start == -1:
+            break
+        try:
+            data, _end = _JSON_DECODER.raw_decode(text, start)
+            return data
+        except json.JSONDecodeError:
+            start = text.find("{", start + 1)
 
     return None
 
 
+def _response_text(response: "types.GenerateContentResponse") -> str:
+    """
+    Return the text of a Gemini response.
+
+    Replies are almost always a single text part, which is returned
+    directly; ``response.text`` (which walks and joins every part of the
+    first candidate) is only used for multi-part replies.
+    """
+    candidates = response.candidates
+    if candidates:
+        content = candidates[0].content
+        parts = content.parts if content else None
+        if parts and len(parts) == 1 and parts[0].text is not None:
+            if not parts[0].thought:
+                return parts[0].text
+    return response.text or ""
+
+
 def _inject_tokens(content: str, tokens: int) -> str:
     """
     Inject tokens_used into frontmatter by parsing the YAML block
     rather than doing a fragile string replace.
+
+    Only the frontmatter is touched: the closing ``---`` must start a
+    line, so a ``---`` inside a value (or a horizontal rule in the body)
+    is never mistaken for it, and any ``tokens_used`` line Gemini already
+    emitted is replaced rather than duplicated.
     """
     if not content.startswith("---"):
         # No frontmatter — prepend one with just tokens_used
         return f"---\ntokens_used: {tokens}\n---\n{content}"
 
-    end = content.find("---", 3)
+    end = content.find("\n---", 3)
     if end == -1:
         return content
 
-    frontmatter_block = content[3:end]
-    rest = content[end:]
+    frontmatter_block = _TOKENS_LINE.sub("", content[3:end])
+    rest = content[end + 1 :]
 
     # Insert tokens_used as the last frontmatter field
     frontmatter_block = frontmatter_block.rstrip("\n") + f"\ntokens_used: {tokens}\n"
@@ -114,6 +163,8 @@ class GeminiProcessor:
     """Handles all Gemini AI interactions for note processing."""
 
     def __init__(self, existing_projects: list[str] | None = None):
+        from google import genai
+
         self.client = genai.Client()  # reads GEMINI_API_KEY from env
         self.model_name = "gemini-2.5-flash"
         self.existing_projects = existing_projects or []
@@ -152,7 +203,7 @@ class GeminiProcessor:
             if response.usage_metadata
             else 0
         )
-        text = response.text or ""
+        text = _response_text(response)
 
         # Try to parse structured JSON
         data = _extract_json(text)
@@ -182,7 +233,7 @@ class GeminiProcessor:
         attachment_context: list | None = None,
     ) -> list:
         """Build the multimodal prompt parts list."""
-        system_prompt = PROMPT_FILE.read_text(encoding="utf-8")
+        system_prompt = load_prompt(PROMPT_FILE)
 
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M")
 
@@ -0,0 +1,151 @@
+"""
+prompt_cache.py — Gemini explicit context caching for static prompts.
+
+Large system prompts (e.g. ``prompt.md``) are identical on every call.
+Rather than re-sending them with each Slack message, they are uploaded
+once as a Gemini cached-content resource and referenced by name, so
+only the per-message tail is billed at the full input-token rate.
+
+Caches are keyed by a hash of the prompt text, so editing a prompt file
+(or the directives folded into a prompt) simply produces a new cache on
+the next call.
+"""
+
+import hashlib
+import logging
+import threading
+from datetime import UTC, datetime, timedelta
+
+from google import genai
+from google.genai import types
+
+#: Lifetime requested for each cached prompt.
+CACHE_TTL = timedelta(hours=1)
+
+#: Re-create a cache this long before it expires so that in-flight
+#: requests never reference an expired resource.
+REFRESH_MARGIN = timedelta(minutes=5)
+
+#: Gemini rejects caches below a minimum token count (1024 for
+#: gemini-2.5-flash).  At roughly 4 characters per token, prompts shorter
+#: than this are sent inline without attempting to cache them.
+MIN_CACHE_CHARS = 4096
+
+
+class PromptCache:
+    """Creates and reuses Gemini cached-content resources for static prompts."""
+
+    def __init__(self, client: genai.Client, model_name: str):
+        self.client = client
+        self.model_name = model_name
+        # prompt hash -> (cache name or None if creation failed, expiry)
+        self._entries: dict[str, tuple[str | None, datetime]] = {}
+        self._lock = threading.Lock()
+        self._create_lock = threading.Lock()
+
+    @staticmethod
+    def _key(prompt: str) -> str:
+        return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+    def get(self, prompt: str) -> str | None:
+        """Return the cache name holding *prompt*, creating it if needed.
+
+        Returns ``None`` when the prompt is too small to cache or cache
+        creation failed — callers should then send the prompt inline.
+        Failures are remembered for one TTL so a broken cache does not
+        cost an extra API round-trip on every message.
+        """
+        if len(prompt) < MIN_CACHE_CHARS:
+            return None
+
+        key = self._key(prompt)
+        found, name = self._lookup(key)
+        if found:
+            return name
+
+        # Creation is a network round-trip, so it runs outside ``_lock``;
+        # ``_create_lock`` keeps concurrent callers from racing to create
+        # the same cache, and the re-check lets the losers reuse it.
+        with self._create_lock:
+            found, name = self._lookup(key)
+            if found:
+                return name
+
+            now = datetime.now(UTC)
+            try:
+                cache = self.client.caches.create(
+                    model=self.model_name,
+                    config=types.CreateCachedContentConfig(
+                        contents=[prompt],
+                        ttl=f"{int(CACHE_TTL.total_seconds())}s",
+                        display_name=f"2ndbrain-{key[:12]}",
+                    ),
+                )
+            except Exception as e:
+                logging.warning("Prompt cache unavailable, sending inline: %s", e)
+                self._store(key, None, now + CACHE_TTL)
+                return None
+
+            self._store(key, cache.name, cache.expire_time or now + CACHE_TTL)
+            logging.info("Created Gemini prompt cache %s", cache.name)
+            return cache.name
+
+    def _lookup(self, key: str) -> tuple[bool, str | None]:
+        """Return ``(True, name)`` for a fresh entry, else ``(False, None)``.
+
+        A fresh entry's name may itself be ``None``: a remembered failure.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[1] - datetime.now(UTC) > REFRESH_MARGIN:
+                return True, entry[0]
+            return False, None
+
+    def _store(self, key: str, name: str | None, expires: datetime) -> None:
+        """Record an entry, pruning expired ones.
+
+        Entries for superseded prompts (an edited prompt file or directive)
+        are never looked up again, so they go once their TTL has passed.
+        """
+        with self._lock:
+            now = datetime.now(UTC)
+            self._entries = {k: v for k, v in self._entries.items() if v[1] > now}
+            self._entries[key] = (name, expires)
+
+    def invalidate(self, prompt: str) -> None:
+        """Forget the cache for *prompt* (e.g. after it was rejected)."""
+        with self._lock:
+            self._entries.pop(self._key(prompt), None)
+
+    def generate(self, parts: list, config: types.GenerateContentConfig | None = None):
+        """Call Gemini with ``parts[0]`` served from the cache when possible.
+
+        ``parts[0]`` must be the static prefix (system prompt, directives);
+        everything per-message belongs in the remaining parts.  When a
+        cached copy exists only those are sent; if Gemini rejects the cache
+        (e.g. it expired early) the call is retried once with the prefix
+        inline.
+        """
+        prefix = parts[0]
+        cache_name = self.get(prefix)
+        if cache_name:
+            cached_config = (
+                config.model_copy(update={"cached_content": cache_name})
+                if config
+                else types.GenerateContentConfig(cached_content=cache_name)
+            )
+            try:
+                return self.client.models.generate_content(
+                    model=self.model_name,
+                    contents=parts[1:],
+                    config=cached_config,
+                )
+            except Exception as e:
+                logging.warning("Cached prompt rejected, retrying inline: %s", e)
+                self.invalidate(prefix)
+
+        return self.client.models.generate_content(
+            model=self.model_name,
+            contents=parts,
+            config=config,
+        )
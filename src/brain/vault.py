@@ -6,11 +6,19 @@ project discovery, and Obsidian Bases file generation.
 """
 
 import logging
+import os
 import re
 import shutil
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 
+#: Default vault location (the rclone mount of the Google Drive vault).
+DEFAULT_VAULT_PATH = Path.home() / "Documents" / "2ndBrain" / "2ndBrainVault"
+
 #: Directory containing .base and .md template files shipped with the package.
 _TEMPLATES_DIR = Path(__file__).parent / "vault_templates"
 
@@ -27,14 +35,26 @@ CATEGORIES = {
 
 VALID_FOLDERS = set(CATEGORIES.keys())
 
+# Parsed frontmatter kept per vault, least recently used evicted first.
+# Comfortably above the note count of a personal vault, while bounding the
+# entries left behind by notes that were deleted or renamed.
+FRONTMATTER_CACHE_MAX = 4096
+
 
 class Vault:
     """Manages all interactions with the Obsidian vault on disk."""
 
     def __init__(self, base_path: Path | None = None):
-        self.base_path = base_path or (
-            Path.home() / "Documents" / "2ndBrain" / "2ndBrainVault"
+        self.base_path = base_path or DEFAULT_VAULT_PATH
+        # (mtime_ns, directives) of the last directives.md read
+        self._directives_cache: tuple[int, list[str]] | None = None
+        # Bumped on every write this process makes (see content_version)
+        self._writes = 0
+        # path -> ((mtime_ns, size), frontmatter) for notes parsed recently
+        self._fm_cache: OrderedDict[Path, tuple[tuple[int, int], dict | None]] = (
+            OrderedDict()
         )
+        self._fm_cache_lock = threading.Lock()
         self._validate_vault()
         self._ensure_folders()
         self._ensure_files()
@@ -55,13 +75,19 @@ class Vault:
             self.base_path.mkdir(parents=True, exist_ok=True)
 
     def _ensure_folders(self):
-        """Create all category folders if they don't exist."""
+        """Create all category folders if they don't exist.
+
+        The vault root is listed once instead of stat-ing each folder —
+        on the rclone mount every syscall is a round-trip, so a warm start
+        costs a single directory read and no mkdir calls.
+        """
+        with os.scandir(self.base_path) as entries:
+            existing = {e.name for e in entries if e.is_dir()}
         for folder in CATEGORIES:
-            folder_path = self.base_path / folder
-            created = not folder_path.exists()
-            folder_path.mkdir(parents=True, exist_ok=True)
-            if created:
-                logging.info("Created category folder: %s/", folder)
+            if folder in existing:
+                continue
+            (self.base_path / folder).mkdir(parents=True, exist_ok=True)
+            logging.info("Created category folder: %s/", folder)
 
     def _ensure_brain_dir(self):
         """Create the _brain/ directory for system files (directives, etc.)."""
@@ -80,18 +106,28 @@ class Vault:
         """Read all directives from the persistent memory file.
 
         Returns a list of directive strings (one per bullet point).
+        The parsed list is cached against the file's mtime, so the
+        per-message cost is a single stat unless the file has changed
+        (including edits made in Obsidian).
         """
         path = self._directives_path
-        if not path.exists():
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except FileNotFoundError:
             return []
 
+        cached = self._directives_cache
+        if cached and cached[0] == mtime_ns:
+            return list(cached[1])
+
         text = path.read_text(encoding="utf-8")
         directives = []
         for line in text.splitlines():
             stripped = line.strip()
             if stripped.startswith("- "):
                 directives.append(stripped[2:].strip())
-        return directives
+        self._directives_cache = (mtime_ns, directives)
+        return list(directives)
 
     def add_directive(self, directive: str) -> list[str]:
         """Append a directive to the memory file. Returns the updated list."""
@@ -120,6 +156,8 @@ class Vault:
         for d in directives:
             lines.append(f"- {d}")
         self._directives_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        # Don't trust mtime alone: coarse mount timestamps can repeat
+        self._directives_cache = None
 
     # ------------------------------------------------------------------
     # Note writing
@@ -145,23 +183,50 @@ class Vault:
             logging.warning(f"Invalid folder '{folder}', falling back to Inbox")
             folder = "Inbox"
 
-        filename = f"{slug}.md"
         folder_path = self.base_path / folder
-        # Ensure folder exists (safety net for rclone sync delays)
-        folder_path.mkdir(parents=True, exist_ok=True)
-        file_path = folder_path / filename
-
-        # Deduplicate if file already exists
-        counter = 1
-        while file_path.exists():
-            filename = f"{slug}-{counter}.md"
-            file_path = folder_path / filename
-            counter += 1
 
-        file_path.write_text(content, encoding="utf-8")
+        # Create exclusively so an existing note is never overwritten; on a
+        # clash try the next suffix.  This needs no separate exists() probe
+        # per candidate and is safe when two messages pick the same slug.
+        counter = 0
+        made_folder = False
+        while True:
+            filename = f"{slug}-{counter}.md" if counter else f"{slug}.md"
+            file_path = folder_path / filename
+            try:
+                with open(file_path, "x", encoding="utf-8") as f:
+                    f.write(content)
+                break
+            except FileExistsError:
+                counter += 1
+            except FileNotFoundError:
+                # Folder missing (safety net for rclone sync delays).  Only
+                # retry once: a slug containing "/" would otherwise loop.
+                if made_folder:
+                    raise
+                folder_path.mkdir(parents=True, exist_ok=True)
+                made_folder = True
+
+        self._writes += 1
         logging.info(f"Saved note: {folder}/{filename}")
         return file_path
 
+    def content_version(self, folders: list[str] | None = None) -> tuple:
+        """Return a cheap token that changes when *folders* change.
+
+        Combines this process's write count with each folder's directory
+        mtime, which moves when notes are added, removed or renamed.  An
+        in-place edit made outside the bot (e.g. in Obsidian) does not
+        change it, so callers caching on it should also expire entries.
+        """
+        mtimes = []
+        for folder in folders or CATEGORIES:
+            try:
+                mtimes.append((self.base_path / folder).stat().st_mtime_ns)
+            except OSError:
+                mtimes.append(0)
+        return (self._writes, *mtimes)
+
     # ------------------------------------------------------------------
     # Note editing
     # ------------------------------------------------------------------
@@ -236,6 +301,7 @@ class Vault:
         new_fm = "\n".join(cleaned)
         new_text = f"---\n{new_fm}\n---{body}"
         file_path.write_text(new_text, encoding="utf-8")
+        self._writes += 1
         logging.info("Updated frontmatter in %s: %s", file_path.name, changed)
         return changed
 
@@ -263,10 +329,31 @@ class Vault:
                 return candidate
         return None
 
+    def get_note_metadata(self, file_path: Path) -> dict:
+        """Return the frontmatter fields of the note at *file_path*.
+
+        An empty dict is returned if the note has no frontmatter or
+        cannot be read.
+        """
+        return self._frontmatter(file_path) or {}
+
     # ------------------------------------------------------------------
     # Attachment handling
     # ------------------------------------------------------------------
 
+    def new_attachment_path(self, original_name: str) -> Path:
+        """
+        Choose the destination for a new attachment in the Attachments folder.
+
+        The filename is the sanitised original prefixed with a timestamp,
+        so callers can stream data straight into it.
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        clean_name = re.sub(r"[^a-zA-Z0-9._-]", "", original_name)
+        att_dir = self.base_path / "Attachments"
+        att_dir.mkdir(parents=True, exist_ok=True)
+        return att_dir / f"{timestamp}_{clean_name}"
+
     def save_attachment(self, original_name: str, data: bytes) -> str:
         """
         Save a binary attachment to the Attachments folder.
@@ -278,16 +365,11 @@ class Vault:
         Returns:
             The saved filename (for use in wiki-links).
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        clean_name = re.sub(r"[^a-zA-Z0-9._-]", "", original_name)
-        saved_filename = f"{timestamp}_{clean_name}"
-        att_dir = self.base_path / "Attachments"
-        att_dir.mkdir(parents=True, exist_ok=True)
-        save_path = att_dir / saved_filename
-
+        save_path = self.new_attachment_path(original_name)
         save_path.write_bytes(data)
-        logging.info(f"Saved attachment: Attachments/{saved_filename}")
-        return saved_filename
+        self._writes += 1
+        logging.info(f"Saved attachment: Attachments/{save_path.name}")
+        return save_path.name
 
     # ------------------------------------------------------------------
     # Project discovery
@@ -316,45 +398,62 @@ class Vault:
     # Vault scanning (for daily briefing)
     # ------------------------------------------------------------------
 
-    def scan_actions(self) -> list[dict]:
-        """
-        Read all action notes and parse their frontmatter.
-
-        Returns a list of dicts with keys: path, title, status,
-        due_date, priority, project.
+    def scan_all(
+        self, hours: int = 24, folders: list[str] | None = None
+    ) -> tuple[list[dict], list[dict], list[dict]]:
+        """Collect everything the daily briefing needs in one vault pass.
+
+        Returns ``(actions, recent, media_backlog)`` as described for
+        :meth:`scan_actions`, :meth:`scan_recent` and
+        :meth:`scan_media_backlog`.  Each category folder is listed once
+        and each note stat-ed once; frontmatter is only parsed for
+        actions, media and recently modified notes.  Pass *folders* to
+        walk only those folders (the results cover only them).
         """
-        actions_dir = self.base_path / "Actions"
-        results = []
-
-        for md_file in actions_dir.glob("*.md"):
-            fm = self._parse_frontmatter(md_file)
-            if fm:
-                results.append(
-                    {
-                        "path": md_file,
-                        "title": fm.get("title", md_file.stem),
-                        "status": fm.get("status", "todo"),
-                        "due_date": fm.get("due_date"),
-                        "priority": fm.get("priority", "medium"),
-                        "project": fm.get("project"),
-                    }
-                )
+        cutoff = time.time() - hours * 3600
+        actions: list[dict] = []
+        recent: list[dict] = []
+        media: list[dict] = []
+
+        for folder in folders or CATEGORIES:
+            try:
+                entries = list(os.scandir(self.base_path / folder))
+            except FileNotFoundError:
+                continue
 
-        return results
+            for entry in entries:
+                if not entry.name.endswith(".md") or not entry.is_file():
+                    continue
+                st = entry.stat()
+                is_recent = st.st_mtime > cutoff
+                if not is_recent and folder not in ("Actions", "Media"):
+                    continue
 
-    def scan_recent(self, hours: int = 24) -> list[dict]:
-        """Find all notes modified within the last N hours."""
-        from datetime import timedelta
+                md_file = Path(entry.path)
+                fm = self._frontmatter(md_file, st)
 
-        cutoff = datetime.now().timestamp() - timedelta(hours=hours).total_seconds()
-        results = []
+                if folder == "Actions" and fm:
+                    actions.append(
+                        {
+                            "path": md_file,
+                            "title": fm.get("title", md_file.stem),
+                            "status": fm.get("status", "todo"),
+                            "due_date": fm.get("due_date"),
+                            "priority": fm.get("priority", "medium"),
+                            "project": fm.get("project"),
+                        }
+                    )
+                elif folder == "Media" and fm and fm.get("status") == "to_consume":
+                    media.append(
+                        {
+                            "path": md_file,
+                            "title": fm.get("media_title", md_file.stem),
+                            "media_type": fm.get("media_type", "unknown"),
+                        }
+                    )
 
-        for folder in CATEGORIES:
-            folder_path = self.base_path / folder
-            for md_file in folder_path.glob("*.md"):
-                if md_file.stat().st_mtime > cutoff:
-                    fm = self._parse_frontmatter(md_file)
-                    results.append(
+                if is_recent:
+                    recent.append(
                         {
                             "path": md_file,
                             "folder": folder,
@@ -364,25 +463,24 @@ class Vault:
                         }
                     )
 
-        return results
+        return actions, recent, media
 
-    def scan_media_backlog(self) -> list[dict]:
-        """Find media items with status 'to_consume'."""
-        media_dir = self.base_path / "Media"
-        results = []
+    def scan_actions(self) -> list[dict]:
+        """
+        Read all action notes and parse their frontmatter.
 
-        for md_file in media_dir.glob("*.md"):
-            fm = self._parse_frontmatter(md_file)
-            if fm and fm.get("status") == "to_consume":
-                results.append(
-                    {
-                        "path": md_file,
-                        "title": fm.get("media_title", md_file.stem),
-                        "media_type": fm.get("media_type", "unknown"),
-                    }
-                )
+        Returns a list of dicts with keys: path, title, status,
+        due_date, priority, project.
+        """
+        return self.scan_all(folders=["Actions"])[0]
 
-        return results
+    def scan_recent(self, hours: int = 24) -> list[dict]:
+        """Find all notes modified within the last N hours."""
+        return self.scan_all(hours)[1]
+
+    def scan_media_backlog(self) -> list[dict]:
+        """Find media items with status 'to_consume'."""
+        return self.scan_all(folders=["Media"])[2]
 
     # ------------------------------------------------------------------
     # Vault search (used by agents)
@@ -431,7 +529,7 @@ class Vault:
 
                 # Parse frontmatter for markdown files only
                 is_md = file_path.suffix == ".md"
-                fm = self._parse_frontmatter(file_path) or {} if is_md else {}
+                fm = self._frontmatter(file_path) or {} if is_md else {}
 
                 if lower_keywords:
                     searchable = file_path.stem.lower()
@@ -499,7 +597,7 @@ class Vault:
                     continue
 
                 is_md = fp.suffix == ".md"
-                fm = (self._parse_frontmatter(fp) or {}) if is_md else {}
+                fm = (self._frontmatter(fp) or {}) if is_md else {}
                 stat = fp.stat()
 
                 # Word count from size estimate (avoids full read)
@@ -543,9 +641,52 @@ class Vault:
 
         This is a local operation — no Gemini call required.
         """
+        return self.grep_notes_multi([pattern], folders, max_results, context_chars)
+
+    def grep_notes_multi(
+        self,
+        patterns: list[str],
+        folders: list[str] | None = None,
+        max_results: int = 100,
+        context_chars: int = 80,
+    ) -> list[dict]:
+        """Search vault file contents for any of several text patterns.
+
+        The patterns are matched case-insensitively as one alternation, so
+        each file is read and scanned once however many terms there are.
+        Each result is as for :meth:`grep_notes`, plus ``matched_terms``
+        listing which of *patterns* were found in that file.
+        ``match_count`` counts hits of the combined pattern, one per
+        position, so where terms overlap ("foo" inside "foobar") the
+        longer term's occurrence is counted once.  For a single pattern
+        it is simply that pattern's number of occurrences.
+
+        ASCII-only terms (the usual case) are matched against the raw
+        file bytes, so only the snippets around hits are ever decoded.
+        """
+        terms = [p for p in dict.fromkeys(patterns) if p]
+        if not terms:
+            return []
+        # Longest first, so a term that extends another wins at a position
+        alternation = "|".join(
+            re.escape(t) for t in sorted(terms, key=len, reverse=True)
+        )
+        regex: re.Pattern
+        term_regexes: dict[str, re.Pattern]
+        if all(t.isascii() for t in terms):
+            # re folds ASCII case for bytes patterns, which is all we need
+            regex = re.compile(alternation.encode(), re.IGNORECASE)
+            read = Path.read_bytes
+            term_regexes = {
+                t: re.compile(re.escape(t.encode()), re.IGNORECASE) for t in terms
+            }
+        else:
+            regex = re.compile(alternation, re.IGNORECASE)
+            read = partial(Path.read_text, encoding="utf-8")
+            term_regexes = {t: re.compile(re.escape(t), re.IGNORECASE) for t in terms}
+
         search_folders = folders or list(CATEGORIES)
         search_folders = [f for f in search_folders if f in VALID_FOLDERS]
-        lower_pattern = pattern.lower()
         results: list[dict] = []
 
         for folder in search_folders:
@@ -558,41 +699,40 @@ class Vault:
                     continue
 
                 try:
-                    text = fp.read_text(encoding="utf-8")
+                    data = read(fp)
                 except Exception:
                     continue
 
-                lower_text = text.lower()
-                positions = []
-                start = 0
-                while True:
-                    idx = lower_text.find(lower_pattern, start)
-                    if idx == -1:
-                        break
-                    positions.append(idx)
-                    start = idx + 1
-
-                if not positions:
+                matches = list(regex.finditer(data))
+                if not matches:
                     continue
 
                 # Extract short snippets around each match
                 snippets: list[str] = []
-                for pos in positions[:3]:  # max 3 snippets per file
-                    snip_start = max(0, pos - context_chars)
-                    snip_end = min(len(text), pos + len(pattern) + context_chars)
-                    snippet = text[snip_start:snip_end].replace("\n", " ")
+                for m in matches[:3]:  # max 3 snippets per file
+                    snip_start = max(0, m.start() - context_chars)
+                    snip_end = min(len(data), m.end() + context_chars)
+                    snippet = data[snip_start:snip_end]
+                    if isinstance(snippet, bytes):
+                        # A cut multi-byte character at either edge is dropped
+                        snippet = snippet.decode("utf-8", "ignore")
+                    snippet = snippet.replace("\n", " ")
                     if snip_start > 0:
                         snippet = "..." + snippet
-                    if snip_end < len(text):
+                    if snip_end < len(data):
                         snippet = snippet + "..."
                     snippets.append(snippet)
 
+                # Checked per term: the alternation reports only one term
+                # per position, which would hide "foo" inside "foobar"
+                matched_terms = [t for t in terms if term_regexes[t].search(data)]
                 results.append(
                     {
                         "filename": fp.name,
                         "folder": folder,
-                        "match_count": len(positions),
+                        "match_count": len(matches),
                         "snippets": snippets,
+                        "matched_terms": matched_terms,
                     }
                 )
 
@@ -605,6 +745,36 @@ class Vault:
     # Frontmatter parsing
     # ------------------------------------------------------------------
 
+    def _frontmatter(
+        self, file_path: Path, st: os.stat_result | None = None
+    ) -> dict | None:
+        """Parsed frontmatter of *file_path*, cached against mtime and size.
+
+        Briefings and agent searches read the same notes again and again;
+        over the rclone mount a stat is far cheaper than a read, so only
+        notes that changed since the last call are parsed again.  Returns
+        a copy, so callers may modify it freely.  Pass *st* if the caller
+        has already stat-ed the file.
+        """
+        if st is None:
+            try:
+                st = file_path.stat()
+            except OSError:
+                return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._fm_cache_lock:
+            cached = self._fm_cache.get(file_path)
+            if cached is not None and cached[0] == stamp:
+                self._fm_cache.move_to_end(file_path)
+        if cached is None or cached[0] != stamp:
+            cached = (stamp, self._parse_frontmatter(file_path))
+            with self._fm_cache_lock:
+                self._fm_cache[file_path] = cached
+                self._fm_cache.move_to_end(file_path)
+                while len(self._fm_cache) > FRONTMATTER_CACHE_MAX:
+                    self._fm_cache.popitem(last=False)
+        return dict(cached[1]) if cached[1] is not None else None
+
     @staticmethod
     def _parse_frontmatter(file_path: Path) -> dict | None:
         """
@@ -0,0 +1,62 @@
+"""Tests for the daily briefing."""
+
+from datetime import date
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from brain import briefing
+from brain.briefing import _parse_due
+from brain.vault import Vault
+
+
+def test_parse_due() -> None:
+    assert _parse_due("2025-03-07") == date(2025, 3, 7)
+    # Hand-edited dates without zero padding still parse
+    assert _parse_due("2025-3-7") == date(2025, 3, 7)
+    assert _parse_due("next week") is None
+    assert _parse_due("2025-02-30") is None
+
+
+def test_repeated_all_clear_posted_once(tmp_path: Path) -> None:
+    vault = Vault(base_path=tmp_path / "vault")
+    client = MagicMock()
+
+    with patch.object(briefing, "_last_posted", None):
+        briefing._run_briefing(client, vault, "C123")
+        briefing._run_briefing(client, vault, "C123")
+
+    client.chat_postMessage.assert_called_once_with(
+        channel="C123", text=briefing.ALL_CLEAR
+    )
+
+
+def test_briefing_layout() -> None:
+    vault = MagicMock()
+    vault.scan_all.return_value = (
+        [
+            {"title": "Late", "status": "open", "due_date": "2025-03-05"},
+            {
+                "title": "Now",
+                "status": "open",
+                "due_date": "2025-03-07",
+                "project": "P",
+            },
+            {"title": "Done", "status": "done", "due_date": "2025-03-01"},
+        ],
+        [{"title": "Note", "folder": "Notes"}],
+        [],
+    )
+
+    text = briefing._build_briefing(vault, today=date(2025, 3, 7))
+
+    assert text == (
+        "*☀️ Morning Briefing — Friday 07 March*\n"
+        "*🔴 Overdue*\n"
+        "  • ‼️ Late — 2d overdue\n"
+        "\n"
+        "*📌 Due Today*\n"
+        "  • Now (P)\n"
+        "\n"
+        "*📥 Yesterday's Captures*\n"
+        "  • Note → `Notes/`"
+    )
@@ -0,0 +1,87 @@
+"""Tests for the local cache of filing classifications."""
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from google.genai import types
+
+# Set a fake API key so ``genai.Client()`` doesn't raise during tests.
+os.environ.setdefault("GEMINI_API_KEY", "test-key")
+
+from brain.agents.base import MessageContext  # noqa: E402
+from brain.agents.filing import FilingAgent, _refresh_date  # noqa: E402
+from brain.filing_cache import (  # noqa: E402
+    CACHE_MAX_AGE_SECONDS,
+    FilingCache,
+    fingerprint,
+)
+from brain.vault import Vault  # noqa: E402
+
+DATA = {"folder": "Inbox", "slug": "Idea", "content": "---\ndate: x\n---\nbody"}
+
+
+def test_roundtrip(tmp_path: Path) -> None:
+    cache = FilingCache(tmp_path / "filing.db")
+    key = fingerprint("https://example.com", [])
+
+    assert cache.get(key) is None
+    cache.put(key, DATA)
+    assert cache.get(key) == DATA
+
+
+def test_expired_entries_pruned_on_open(tmp_path: Path, monkeypatch) -> None:
+    db = tmp_path / "filing.db"
+    note = tmp_path / "note.md"
+    note.write_text("x", encoding="utf-8")
+    key = fingerprint("old", [])
+
+    cache = FilingCache(db)
+    real_time = time.time
+    monkeypatch.setattr(time, "time", lambda: real_time() - CACHE_MAX_AGE_SECONDS - 1)
+    cache.put(key, DATA)
+    monkeypatch.undo()
+
+    assert FilingCache(db).get(key) is None
+
+
+def test_fingerprint_includes_attachments() -> None:
+    image = types.Part.from_bytes(data=b"\x89PNG", mime_type="image/png")
+    other = types.Part.from_bytes(data=b"\x89PNG2", mime_type="image/png")
+    assert fingerprint("x", [image]) != fingerprint("x", [other])
+    assert fingerprint("x", [image]) == fingerprint("x", [image])
+    assert fingerprint("x", ["a"]) != fingerprint("x", [])
+
+
+def test_refresh_date() -> None:
+    content = "---\ntitle: T\ndate: 2020-01-01T00:00:00\n---\ndate: in body"
+    refreshed = _refresh_date(content)
+    assert "date: 2020" not in refreshed
+    assert refreshed.endswith("---\ndate: in body")
+
+
+def test_repeat_capture_filed_again_without_gemini(tmp_path: Path) -> None:
+    vault = Vault(base_path=tmp_path / "vault")
+    agent = FilingAgent(filing_cache=FilingCache(tmp_path / "filing.db"))
+    response = MagicMock()
+    response.usage_metadata.total_token_count = 50
+    response.text = (
+        '{"folder": "Actions", "slug": "Buy Milk", '
+        '"content": "---\\ntitle: Buy Milk\\n---\\nBuy milk"}'
+    )
+
+    def capture():
+        return agent.handle(
+            MessageContext(raw_text="buy milk", attachment_context=[], vault=vault)
+        )
+
+    with patch.object(agent.prompt_cache, "generate", return_value=response) as gen:
+        first = capture()
+        second = capture()
+
+    assert gen.call_count == 1
+    assert first.filed_path is not None and second.filed_path is not None
+    assert first.filed_path != second.filed_path
+    assert second.filed_path.exists()
+    assert second.tokens_used == 0
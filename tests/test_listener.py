@@ -0,0 +1,205 @@
+"""Tests for Slack listener helpers."""
+
+from collections import OrderedDict
+from unittest.mock import MagicMock
+
+import pytest
+
+from brain import listener
+
+
+@pytest.fixture(autouse=True)
+def _fresh_seen_events(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(listener, "_seen_events", OrderedDict())
+    monkeypatch.setattr(listener, "_thread_cache", OrderedDict())
+    monkeypatch.setattr(listener, "_oembed_cache", OrderedDict())
+
+
+class TestDuplicateEvents:
+    """Tests for dropping redelivered Slack events."""
+
+    def test_first_delivery_is_new(self) -> None:
+        assert not listener._is_duplicate_event("C1", "1.0")
+
+    def test_redelivery_is_duplicate(self) -> None:
+        listener._is_duplicate_event("C1", "1.0")
+        assert listener._is_duplicate_event("C1", "1.0")
+
+    def test_same_ts_other_channel_is_new(self) -> None:
+        listener._is_duplicate_event("C1", "1.0")
+        assert not listener._is_duplicate_event("C2", "1.0")
+
+    def test_oldest_entries_evicted(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(listener, "SEEN_EVENTS_MAX", 2)
+        for ts in ("1.0", "2.0", "3.0"):
+            listener._is_duplicate_event("C1", ts)
+        assert not listener._is_duplicate_event("C1", "1.0")
+        assert listener._is_duplicate_event("C1", "3.0")
+
+
+class TestThreadCache:
+    """Tests for reusing thread history across follow-ups."""
+
+    @staticmethod
+    def _client() -> MagicMock:
+        client = MagicMock()
+        client.conversations_replies.return_value = {
+            "messages": [
+                {"ts": "1.0", "text": "save this"},
+                {"ts": "1.1", "text": "Filed", "bot_id": "B1"},
+                {"ts": "1.2", "text": "and this"},
+            ]
+        }
+        return client
+
+    def test_follow_up_served_from_cache(self) -> None:
+        client = self._client()
+        listener._fetch_thread_history(client, "C1", "1.0", "1.2")
+        listener._extend_thread(
+            "C1",
+            "1.0",
+            [{"role": "user", "text": "and this"}, {"role": "assistant", "text": "Ok"}],
+        )
+
+        history = listener._fetch_thread_history(client, "C1", "1.0", "1.3")
+
+        assert client.conversations_replies.call_count == 1
+        assert [m["text"] for m in history] == ["save this", "Filed", "and this", "Ok"]
+        assert history[1]["role"] == "assistant"
+
+    def test_forget_forces_refetch(self) -> None:
+        client = self._client()
+        listener._fetch_thread_history(client, "C1", "1.0", "1.2")
+        listener._forget_thread("C1", "1.0")
+        listener._fetch_thread_history(client, "C1", "1.0", "1.2")
+        assert client.conversations_replies.call_count == 2
+
+    def test_extend_uncached_thread_is_ignored(self) -> None:
+        listener._extend_thread("C1", "1.0", [{"role": "user", "text": "hi"}])
+        assert listener._cached_thread("C1", "1.0") is None
+
+
+class TestOembedCache:
+    """Tests for remembering oEmbed lookups per URL."""
+
+    URL = "https://www.youtube.com/watch?v=abc"
+
+    def test_repeat_url_not_refetched(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        session = MagicMock()
+        session.get.return_value.json.return_value = {
+            "title": "A Talk",
+            "author_name": "Someone",
+        }
+        monkeypatch.setattr(listener, "_OEMBED_SESSION", session)
+
+        first = listener._fetch_url_titles(f"<{self.URL}>")
+        second = listener._fetch_url_titles(f"see <{self.URL}|this>")
+
+        assert session.get.call_count == 1
+        assert first == second
+        assert '"A Talk"' in first
+
+    def test_several_links_keep_order(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        def get(endpoint: str, params: dict, timeout: int) -> MagicMock:
+            resp = MagicMock()
+            resp.json.return_value = {"title": params["url"][-1]}
+            return resp
+
+        monkeypatch.setattr(listener._OEMBED_SESSION, "get", get)
+        text = " ".join(f"<https://youtu.be/{c}>" for c in "abc")
+
+        lines = listener._fetch_url_titles(text).splitlines()
+
+        assert [line.split('"')[1] for line in lines] == ["a", "b", "c"]
+
+    def test_endpoint_chosen_by_hostname(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        session = MagicMock()
+        session.get.return_value.json.return_value = {"title": "T"}
+        monkeypatch.setattr(listener, "_OEMBED_SESSION", session)
+
+        # Provider names in the path or query do not count
+        assert listener._fetch_url_titles("<https://example.com/youtube.com>") == ""
+        assert session.get.call_count == 0
+
+        listener._fetch_url_titles("<https://www.vimeo.com/123>")
+        assert session.get.call_args.args[0] == "https://vimeo.com/api/oembed.json"
+
+    def test_failure_cached_briefly(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        session = MagicMock()
+        session.get.side_effect = OSError("down")
+        monkeypatch.setattr(listener, "_OEMBED_SESSION", session)
+
+        assert listener._fetch_url_titles(f"<{self.URL}>") == ""
+        assert listener._fetch_url_titles(f"<{self.URL}>") == ""
+        assert session.get.call_count == 1
+        expiry, result = listener._oembed_cache[self.URL]
+        assert result is None
+
+
+class TestShortMessages:
+    """Tests for the minimum-length check on incoming messages."""
+
+    @staticmethod
+    def _handler(monkeypatch: pytest.MonkeyPatch, router: MagicMock):
+        monkeypatch.setenv("SLACK_BOT_TOKEN", "xoxb-test")
+        handlers = {}
+        app = MagicMock()
+        app.event.return_value = lambda fn: handlers.setdefault("message", fn)
+        listener.register_listeners(app, MagicMock(), router)
+        return handlers["message"]
+
+    def test_short_top_level_message_rejected(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        router = MagicMock()
+        handle = self._handler(monkeypatch, router)
+        say = MagicMock()
+
+        handle({"text": "ok", "channel": "C1", "ts": "1.0"}, say, MagicMock())
+
+        router.route.assert_not_called()
+        assert "Not enough" in say.call_args.args[0]
+
+    def test_short_thread_reply_routed(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        router = MagicMock()
+        router.route.return_value.response_text = "Done"
+        handle = self._handler(monkeypatch, router)
+        say = MagicMock()
+        event = {"text": "2", "channel": "C1", "ts": "1.2", "thread_ts": "1.0"}
+
+        handle(event, say, MagicMock())
+
+        router.route.assert_called_once()
+        say.assert_called_once_with("Done", thread_ts="1.0")
+
+
+class TestSlackToken:
+    """Tests for the download Authorization header."""
+
+    def test_header_built_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(listener, "_slack_auth_headers", {})
+        listener._set_slack_token(" xoxb-123 \n")
+        assert listener._slack_auth_headers == {"Authorization": "Bearer xoxb-123"}
+
+    def test_missing_token_rejected(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(listener, "_slack_auth_headers", {})
+        with pytest.raises(ValueError):
+            listener._set_slack_token("  ")
+        with pytest.raises(ValueError):
+            listener._open_slack_download("https://files.slack.com/x")
+
+
+class TestLooksBinary:
+    """Tests for the pre-decode binary check."""
+
+    def test_media_mime_is_binary(self) -> None:
+        assert listener._looks_binary("video/mp4", b"plain bytes")
+
+    def test_nul_byte_is_binary(self) -> None:
+        assert listener._looks_binary("application/octet-stream", b"PK\x03\x04\x00")
+
+    def test_text_is_not_binary(self) -> None:
+        assert not listener._looks_binary("application/x-python", b"print('hi')\n")
+
+    def test_svg_is_not_binary(self) -> None:
+        assert not listener._looks_binary("image/svg+xml", b"<svg></svg>")
@@ -1,18 +1,25 @@
 """Tests for vault migration utilities."""
 
+import shutil
 import textwrap
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from brain import migrate
 from brain.migrate import (
+    FrontmatterCache,
     _is_hyphenated_slug,
     _read_frontmatter,
     _slug_to_title,
     _title_to_filename,
     _write_frontmatter,
+    fix_and_rename,
     fix_frontmatter,
+    reclassify_notes,
     rename_to_title_case,
+    run_migration,
     update_wiki_links,
 )
 
@@ -230,6 +237,64 @@ class TestFrontmatter:
         assert fm is None
 
 
+class TestFrontmatterCache:
+    def test_parses_once_until_rewritten(
+        self, vault: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        calls: list[Path] = []
+        real_read = migrate._read_frontmatter
+
+        def counting_read(path: Path, **kwargs):
+            calls.append(path)
+            return real_read(path, **kwargs)
+
+        monkeypatch.setattr(migrate, "_read_frontmatter", counting_read)
+        cache = FrontmatterCache()
+        note = vault / "Media" / "faithless-englefield-estate.md"
+
+        fm, _, body = cache.get(note)
+        assert fm is not None
+        fm["title"] = "Changed"
+        fm2, _, _ = cache.get(note)
+        assert fm2 is not None
+        assert fm2["title"] == "Faithless at Englefield Estate"
+        assert len(calls) == 1
+
+        _write_frontmatter(note, fm, body)
+        cache.forget(note)
+        fm3, _, _ = cache.get(note)
+        assert fm3 is not None
+        assert fm3["title"] == "Changed"
+        assert len(calls) == 2
+
+    def test_read_only_entry_upgraded_for_writers(self, vault: Path):
+        cache = FrontmatterCache()
+        note = vault / "Reference" / "android-slack-share-sheet-shortcut.md"
+
+        fm, _, body = cache.get(note, round_trip=False)
+        assert fm is not None
+        assert type(fm["tags"]) is list
+
+        fm, _, body = cache.get(note)
+        assert fm is not None
+        _write_frontmatter(note, fm, body)
+        # Round-trip parse keeps the original quoting
+        assert 'title: "Android: Add Slack Channel to Share Sheet"' in (
+            note.read_text(encoding="utf-8")
+        )
+
+    def test_shared_across_passes(self, vault: Path):
+        cache = FrontmatterCache()
+        fix_frontmatter(vault, cache=cache)
+        rename_map = rename_to_title_case(vault, cache=cache)
+
+        assert "android-slack-share-sheet-shortcut" in rename_map
+        ref = vault / "Reference" / "Android Add Slack Channel to Share Sheet.md"
+        fm, _, _ = _read_frontmatter(ref)
+        assert fm is not None
+        assert fm["category"] == "Reference"
+
+
 # ------------------------------------------------------------------
 # Integration tests: rename
 # ------------------------------------------------------------------
@@ -282,6 +347,31 @@ class TestUpdateWikiLinks:
         assert "[[brain-project-setup]]" not in text
         assert "[[faithless-englefield-estate]]" not in text
 
+    def test_aliases_embeds_and_other_links(self, vault: Path):
+        note = vault / "Inbox" / "Links.md"
+        note.write_text(
+            "[[old-a|shown]] ![[old-a]] [[other]] [[old-a#Heading]]\n",
+            encoding="utf-8",
+        )
+        system = vault / "_brain" / "Links.md"
+        system.write_text("[[old-a]]\n", encoding="utf-8")
+
+        assert update_wiki_links(vault, {"old-a": "New A"}) == 1
+
+        assert note.read_text(encoding="utf-8") == (
+            "[[New A|shown]] ![[New A]] [[other]] [[old-a#Heading]]\n"
+        )
+        assert system.read_text(encoding="utf-8") == "[[old-a]]\n"
+
+    def test_stray_brackets_do_not_hide_links(self, vault: Path):
+        note = vault / "Inbox" / "Stray.md"
+        note.write_text("Typed [[ by mistake, see [[old-a]]\n", encoding="utf-8")
+
+        assert update_wiki_links(vault, {"old-a": "New A"}) == 1
+        assert note.read_text(encoding="utf-8") == (
+            "Typed [[ by mistake, see [[New A]]\n"
+        )
+
     def test_empty_rename_map(self, vault: Path):
         assert update_wiki_links(vault, {}) == 0
 
@@ -319,3 +409,75 @@ class TestFixFrontmatter:
         fm, _, _ = _read_frontmatter(ref_note)
         assert fm is not None
         assert fm["category"] == "Inbox"  # Still wrong
+
+
+class TestFixAndRename:
+    def test_matches_separate_passes(
+        self, vault: Path, tmp_path_factory: pytest.TempPathFactory
+    ):
+        other = tmp_path_factory.mktemp("other")
+        shutil.copytree(vault, other, dirs_exist_ok=True)
+
+        fixed = fix_frontmatter(other)
+        rename_map = rename_to_title_case(other)
+
+        assert fix_and_rename(vault) == (fixed, rename_map)
+        for path in sorted(other.rglob("*.md")):
+            fused = vault / path.relative_to(other)
+            assert fused.read_text(encoding="utf-8") == path.read_text(encoding="utf-8")
+
+    def test_run_migration_uses_fused_pass(self, vault: Path):
+        summary = run_migration(vault, fix_fm=True, rename=True, update_links=True)
+
+        assert summary["renamed"] == 4
+        assert summary["links_updated"] == 1
+        ref = vault / "Reference" / "Android Add Slack Channel to Share Sheet.md"
+        fm, _, _ = _read_frontmatter(ref)
+        assert fm is not None
+        assert fm["category"] == "Reference"
+
+
+# ------------------------------------------------------------------
+# Integration tests: reclassify_notes
+# ------------------------------------------------------------------
+
+
+class TestReclassifyNotes:
+    def test_rate_limit_spaces_requests(
+        self, vault: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        sleeps: list[float] = []
+        monkeypatch.setattr(migrate.time, "monotonic", lambda: 100.0)
+        monkeypatch.setattr(migrate.time, "sleep", sleeps.append)
+
+        client = MagicMock()
+        client.models.generate_content.return_value.text = "{}"
+        with patch("google.genai.Client", return_value=client):
+            reclassify_notes(vault, rpm=30)
+
+        # Four notes at 30 RPM: the first starts at once, then every 2s
+        assert sorted(sleeps) == [2.0, 4.0, 6.0]
+
+    def test_moves_each_note_once(self, vault: Path):
+        def generate(model: str, contents: list[str]) -> MagicMock:
+            response = MagicMock()
+            response.usage_metadata.total_token_count = 10
+            if "Faithless" in contents[0]:
+                response.text = '{"category": "Reference"}'
+            else:
+                response.text = "{}"
+            return response
+
+        client = MagicMock()
+        client.models.generate_content.side_effect = generate
+        with patch("google.genai.Client", return_value=client):
+            modified = reclassify_notes(vault, rpm=0)
+
+        assert modified == 1
+        # One call per note outside the skipped folders; the moved note is
+        # not picked up again from its new folder
+        assert client.models.generate_content.call_count == 4
+        moved = vault / "Reference" / "faithless-englefield-estate.md"
+        fm, _, _ = _read_frontmatter(moved)
+        assert fm is not None
+        assert fm["category"] == "Reference"
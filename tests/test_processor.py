@@ -0,0 +1,116 @@
+"""Tests for Gemini response processing helpers."""
+
+import os
+from pathlib import Path
+
+from google.genai import types
+
+from brain.processor import (
+    JSON_MAX_CANDIDATES,
+    _extract_json,
+    _inject_tokens,
+    _response_text,
+    load_prompt,
+)
+
+
+class TestLoadPrompt:
+    """Tests for the mtime-keyed prompt file cache."""
+
+    def test_reads_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "prompt.md"
+        path.write_text("# System\nBe helpful.", encoding="utf-8")
+        assert load_prompt(path) == "# System\nBe helpful."
+
+    def test_picks_up_edits(self, tmp_path: Path) -> None:
+        path = tmp_path / "prompt.md"
+        path.write_text("v1", encoding="utf-8")
+        assert load_prompt(path) == "v1"
+
+        path.write_text("v2", encoding="utf-8")
+        # Force a distinct mtime in case the filesystem clock is coarse
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert load_prompt(path) == "v2"
+
+
+class TestExtractJson:
+    """Tests for pulling the JSON payload out of a Gemini reply."""
+
+    def test_fenced_block(self) -> None:
+        text = 'Here you go:\n```json\n{"folder": "Inbox"}\n```\nDone.'
+        assert _extract_json(text) == {"folder": "Inbox"}
+
+    def test_bare_object_with_surrounding_prose(self) -> None:
+        text = 'Sure! {"folder": "Media", "slug": "x"} Hope that helps {:}'
+        assert _extract_json(text) == {"folder": "Media", "slug": "x"}
+
+    def test_braces_inside_strings(self) -> None:
+        text = '{"content": "use {curly} braces \\" and }", "folder": "Reference"}'
+        assert _extract_json(text) == {
+            "content": 'use {curly} braces " and }',
+            "folder": "Reference",
+        }
+
+    def test_skips_unparseable_brace(self) -> None:
+        text = 'Set {x} then {"intent": "file"}'
+        assert _extract_json(text) == {"intent": "file"}
+
+    def test_no_json(self) -> None:
+        assert _extract_json("Just a plain answer.") is None
+
+    def test_gives_up_after_candidate_limit(self) -> None:
+        text = "{x} " * JSON_MAX_CANDIDATES + '{"intent": "file"}'
+        assert _extract_json(text) is None
+        assert _extract_json(text[4:]) == {"intent": "file"}
+
+
+class TestInjectTokens:
+    """Tests for adding tokens_used to a note's frontmatter."""
+
+    def test_appends_to_frontmatter(self) -> None:
+        content = "---\ntitle: Note\ntags:\n  - a\n---\nBody\n"
+        assert _inject_tokens(content, 42) == (
+            "---\ntitle: Note\ntags:\n  - a\ntokens_used: 42\n---\nBody\n"
+        )
+
+    def test_no_frontmatter(self) -> None:
+        assert _inject_tokens("Body", 7) == "---\ntokens_used: 7\n---\nBody"
+
+    def test_ignores_dashes_inside_values_and_body(self) -> None:
+        content = "---\ntitle: A---B\n---\nBody\n\n---\n\ntags: not frontmatter\n"
+        result = _inject_tokens(content, 5)
+        assert result == (
+            "---\ntitle: A---B\ntokens_used: 5\n---\nBody\n\n---\n\n"
+            "tags: not frontmatter\n"
+        )
+
+    def test_replaces_existing_tokens_used(self) -> None:
+        content = "---\ntitle: Note\ntokens_used: 0\nsource: slack\n---\nBody"
+        assert _inject_tokens(content, 99) == (
+            "---\ntitle: Note\nsource: slack\ntokens_used: 99\n---\nBody"
+        )
+
+
+def _response(*parts: types.Part) -> types.GenerateContentResponse:
+    return types.GenerateContentResponse(
+        candidates=[types.Candidate(content=types.Content(parts=list(parts)))]
+    )
+
+
+class TestResponseText:
+    """Tests for reading the text out of a Gemini response."""
+
+    def test_single_part(self) -> None:
+        assert _response_text(_response(types.Part(text="hello"))) == "hello"
+
+    def test_multiple_parts_joined(self) -> None:
+        reply = _response(types.Part(text="a"), types.Part(text="b"))
+        assert _response_text(reply) == "ab"
+
+    def test_thought_part_skipped(self) -> None:
+        reply = _response(types.Part(text="thinking", thought=True))
+        assert _response_text(reply) == ""
+
+    def test_no_candidates(self) -> None:
+        assert _response_text(types.GenerateContentResponse()) == ""
@@ -0,0 +1,91 @@
+"""Tests for Gemini prompt caching."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+from brain.prompt_cache import MIN_CACHE_CHARS, PromptCache
+
+LARGE_PROMPT = "x" * MIN_CACHE_CHARS
+
+
+def _make_cache(
+    expire_in: timedelta = timedelta(hours=1),
+) -> tuple[PromptCache, MagicMock]:
+    client = MagicMock()
+    client.caches.create.return_value = MagicMock(
+        expire_time=datetime.now(UTC) + expire_in
+    )
+    client.caches.create.return_value.name = "cachedContents/abc"
+    return PromptCache(client, "gemini-2.5-flash"), client
+
+
+def test_small_prompt_not_cached() -> None:
+    cache, client = _make_cache()
+    assert cache.get("short prompt") is None
+    client.caches.create.assert_not_called()
+
+
+def test_cache_created_once_and_reused() -> None:
+    cache, client = _make_cache()
+    assert cache.get(LARGE_PROMPT) == "cachedContents/abc"
+    assert cache.get(LARGE_PROMPT) == "cachedContents/abc"
+    client.caches.create.assert_called_once()
+
+
+def test_cache_recreated_near_expiry() -> None:
+    cache, client = _make_cache(expire_in=timedelta(minutes=1))
+    cache.get(LARGE_PROMPT)
+    cache.get(LARGE_PROMPT)
+    assert client.caches.create.call_count == 2
+
+
+def test_changed_prompt_gets_new_cache() -> None:
+    cache, client = _make_cache()
+    cache.get(LARGE_PROMPT)
+    cache.get(LARGE_PROMPT + "edited")
+    assert client.caches.create.call_count == 2
+
+
+def test_creation_failure_falls_back_inline() -> None:
+    cache, client = _make_cache()
+    client.caches.create.side_effect = RuntimeError("too small")
+    assert cache.get(LARGE_PROMPT) is None
+    # Failure is remembered — no second API call
+    assert cache.get(LARGE_PROMPT) is None
+    client.caches.create.assert_called_once()
+
+
+def test_generate_sends_only_tail_when_cached() -> None:
+    cache, client = _make_cache()
+    cache.generate([LARGE_PROMPT, "question"])
+    kwargs = client.models.generate_content.call_args.kwargs
+    assert kwargs["contents"] == ["question"]
+    assert kwargs["config"].cached_content == "cachedContents/abc"
+
+
+def test_generate_retries_inline_when_cache_rejected() -> None:
+    cache, client = _make_cache()
+    client.models.generate_content.side_effect = [RuntimeError("expired"), "ok"]
+    assert cache.generate([LARGE_PROMPT, "question"]) == "ok"
+    kwargs = client.models.generate_content.call_args.kwargs
+    assert kwargs["contents"] == [LARGE_PROMPT, "question"]
+
+
+def test_expired_entries_pruned_on_insert() -> None:
+    cache, client = _make_cache(expire_in=timedelta(seconds=-1))
+    cache.get(LARGE_PROMPT)
+    cache.get(LARGE_PROMPT + "edited")
+    assert list(cache._entries) == [cache._key(LARGE_PROMPT + "edited")]
+
+
+def test_create_runs_outside_entry_lock() -> None:
+    cache, client = _make_cache()
+
+    def create(**kwargs):
+        # Another thread can still read entries while we wait on the network
+        assert not cache._lock.locked()
+        return MagicMock(name="cache", expire_time=None)
+
+    client.caches.create.side_effect = create
+    cache.get(LARGE_PROMPT)
+    client.caches.create.assert_called_once()
@@ -0,0 +1,22 @@
+"""Tests for router prompt templating."""
+
+from brain.agents.router import ROUTER_PROMPT_FILE, _router_template
+
+
+def test_template_matches_placeholder_replacement() -> None:
+    source = ROUTER_PROMPT_FILE.read_text(encoding="utf-8")
+    values = {"agent_descriptions": "AD", "current_time": "CT", "directives": "DR"}
+
+    expected = source
+    for name, value in values.items():
+        expected = expected.replace(f"{{{{{name}}}}}", value)
+
+    assert _router_template(source).substitute(values) == expected
+
+
+def test_dollar_signs_left_alone() -> None:
+    template = _router_template("Costs $5 ($x) — {{directives}}")
+    result = template.substitute(
+        agent_descriptions="", current_time="", directives="$HOME"
+    )
+    assert result == "Costs $5 ($x) — $HOME"
@@ -0,0 +1,240 @@
+"""Tests for Vault note and folder handling."""
+
+import os
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from brain.vault import CATEGORIES, Vault
+
+
+def _make_vault(tmp_path: Path) -> Vault:
+    """Create a minimal Vault in a temp directory."""
+    vault_root = tmp_path / "vault"
+    vault_root.mkdir()
+    return Vault(base_path=vault_root)
+
+
+class TestEnsureFolders:
+    def test_creates_all_categories(self, tmp_path: Path) -> None:
+        vault = _make_vault(tmp_path)
+        for folder in CATEGORIES:
+            assert (vault.base_path / folder).is_dir()
+
+    def test_recreates_only_missing(self, tmp_path: Path) -> None:
+        vault = _make_vault(tmp_path)
+        keep = vault.base_path / "Projects" / "keep.md"
+        keep.write_text("x", encoding="utf-8")
+        shutil.rmtree(vault.base_path / "Media")
+
+        vault._ensure_folders()
+
+        assert (vault.base_path / "Media").is_dir()
+        assert keep.read_text(encoding="utf-8") == "x"
+
+
+class TestSaveNote:
+    def test_suffixes_on_clash(self, tmp_path: Path) -> None:
+        vault = _make_vault(tmp_path)
+        first = vault.save_note("Inbox", "idea", "one")
+        second = vault.save_note("Inbox", "idea", "two")
+
+        assert first.name == "idea.md"
+        assert second.name == "idea-1.md"
+        assert first.read_text(encoding="utf-8") == "one"
+        assert second.read_text(encoding="utf-8") == "two"
+
+    def test_recreates_missing_folder(self, tmp_path: Path) -> None:
+        vault = _make_vault(tmp_path)
+        shutil.rmtree(vault.base_path / "Actions")
+        path = vault.save_note("Actions", "task", "do it")
+        assert path.read_text(encoding="utf-8") == "do it"
+
+    def test_slug_with_separator_raises(self, tmp_path: Path) -> None:
+        vault = _make_vault(tmp_path)
+        with pytest.raises(FileNotFoundError):
+            vault.save_note("Inbox", "a/b", "x")
+
+    def test_invalid_folder_falls_back_to_inbox(self, tmp_path: Path) -> None:
+        vault = _make_vault(tmp_path)
+        path = vault.save_note("Nowhere", "note", "x")
+        assert path.parent.name == "Inbox"
+
+
+class TestContentVersion:
+    def test_changes_on_write(self, tmp_path: Path) -> None:
+        vault = _make_vault(tmp_path)
+        before = vault.content_version(["Inbox"])
+        assert vault.content_version(["Inbox"]) == before
+        vault.save_note("Inbox", "idea", "text")
+        assert vault.content_version(["Inbox"]) != before
+
+
+class TestFrontmatterCache:
+    def test_unchanged_note_not_reparsed(self, tmp_path: Path) -> None:
+        vault = _make_vault(tmp_path)
+        note = vault.base_path / "Actions" / "a.md"
+        note.write_text("---\nstatus: todo\n---\n", encoding="utf-8")
+
+        with patch.object(
+            Vault, "_parse_frontmatter", wraps=Vault._parse_frontmatter
+        ) as parse:
+            assert vault._frontmatter(note) == {"status": "todo"}
+            assert vault._frontmatter(note) == {"status": "todo"}
+            assert parse.call_count == 1
+
+            note.write_text("---\nstatus: done\n---\n", encoding="utf-8")
+            assert vault._frontmatter(note) == {"status": "done"}
+            assert parse.call_count == 2
+
+    def test_returns_copy(self, tmp_path: Path) -> None:
+        vault = _make_vault(tmp_path)
+        note = vault.base_path / "Inbox" / "n.md"
+        note.write_text("---\ntitle: T\n---\n", encoding="utf-8")
+        fm = vault._frontmatter(note)
+        assert fm is not None
+        fm["title"] = "changed"
+        assert vault._frontmatter(note) == {"title": "T"}
+
+    def test_bounded_lru(self, tmp_path: Path) -> None:
+        vault = _make_vault(tmp_path)
+        notes = []
+        for name in ("a", "b", "c"):
+            note = vault.base_path / "Inbox" / f"{name}.md"
+            note.write_text(f"---\ntitle: {name}\n---\n", encoding="utf-8")
+            notes.append(note)
+
+        with patch("brain.vault.FRONTMATTER_CACHE_MAX", 2):
+            vault._frontmatter(notes[0])
+            vault._frontmatter(notes[1])
+            vault._frontmatter(notes[0])  # a is now most recently used
+            vault._frontmatter(notes[2])
+
+        assert list(vault._fm_cache) == [notes[0], notes[2]]
+
+
+class TestScanAll:
+    def test_single_pass_buckets(self, tmp_path: Path) -> None:
+        vault = _make_vault(tmp_path)
+        base = vault.base_path
+        (base / "Actions" / "a.md").write_text(
+            "---\ntitle: Do it\ndue_date: 2025-01-01\n---\n", encoding="utf-8"
+        )
+        (base / "Media" / "m.md").write_text(
+            "---\nstatus: to_consume\nmedia_title: Film\n---\n", encoding="utf-8"
+        )
+        old = base / "Reference" / "old.md"
+        old.write_text("---\ntitle: Old\n---\n", encoding="utf-8")
+        os.utime(old, (0, 0))
+
+        actions, recent, media = vault.scan_all(hours=24)
+
+        assert [a["title"] for a in actions] == ["Do it"]
+        assert actions[0]["due_date"] == "2025-01-01"
+        assert [m["title"] for m in media] == ["Film"]
+        assert {r["folder"] for r in recent} == {"Actions", "Media"}
+
+    def test_scan_actions_walks_only_actions(self, tmp_path: Path) -> None:
+        vault = _make_vault(tmp_path)
+        (vault.base_path / "Actions" / "a.md").write_text(
+            "---\ntitle: Do it\n---\n", encoding="utf-8"
+        )
+        listed: list[str] = []
+        real_scandir = os.scandir
+
+        def scandir(path):
+            listed.append(Path(path).name)
+            return real_scandir(path)
+
+        with patch("brain.vault.os.scandir", scandir):
+            actions = vault.scan_actions()
+
+        assert [a["title"] for a in actions] == ["Do it"]
+        assert listed == ["Actions"]
+
+
+class TestDirectives:
+    def test_add_and_remove(self, tmp_path: Path) -> None:
+        vault = _make_vault(tmp_path)
+        assert vault.get_directives() == []
+        vault.add_directive("Tag recipes with #cooking")
+        vault.add_directive("Prefer Reference over Inbox")
+        assert vault.get_directives() == [
+            "Tag recipes with #cooking",
+            "Prefer Reference over Inbox",
+        ]
+
+        removed, remaining = vault.remove_directive(1)
+        assert removed == "Tag recipes with #cooking"
+        assert vault.get_directives() == remaining == ["Prefer Reference over Inbox"]
+
+    def test_external_edit_picked_up(self, tmp_path: Path) -> None:
+        vault = _make_vault(tmp_path)
+        vault.add_directive("one")
+        assert vault.get_directives() == ["one"]
+
+        path = vault.base_path / "_brain" / "directives.md"
+        path.write_text("# Brain Directives\n- two\n", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert vault.get_directives() == ["two"]
+
+    def test_returned_list_is_a_copy(self, tmp_path: Path) -> None:
+        vault = _make_vault(tmp_path)
+        vault.add_directive("one")
+        vault.get_directives().append("mutated")
+        assert vault.get_directives() == ["one"]
+
+
+class TestGrepNotes:
+    def test_multi_term_single_result_per_file(self, tmp_path: Path) -> None:
+        vault = _make_vault(tmp_path)
+        (vault.base_path / "Reference" / "both.md").write_text(
+            "Python and Rust notes", encoding="utf-8"
+        )
+        (vault.base_path / "Media" / "one.md").write_text(
+            "a rust book", encoding="utf-8"
+        )
+
+        results = vault.grep_notes_multi(["python", "rust"])
+
+        by_name = {r["filename"]: r for r in results}
+        assert set(by_name) == {"both.md", "one.md"}
+        assert by_name["both.md"]["match_count"] == 2
+        assert by_name["both.md"]["matched_terms"] == ["python", "rust"]
+        assert by_name["one.md"]["matched_terms"] == ["rust"]
+
+    def test_term_inside_longer_term(self, tmp_path: Path) -> None:
+        vault = _make_vault(tmp_path)
+        (vault.base_path / "Inbox" / "n.md").write_text(
+            "all about Foobar", encoding="utf-8"
+        )
+
+        [hit] = vault.grep_notes_multi(["foo", "foobar"])
+
+        assert hit["matched_terms"] == ["foo", "foobar"]
+        assert hit["match_count"] == 1
+
+    def test_single_pattern_is_case_insensitive(self, tmp_path: Path) -> None:
+        vault = _make_vault(tmp_path)
+        (vault.base_path / "Inbox" / "n.md").write_text(
+            "Meeting notes\nmeeting again", encoding="utf-8"
+        )
+
+        [hit] = vault.grep_notes("MEETING")
+
+        assert hit["match_count"] == 2
+        assert hit["snippets"][0].startswith("Meeting")
+
+    def test_non_ascii_term(self, tmp_path: Path) -> None:
+        vault = _make_vault(tmp_path)
+        (vault.base_path / "Memories" / "trip.md").write_text(
+            "Café in Zürich", encoding="utf-8"
+        )
+
+        [hit] = vault.grep_notes_multi(["ZÜRICH", "café"])
+
+        assert hit["matched_terms"] == ["ZÜRICH", "café"]
+        assert hit["snippets"][0] == "Café in Zürich"
@@ -207,6 +207,20 @@ class TestFindNote:
 # ---------------------------------------------------------------------------
 
 
+class TestGetNoteMetadata:
+    def test_reads_frontmatter(self, tmp_path: Path) -> None:
+        vault = _make_vault(tmp_path)
+        path = _write_note(
+            vault, "Actions", "a.md", "---\ntitle: A\npriority: low\n---\nBody\n"
+        )
+        assert vault.get_note_metadata(path) == {"title": "A", "priority": "low"}
+
+    def test_no_frontmatter_is_empty(self, tmp_path: Path) -> None:
+        vault = _make_vault(tmp_path)
+        path = _write_note(vault, "Inbox", "plain.md", "Just text\n")
+        assert vault.get_note_metadata(path) == {}
+
+
 class TestVaultEditAgent:
     """Tests for the VaultEditAgent.handle method."""
 
@@ -332,6 +346,33 @@ class TestVaultEditAgent:
         a = vault.base_path / "Actions" / "Action B.md"
         assert "priority: 1 - Urgent" in a.read_text(encoding="utf-8")
 
+    def test_apply_edits_keeps_order_and_serialises_same_file(
+        self, tmp_path: Path
+    ) -> None:
+        vault = _make_vault(tmp_path)
+        for name in ("a.md", "b.md"):
+            _write_note(vault, "Actions", name, "---\ntitle: T\n---\nBody\n")
+
+        results = VaultEditAgent()._apply_edits(
+            vault,
+            [
+                {"filename": "a.md", "frontmatter_updates": {"priority": "high"}},
+                {"filename": "missing.md", "frontmatter_updates": {"x": "y"}},
+                {"filename": "b.md", "frontmatter_updates": {"status": "done"}},
+                {"filename": "a.md", "frontmatter_updates": {"status": "open"}},
+            ],
+        )
+
+        assert [(r["filename"], r["status"]) for r in results] == [
+            ("a.md", "ok"),
+            ("missing.md", "not_found"),
+            ("b.md", "ok"),
+            ("a.md", "ok"),
+        ]
+        text = (vault.base_path / "Actions" / "a.md").read_text(encoding="utf-8")
+        assert "priority: high" in text
+        assert "status: open" in text
+
     def test_format_results_ok(self) -> None:
         results = [
             {
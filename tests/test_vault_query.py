@@ -0,0 +1,97 @@
+"""Tests for VaultQueryAgent result formatting and caching."""
+
+import os
+from unittest.mock import MagicMock, patch
+
+# Set a fake API key so ``genai.Client()`` doesn't raise during tests.
+os.environ.setdefault("GEMINI_API_KEY", "test-key")
+
+from brain.agents.base import AgentResult, MessageContext  # noqa: E402
+from brain.agents.vault_query import VaultQueryAgent  # noqa: E402
+
+
+def test_format_matches() -> None:
+    text = VaultQueryAgent._format_matches(
+        [
+            {
+                "filename": "a.md",
+                "folder": "Projects",
+                "size_bytes": 120,
+                "modified": "2026-01-02",
+                "frontmatter": {"status": "active", "tags": ["x"]},
+            },
+            {"filename": "b.md", "folder": "Inbox", "frontmatter": {}},
+        ]
+    )
+    assert text == (
+        "- **a.md** (in Projects/)\n"
+        "  120 bytes | modified 2026-01-02\n"
+        "  status: active | tags: ['x']\n"
+        "- **b.md** (in Inbox/)"
+    )
+
+
+def test_format_grep_results() -> None:
+    text = VaultQueryAgent._format_grep_results(
+        [
+            {
+                "filename": "a.md",
+                "folder": "Reference",
+                "match_count": 2,
+                "snippets": ["...foo...", "...bar..."],
+                "matched_terms": ["foo", "bar"],
+            }
+        ]
+    )
+    assert text == (
+        "- **a.md** (in Reference/) — 2 match(es) for foo, bar\n"
+        "  > ...foo...\n"
+        "  > ...bar..."
+    )
+
+
+@patch.object(VaultQueryAgent, "_ask_gemini", return_value=AgentResult("ok"))
+def test_repeat_search_reuses_results(mock_ask: MagicMock) -> None:
+    vault = MagicMock()
+    vault.get_directives.return_value = []
+    vault.content_version.return_value = (0,)
+    vault.search_notes.return_value = [{"filename": "a.md", "folder": "Inbox"}]
+    agent = VaultQueryAgent()
+
+    def ask() -> None:
+        agent.handle(
+            MessageContext(
+                raw_text="what about a?",
+                attachment_context=[],
+                vault=vault,
+                router_data={"search_terms": ["a"]},
+            )
+        )
+
+    ask()
+    ask()
+    assert vault.search_notes.call_count == 1
+
+    # A vault change invalidates the cached results
+    vault.content_version.return_value = (1,)
+    ask()
+    assert vault.search_notes.call_count == 2
+
+
+@patch.object(VaultQueryAgent, "_ask_gemini", return_value=AgentResult("ok"))
+def test_null_search_terms_tolerated(mock_ask: MagicMock) -> None:
+    vault = MagicMock()
+    vault.get_directives.return_value = []
+    vault.content_version.return_value = (0,)
+    vault.search_notes.return_value = [{"filename": "a.md", "folder": "Inbox"}]
+
+    result = VaultQueryAgent().handle(
+        MessageContext(
+            raw_text="what is there?",
+            attachment_context=[],
+            vault=vault,
+            router_data={"search_terms": None},
+        )
+    )
+
+    assert result.response_text == "ok"